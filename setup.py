@@ -13,6 +13,9 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/jonovate/sizesorter",
     packages=setuptools.find_packages(),
+    entry_points={
+        "console_scripts": ["sizesorter=sizesorter.cli:main"],
+    },
     classifiers=(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
@@ -24,5 +27,10 @@ setuptools.setup(
     ),
     setup_requires=["pbr"],
     tests_require=["pytest"],
+    extras_require={
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"],
+        "toml": ["tomli; python_version < '3.11'"],
+    },
     pbr=True,
 )
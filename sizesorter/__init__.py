@@ -1,9 +1,51 @@
-from .sizesorter import SizeSorter
-from .sizechart import (
-     Size,
-     DynOp,
-     SizeChart,
-     SIZE_CHART_DEFAULTS,
-     DYNAMIC_OPERATIONS_DEFAULTS,
-     SIZE_CHART_FORMAT_DEFAULTS
-    )
+"""
+Sorts iterables by apparel size and generates size lists
+
+Public names are imported lazily (on first access) to keep the import of the package minimal.
+"""
+
+import sys
+
+"""Map of public names to the module defining them"""
+_LAZY_NAMES = {
+    'SizeSorter': '.sizesorter',
+    'SortedSizeCollection': '.sizecollection',
+    'SizeHistogram': '.sizehistogram',
+    'SizeColumn': '.sizecolumn',
+    'SizeIndex': '.sizeindex',
+    'ReloadingSizeChart': '.chartloader',
+    'load_chart_file': '.chartloader',
+    'build_size_index': '.sizeindex',
+    'ChartSelector': '.chartselector',
+    'CompoundSizeChart': '.compoundsizechart',
+    'Size': '.sizechart',
+    'DynOp': '.sizechart',
+    'SizeChart': '.sizechart',
+    'to_x_notation': '.sizechart',
+    'from_x_notation': '.sizechart',
+    'SIZE_CHART_DEFAULTS': '.sizechart',
+    'DYNAMIC_OPERATIONS_DEFAULTS': '.sizechart',
+    'SIZE_CHART_FORMAT_DEFAULTS': '.sizechart',
+}
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    """Imports the public name on first access (PEP 562)"""
+    if name not in _LAZY_NAMES:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    from importlib import import_module
+    value = getattr(import_module(_LAZY_NAMES[name], __name__), name)
+    globals()[name] = value         #Later accesses do not go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):       #No module __getattr__, so import eagerly
+    for _name in _LAZY_NAMES:
+        globals()[_name] = __getattr__(_name)
@@ -0,0 +1,9 @@
+"""
+Allows running the command line interface as `python -m sizesorter`
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Export of sizes as ordered categoricals (pandas) and dictionaries (Arrow), in Size Chart order
+
+pandas and pyarrow are optional dependencies, only imported when used
+(`pip install sizesorter[pandas]` / `pip install sizesorter[arrow]`).
+"""
+
+import math
+
+def _is_missing(value):
+    """Whether the value is missing (None or NaN)"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _ordered_categories(size_chart, unique_values):
+    """
+    Resolves each unique value once, and orders their size keys by the Size Chart
+
+    :param SizeChart size_chart: The Size Chart to resolve the values against
+    :param iterable unique_values: The unique values (None for missing)
+    :return: Tuple of the size keys in Size Chart order, and the index of each unique value
+        into them (-1 for missing or skipped values)
+    :rtype tuple(list, list)
+
+    :raises ValueError: If a value is an invalid size (and the unknown key policy is to raise)
+    """
+    sizes = [None if _is_missing(value) else size_chart.resolve_size(value)
+             for value in unique_values]
+
+    ordered_sizes = {}
+    for size in sizes:
+        if size is not None:
+            ordered_sizes.setdefault(size.key, size)
+    categories = [size.key for size in sorted(ordered_sizes.values())]
+
+    category_codes = {key: code for code, key in enumerate(categories)}
+    return categories, [-1 if size is None else category_codes[size.key] for size in sizes]
+
+
+def to_pandas_categorical(size_chart, values):
+    """
+    Builds an ordered pandas Categorical whose categories follow the Size Chart order.
+    Values are factorized in pandas, so each unique value is only resolved once
+    (the other occurrences are profiled in bulk, see `SizeChart.count_keys()`).
+
+    :param SizeChart size_chart: The Size Chart to order the sizes by
+    :param iterable values: The size keys (ie: a Series or list). None/NaN are missing
+    :return: The ordered Categorical
+    :rtype pandas.Categorical
+
+    :raises ImportError: If pandas is not installed
+    :raises ValueError: If a value is an invalid size (and the unknown key policy is to raise)
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        raise ImportError('pandas is required for to_pandas_categorical '
+                          '(pip install sizesorter[pandas])')
+
+    if not isinstance(values, (pd.Series, pd.Index, np.ndarray)):
+        values = pd.Series(list(values), dtype=object)
+    codes, uniques = pd.factorize(values)       #Missing values (ie: None, NaN, NA) coded -1
+    categories, unique_codes = _ordered_categories(size_chart, uniques)
+    size_chart.count_keys((uniques[code] for code in codes if code >= 0), uniques)
+
+    remap = np.array(unique_codes + [-1], dtype=np.int64)      #Code -1 (missing) maps to last
+    return pd.Categorical.from_codes(remap[codes], categories=categories, ordered=True)
+
+
+def to_arrow_dictionary(size_chart, values):
+    """
+    Builds an ordered Arrow DictionaryArray whose dictionary follows the Size Chart order.
+    Values are dictionary encoded in Arrow, so each unique value is only resolved once
+    (the other occurrences are profiled in bulk, see `SizeChart.count_keys()`).
+
+    :param SizeChart size_chart: The Size Chart to order the sizes by
+    :param iterable values: The size keys (ie: an Arrow array or list). Nulls are missing
+    :return: The ordered DictionaryArray
+    :rtype pyarrow.DictionaryArray
+
+    :raises ImportError: If pyarrow is not installed
+    :raises ValueError: If a value is an invalid size (and the unknown key policy is to raise)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        raise ImportError('pyarrow is required for to_arrow_dictionary '
+                          '(pip install sizesorter[arrow])')
+
+    array = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(list(values))
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    encoded = array.dictionary_encode()
+    uniques = encoded.dictionary.to_pylist()
+    categories, unique_codes = _ordered_categories(size_chart, uniques)
+    size_chart.count_keys((uniques[idx.as_py()] for idx in encoded.indices if idx.is_valid),
+                          uniques)
+
+    remap = pa.array([None if code < 0 else code for code in unique_codes], type=pa.int32())
+    indices = pc.take(remap, encoded.indices)       #Null indices stay null
+    return pa.DictionaryArray.from_arrays(indices, pa.array(categories, type=pa.string()),
+                                          ordered=True)
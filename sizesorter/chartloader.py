@@ -0,0 +1,170 @@
+"""
+Loading of Size Chart definitions from JSON/TOML files, and hot-reloading them on change
+"""
+
+import json
+import os
+import threading
+
+from .sizechart import SizeChart
+
+"""Default seconds between checks of the chart file for changes"""
+POLL_INTERVAL_DEFAULT = 1.0
+
+
+def _toml_loads(text):
+    """Parses TOML via tomllib (Python 3.11+), else the tomli or toml packages"""
+    try:
+        import tomllib as toml_parser
+    except ImportError:
+        try:
+            import tomli as toml_parser
+        except ImportError:
+            try:
+                import toml as toml_parser
+            except ImportError:
+                raise ImportError('TOML chart files require Python 3.11+ or the tomli package '
+                                  '(pip install sizesorter[toml])')
+    return toml_parser.loads(text)      #Decode errors are ValueErrors
+
+
+def load_chart_file(path):
+    """
+    Loads a SizeChart from a JSON or TOML (by '.toml' extension) definition file
+    (see `SizeChart.from_definition()`)
+
+    :param str path: Path to the JSON or TOML file
+    :return: The Size Chart
+    :rtype SizeChart
+
+    :raises ValueError: If the file is not a valid Size Chart definition
+    """
+    with open(path, encoding='utf-8') as chart_file:
+        text = chart_file.read()
+
+    is_toml = str(path).lower().endswith('.toml')
+    definition = _toml_loads(text) if is_toml else json.loads(text)
+    if not isinstance(definition, dict):
+        raise ValueError('Invalid Size Chart definition: not a map')
+    return SizeChart.from_definition(definition)
+
+
+class ReloadingSizeChart():
+    """
+    Holds the Size Chart of a definition file, and rebuilds it when the file changes.
+    The new chart is built aside and swapped in with a single attribute assignment, so readers
+    need no locking. An invalid definition leaves the previous chart in place.
+
+    note:: Take the `snapshot` once per unit of work (ie: `SizeSorter(charts.snapshot)`),
+        so an in-flight sort keeps using the same chart while a new one is swapped in.
+    """
+
+    def __init__(self, path, configure=None):
+        """
+        Loads the Size Chart of the definition file
+
+        :param str path: Path to the JSON or TOML file
+        :param function configure: Called with each newly built Size Chart before it is
+            swapped in (ie: to enable the Dynamic Size Cache)
+            Default - None
+
+        :raises ValueError: If the file is not a valid Size Chart definition
+        """
+        self.path = path
+        self.configure = configure
+        self.last_error = None          #Error of the last failed reload
+
+        self._file_signature = self._signature()
+        self._snapshot = self._load()
+
+        self._stop_event = None
+        self._thread = None
+
+    @property
+    def snapshot(self):
+        """The current Size Chart"""
+        return self._snapshot
+
+    def _signature(self):
+        """Modification time and size of the file, None if it cannot be read"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        size_chart = load_chart_file(self.path)
+        if self.configure:
+            self.configure(size_chart)
+        return size_chart
+
+    def reload(self):
+        """
+        Rebuilds the Size Chart from the file and swaps it in
+
+        :return: Whether the Size Chart was swapped (False keeps the previous Size Chart,
+            see `last_error`)
+        :rtype boolean
+        """
+        try:
+            size_chart = self._load()
+        except (OSError, ValueError, ImportError) as e:
+            self.last_error = e
+            return False
+
+        self._snapshot, self.last_error = size_chart, None
+        return True
+
+    def check(self):
+        """
+        Reloads the Size Chart if the file changed since it was last checked
+
+        :return: Whether a new Size Chart was swapped in
+        :rtype boolean
+        """
+        signature = self._signature()
+        if signature is None or signature == self._file_signature:
+            return False
+
+        self._file_signature = signature
+        return self.reload()
+
+    def start(self, poll_interval=POLL_INTERVAL_DEFAULT):
+        """
+        Starts checking the file for changes in a background (daemon) thread.
+        Errors of a check are kept in `last_error`, and checking goes on.
+
+        :param float poll_interval: Seconds between checks
+            Default - POLL_INTERVAL_DEFAULT
+        """
+        if self._thread is not None:
+            return
+
+        stop_event = self._stop_event = threading.Event()
+
+        def _poll():
+            while not stop_event.wait(poll_interval):
+                try:
+                    self.check()
+                except Exception as e:      #ie: from the configure hook, must not end polling
+                    self.last_error = e
+
+        self._thread = threading.Thread(target=_poll, name='sizesorter-chart-reload',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops checking the file for changes"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = self._stop_event = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
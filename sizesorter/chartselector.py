@@ -0,0 +1,163 @@
+"""
+Selection of the Size Chart best matching a batch of sizes (ie: mixed category input)
+"""
+
+import re
+from numbers import Number
+
+from .sizesorter import SizeSorter
+
+class ChartSelector():
+    """
+    Indexes the base keys and dynamic suffixes of several Size Charts into a single lookup,
+    so the chart matching the most sizes of a batch is found in one pass over the batch.
+    """
+
+    def __init__(self, size_charts):
+        """
+        Initializes the selector for the given Size Charts
+
+        :param dict size_charts: Map of chart names to SizeChart, in order of preference
+            (ties are won by the earlier chart)
+
+        :raises ValueError: If no Size Charts are given
+        """
+        if not size_charts:
+            raise ValueError('ChartSelector needs at least one Size Chart')
+
+        self.size_charts = dict(size_charts)
+        self._names = list(self.size_charts)
+        self._all_charts = (1 << len(self._names)) - 1
+
+        #Charts as bits of a mask
+        self._base_index = {}       #base key => mask of charts
+        self._suffix_index = {}     #dynamic suffix => list of tuple of chart bit and max_prefix
+        for idx, size_chart in enumerate(self.size_charts.values()):
+            for key in size_chart.size_chart:
+                self._base_index[key] = self._base_index.get(key, 0) | 1 << idx
+            for suffix, dyn_op in size_chart.dyn_ops.items():
+                self._suffix_index.setdefault(suffix, []).append((1 << idx, dyn_op.max_prefix))
+
+        #Same tokenizing as the Size Charts, over the dynamic suffixes of all charts
+        suffixes = '|'.join(re.escape(suffix) for suffix in
+                            sorted(self._suffix_index, key=len, reverse=True)) or '(?!)'
+        self._size_key_re = re.compile(r'(?:([1-9][0-9]*)?({}))\Z|(\d+)\Z'.format(suffixes))
+
+        self._key_masks = {}        #size key => tuple of mask of charts, mask of specific charts
+
+    def _charts_of(self, size_key):
+        """
+        Finds the Size Charts the size key is valid in
+
+        :param str size_key: The size key
+        :return: Tuple of the mask of the charts and the mask of the charts matching specifically
+            (a plain number is valid in every chart, so is only specific where a base key)
+        :rtype tuple(int, int)
+        """
+        try:
+            return self._key_masks[size_key]
+        except KeyError:
+            pass
+
+        key = str(size_key) if isinstance(size_key, Number) else size_key
+        mask = specific = self._base_index.get(key, 0)
+        if isinstance(key, str) and key[:1] == '1' and not key[1:2].isdigit():
+            mask = specific = mask | self._base_index.get(key[1:], 0)     #1M is M
+
+        match = self._size_key_re.match(key) if isinstance(key, str) else None
+        if match is not None:
+            prefix, suffix, numeric = match.groups()
+            if numeric:
+                mask = self._all_charts
+            else:
+                prefix_count = int(prefix) if prefix else 1
+                for bit, max_prefix in self._suffix_index[suffix]:
+                    if max_prefix is None or prefix_count <= max_prefix:
+                        mask |= bit
+                specific = mask
+
+        self._key_masks[size_key] = (mask, specific)
+        return mask, specific
+
+    def scores(self, iterable):
+        """
+        Scores each Size Chart against the sizes in a single pass over the sizes
+
+        :param iterable iterable: The size keys
+        :return: Map of chart names to the number of sizes valid in the chart
+        :rtype dict
+        """
+        return {name: matched for name, (matched, _) in self._score(iterable).items()}
+
+    def _score(self, iterable):
+        """Scores as map of chart names to tuple of matched and specifically matched sizes"""
+        mask_counts = {}        #tuple of mask, specific mask => number of sizes
+        for size_key in iterable:
+            key_mask = self._charts_of(size_key)
+            mask_counts[key_mask] = mask_counts.get(key_mask, 0) + 1
+
+        scores = {}
+        for idx, name in enumerate(self._names):
+            bit, matched, specific = 1 << idx, 0, 0
+            for (mask, specific_mask), count in mask_counts.items():
+                if mask & bit:
+                    matched += count
+                if specific_mask & bit:
+                    specific += count
+            scores[name] = (matched, specific)
+        return scores
+
+    def select(self, iterable):
+        """
+        Selects the Size Chart valid for the most sizes.
+        Ties are won by the chart with the most non-numeric (or base key) matches,
+        then by the earlier chart.
+
+        :param iterable iterable: The size keys
+        :return: The name of the Size Chart
+        :rtype str
+
+        :raises ValueError: If no Size Chart is valid for any of the sizes
+        """
+        scores = self._score(iterable)
+        name = max(self._names, key=lambda name: scores[name])   #max() keeps the first best
+        if not scores[name][0]:
+            raise ValueError('No Size Chart matches the sizes')
+        return name
+
+    def sort(self, iterable, reverse=False):
+        """
+        Sorts the sizes with the Size Chart selected for them (see `select()`, `SizeSorter.sort()`)
+
+        :param iterable iterable: The size keys
+        :param boolean reverse: Whether to sort descending
+            Default - False
+        :return: Tuple of the name of the Size Chart and the sorted size keys
+        :rtype tuple(str, list)
+
+        :raises ValueError: If no Size Chart matches, or a size is invalid in the selected chart
+            (and its unknown key policy is to raise)
+        """
+        sizes = list(iterable)
+        name = self.select(sizes)
+        return name, SizeSorter(self.size_charts[name]).sort(sizes, reverse=reverse)
+
+    def sort_records(self, records, size_field='size', **kwargs):
+        """
+        Sorts records with the Size Chart selected for their sizes (see `SizeSorter.sort_records()`)
+
+        :param iterable records: The records to sort. Fields are accessed by `record[field]`
+        :param str size_field: The field holding the size key
+            Default - 'size'
+        :param kwargs: Other arguments of `SizeSorter.sort_records()`
+        :return: Tuple of the name of the Size Chart and the sorted records
+        :rtype tuple(str, list)
+
+        :raises ValueError: If no Size Chart matches, or a size is invalid in the selected chart
+            (and its unknown key policy is to raise)
+        """
+        records = list(records)
+        name = self.select(record[size_field] for record in records)
+        return name, SizeSorter(self.size_charts[name]).sort_records(records,
+                                                                     size_field=size_field,
+                                                                     **kwargs)
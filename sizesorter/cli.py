@@ -0,0 +1,218 @@
+"""
+Command line interface to sort CSV/JSONL files by a size column
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import pickle
+import sys
+import tempfile
+from itertools import islice
+
+from .chartloader import load_chart_file
+from .fileformat import FORMATS, detect_format
+from .sizechart import SizeChart, UNKNOWN_KEY_POLICIES
+
+"""Buffer size for file input and output"""
+BUFFER_SIZE = 1 << 20
+
+"""Default number of records per sorted chunk"""
+CHUNK_SIZE_DEFAULT = 100000
+
+"""Number of records per pickle batch when spilling a chunk to disk"""
+SPILL_BATCH_SIZE = 1024
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        prog='sizesorter',
+        description='Sorts the records of a CSV or JSONL file by apparel size.')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='Input file (default: stdin)')
+    parser.add_argument('-c', '--column', required=True,
+                        help='Name of the size column/field')
+    parser.add_argument('-o', '--output', default='-',
+                        help='Output file (default: stdout)')
+    parser.add_argument('-f', '--format', choices=FORMATS,
+                        help='Input/Output format (default: from input extension, else csv)')
+    parser.add_argument('--chart',
+                        help='JSON or TOML Size Chart definition file '
+                             '(default: built-in Size Chart)')
+    parser.add_argument('--unknown', choices=UNKNOWN_KEY_POLICIES, default='raise',
+                        help='How to handle unknown sizes (default: %(default)s)')
+    parser.add_argument('-r', '--reverse', action='store_true',
+                        help='Sort largest size first')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE_DEFAULT,
+                        help='Records per sorted chunk (default: %(default)s)')
+    parser.add_argument('--spill', action='store_true',
+                        help='Spill sorted chunks to temporary files instead of memory')
+    parser.add_argument('--temp-dir',
+                        help='Directory for spilled chunks (default: system temp directory)')
+    return parser
+
+
+def _open_text(path, mode):
+    """Opens the path (or stdin/stdout for '-') as buffered text"""
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        return open(stream.fileno(), mode, buffering=BUFFER_SIZE, encoding='utf-8',
+                    newline='', closefd=False)
+    return open(path, mode, buffering=BUFFER_SIZE, encoding='utf-8', newline='')
+
+
+def _read_csv(in_file, column):
+    """
+    Reads CSV records
+
+    :return: The header and an iterator of tuple of size key and row
+    :rtype tpl(list, iterator)
+    """
+    reader = csv.reader(in_file)
+    header = next(reader, None)
+    if header is None:
+        return header, iter(())
+    if column not in header:
+        raise ValueError('Size column not in CSV header: ' + column)
+
+    column_idx = header.index(column)
+
+    def _records():
+        for row in reader:
+            if not row:
+                continue
+            if len(row) <= column_idx:
+                raise ValueError('Size column missing on line {}'.format(reader.line_num))
+            yield (row[column_idx], row)
+
+    return header, _records()
+
+
+def _read_jsonl(in_file, column):
+    """
+    Reads JSONL records. The raw line is kept so output does not re-serialize
+
+    :return: The header (None) and an iterator of tuple of size key and line
+    :rtype tpl(None, iterator)
+    """
+    def _records():
+        for line in in_file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if column not in record:
+                raise ValueError('Size field not in record: ' + line.strip())
+            yield (record[column], line if line.endswith('\n') else line + '\n')
+
+    return None, _records()
+
+
+def _spill(chunk, temp_dir):
+    """Writes the sorted chunk to a temporary file, returning an iterator reading it back"""
+    spill_file = tempfile.TemporaryFile(dir=temp_dir)
+    pickler = pickle.Pickler(spill_file, pickle.HIGHEST_PROTOCOL)
+    for idx in range(0, len(chunk), SPILL_BATCH_SIZE):
+        pickler.dump(chunk[idx:idx + SPILL_BATCH_SIZE])
+    spill_file.seek(0)
+
+    def _unspill():
+        with spill_file:
+            unpickler = pickle.Unpickler(spill_file)
+            while True:
+                try:
+                    batch = unpickler.load()
+                except EOFError:
+                    return
+                for item in batch:
+                    yield item
+
+    return _unspill()
+
+
+def chunked_sort(records, size_chart, reverse=False, chunk_size=CHUNK_SIZE_DEFAULT,
+                 spill=False, temp_dir=None):
+    """
+    Sorts records by size in chunks, merging the sorted chunks. Stable.
+    Unknown sizes are resolved per the unknown key policy of the Size Chart.
+
+    :param iterable records: Tuples of size key and record
+    :param SizeChart size_chart: The Size Chart to resolve the sizes against
+    :param boolean reverse: Whether to sort largest first
+    :param int chunk_size: The number of records per sorted chunk (read and profiled at once,
+        see `SizeChart.count_keys()`)
+    :param boolean spill: Whether to hold sorted chunks in temporary files instead of memory
+    :param str temp_dir: Directory for the temporary files
+    :return: Iterator of the records in size order
+    :rtype iterator
+
+    :raises ValueError: If an invalid size is in the records (and the policy is to raise)
+    :raises TypeError: If a size is not hashable (ie: a JSON list or object)
+    """
+    sort_values = {}        #size key => sort value (None if skipped)
+    direction, records, seq = -1 if reverse else 1, iter(records), 0
+
+    chunks, batch = [], list(islice(records, chunk_size))
+    while batch:
+        chunk, resolved = [], []
+        for size_key, record in batch:
+            try:
+                sort_value = sort_values[size_key]
+            except KeyError:
+                size = size_chart.resolve_size(size_key)
+                sort_value = sort_values[size_key] = (None if size is None
+                                                      else direction * size.sort_value)
+                resolved.append(size_key)
+            if sort_value is not None:
+                chunk.append((sort_value, seq, record))
+                seq += 1
+        size_chart.count_keys((size_key for size_key, _ in batch), resolved)   #Memo hits
+
+        if chunk:
+            chunk.sort()
+            chunks.append(_spill(chunk, temp_dir) if spill else chunk)
+        batch = list(islice(records, chunk_size))
+
+    return (record for _, _, record in heapq.merge(*chunks))
+
+
+def main(argv=None):
+    """
+    Entry point of the `sizesorter` command
+
+    :param list argv: The command line arguments
+        Default - sys.argv[1:]
+    :return: The exit code
+    :rtype int
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be a positive number')
+
+    file_format = args.format if args.format else detect_format(args.input)
+
+    try:
+        size_chart = load_chart_file(args.chart) if args.chart else SizeChart()
+        size_chart.set_unknown_key_policy(args.unknown)
+
+        with _open_text(args.input, 'r') as in_file:
+            reader = _read_jsonl if file_format == 'jsonl' else _read_csv
+            header, records = reader(in_file, args.column)
+
+            sorted_records = chunked_sort(records, size_chart, args.reverse,
+                                          args.chunk_size, args.spill, args.temp_dir)
+
+            with _open_text(args.output, 'w') as out_file:
+                if file_format == 'jsonl':
+                    out_file.writelines(sorted_records)
+                else:
+                    writer = csv.writer(out_file)
+                    if header is not None:
+                        writer.writerow(header)
+                    writer.writerows(sorted_records)
+    except (OSError, ValueError, TypeError, csv.Error) as e:
+        print('sizesorter: error: ' + str(e), file=sys.stderr)
+        return 1
+
+    return 0
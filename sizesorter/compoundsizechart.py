@@ -0,0 +1,160 @@
+"""
+Compound sizes of several dimensions (ie: waist x inseam '32x34', 'M/L', 'XL-Tall')
+"""
+
+import re
+
+from .size import Size
+
+"""Default characters separating the dimensions of a compound size"""
+COMPOUND_SEPARATORS_DEFAULT = 'x/-'
+
+"""Default bit width of each dimension in the packed sort value"""
+DIMENSION_BITS_DEFAULT = 16
+
+class CompoundSizeChart():
+    """
+    Resolves compound sizes against a Size Chart per dimension (or numbers), and packs the rank
+    of each dimension into a single integer sort value, first dimension most significant.
+    Sorting compound sizes then costs the same as sorting simple sizes.
+
+    A missing trailing dimension packs as 0, so sorts before any size of that dimension
+    (ie: '32' before '32x30').
+    """
+
+    def __init__(self, dimensions, separators=COMPOUND_SEPARATORS_DEFAULT,
+                 bits=DIMENSION_BITS_DEFAULT):
+        """
+        Initializes a compound size chart
+
+        :param list dimensions: The SizeChart of each dimension, None for a numeric dimension
+            (non-negative whole numbers, ie: waist or inseam)
+        :param str separators: The characters separating the dimensions
+            Default - COMPOUND_SEPARATORS_DEFAULT
+        :param int bits: The bit width of each dimension in the packed sort value
+            Default - DIMENSION_BITS_DEFAULT
+
+        :raises ValueError: If there are no dimensions, no separators or bits is not positive
+        """
+        if not dimensions:
+            raise ValueError('Compound Size Chart needs at least one dimension')
+        if not separators:
+            raise ValueError('Compound Size Chart needs at least one separator')
+        if bits < 2:
+            raise ValueError('Dimension bits must be at least 2')
+
+        self.dimensions = list(dimensions)
+        self.separators = separators
+        self.bits = bits
+
+        self._split_re = re.compile('[{}]'.format(re.escape(separators)))
+        self._limit = 1 << bits
+        self._bias = 1 << (bits - 1)        #Centers the ranks, which are negative below the chart
+        self._sizes = {}                    #compound size key => Size
+
+    def split(self, size_key):
+        """
+        Splits the compound size key into the keys of its dimensions
+
+        :param str size_key: The compound size key
+        :return: The size key of each dimension present
+        :rtype list
+
+        :raises ValueError: If the key has more dimensions than the chart
+        """
+        parts = self._split_re.split(str(size_key))
+        if len(parts) > len(self.dimensions):
+            raise ValueError('Compound size has too many dimensions: ' + str(size_key))
+        return parts
+
+    def _pack_dimension(self, size_chart, part):
+        """Converts the size key of a dimension to its packed (non-zero) value"""
+        if size_chart is None:
+            if not part.isdigit():
+                raise ValueError('Numeric dimension must be a whole number: ' + part)
+            value = int(part) + 1
+        else:
+            value = size_chart.rank_of(part) + self._bias
+
+        if not 0 < value < self._limit:
+            raise ValueError('Size does not fit in {} bits: {}'.format(self.bits, part))
+        return value
+
+    def sort_value(self, size_key):
+        """
+        Packs the rank of each dimension of the compound size into a single integer
+
+        :param str size_key: The compound size key
+        :return: The packed sort value
+        :rtype int
+
+        :raises ValueError: If a dimension is invalid, has no rank or does not fit in the bits
+        """
+        return self.get_or_create_size(size_key).sort_value
+
+    def get_or_create_size(self, size_key):
+        """
+        Retrieves the Size of the compound size, with the packed sort value.
+        Sizes are cached, so each distinct compound size is only resolved once.
+
+        :param str size_key: The compound size key
+        :return: The Size object
+        :rtype Size
+
+        :raises ValueError: If a dimension is invalid, has no rank or does not fit in the bits
+        """
+        size = self._sizes.get(size_key)
+        if size is None:
+            sort_value = 0
+            parts = self.split(size_key)
+            for idx, size_chart in enumerate(self.dimensions):
+                sort_value <<= self.bits
+                if idx < len(parts):
+                    sort_value |= self._pack_dimension(size_chart, parts[idx])
+
+            size = self._sizes[size_key] = Size(str(size_key), sort_value)
+        return size
+
+    def resolve_size(self, size_key):
+        """
+        Same as `get_or_create_size()`, so a SizeSorter can sort by a Compound Size Chart
+        """
+        return self.get_or_create_size(size_key)
+
+    def count_keys(self, size_keys, resolved=()):
+        """Does nothing, as compound sizes are not profiled (see `SizeChart.count_keys()`)"""
+
+    def unpack(self, sort_value):
+        """
+        Converts the packed sort value back to the size key of each dimension
+
+        :param int sort_value: The packed sort value
+        :return: The size key of each dimension, None for missing dimensions
+        :rtype tuple
+
+        :raises ValueError: If a dimension is out of range of its Size Chart
+        """
+        keys, mask = [], self._limit - 1
+        for idx, size_chart in enumerate(reversed(self.dimensions)):
+            value = (sort_value >> (idx * self.bits)) & mask
+            if not value:
+                keys.append(None)
+            elif size_chart is None:
+                keys.append(str(value - 1))
+            else:
+                keys.append(size_chart.key_at_rank(value - self._bias))
+        return tuple(reversed(keys))
+
+    def sort(self, iterable, reverse=False):
+        """
+        Sorts the compound sizes
+
+        :param iterable iterable: The compound size keys
+        :param boolean reverse: Whether to sort descending
+            Default - False
+        :return: The sorted compound size keys
+        :rtype list
+
+        :raises ValueError: If a compound size is invalid
+        """
+        return sorted(iterable, key=self.sort_value, reverse=reverse)
@@ -0,0 +1,20 @@
+"""
+File formats of the records read by the command line interface and the size index
+"""
+
+"""Record file formats"""
+FORMATS = ('csv', 'jsonl')
+
+"""File extensions of JSONL files (any other extension is read as CSV)"""
+JSONL_EXTENSIONS = ('.jsonl', '.ndjson')
+
+
+def detect_format(path):
+    """
+    Detects the file format from the file extension
+
+    :param str path: Path to the file
+    :return: 'jsonl' for JSONL extensions, else 'csv'
+    :rtype str
+    """
+    return 'jsonl' if path.lower().endswith(JSONL_EXTENSIONS) else 'csv'
@@ -0,0 +1,58 @@
+"""
+Memory footprint reporting of size charts
+"""
+
+import sys
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+"""Objects shared process-wide which are not attributed to a chart"""
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def deep_getsizeof(obj, seen=None):
+    """
+    Calculates the size of the object and everything it references (via `sys.getsizeof()`).
+    Each object is only counted once per `seen` set. Classes, modules and functions are shared
+    process-wide, so are not counted.
+
+    :param object obj: The object to size
+    :param set seen: Ids of objects already counted (updated)
+        Default - None (New set)
+    :return: The size in bytes
+    :rtype int
+    """
+    seen = set() if seen is None else seen
+    size, pending = 0, [obj]
+
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        if hasattr(obj, '__dict__'):
+            pending.append(vars(obj))
+        if hasattr(obj, '__slots__'):
+            pending.extend(getattr(obj, slot) for slot in obj.__slots__ if hasattr(obj, slot))
+
+    return size
+
+
+def charts_memory_report(size_charts):
+    """
+    Reports the memory used by several Size Charts (see `SizeChart.memory_report()`).
+    Objects shared between the charts (ie: interned keys) are only counted once.
+
+    :param dict size_charts: Map of chart names to SizeChart
+    :return: Map of chart names to their report, and the bytes of all charts
+    :rtype tpl(dict, int)
+    """
+    seen = set()
+    report = {name: size_chart.memory_report(seen) for name, size_chart in size_charts.items()}
+    return report, sum(chart_report['total'] for chart_report in report.values())
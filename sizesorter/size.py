@@ -3,6 +3,7 @@ Structure representing a Size
 """
 
 from functools import total_ordering
+from sys import intern
 
 @total_ordering
 class Size():
@@ -23,9 +24,11 @@ class Size():
         :param boolean is_dynamic_size: Whether the size is a dynamic size (ie: X-Size)
             Default - False
         """
-        self._key = key
+        #Interned, as the same few keys are repeated across charts, caches and inputs
+        self._key = intern(key) if isinstance(key, str) else key
         self._sort_value = sort_value
-        self._verbose = verbose if verbose else key
+        verbose = verbose if verbose else self._key
+        self._verbose = intern(verbose) if isinstance(verbose, str) else verbose
         self._is_dynamic_size = is_dynamic_size
 
         self._previous_size_key = self._next_size_key = None
@@ -2,11 +2,20 @@
 Structure of size charts and values
 """
 
-from collections import namedtuple
+from bisect import bisect_left, bisect_right
+from collections import Counter, namedtuple
 from copy import deepcopy
+from difflib import get_close_matches
+from itertools import count, islice
 from numbers import Number
+import json
+import math
+import re
+import sys
 
+from .memory import deep_getsizeof
 from .size import Size
+from .sizehistogram import SizeHistogram
 
 """
 Represents the defined Dynamic Values. 
@@ -15,12 +24,15 @@ Represents the defined Dynamic Values.
     sort_value_increment: The increment for each new dynamic size from its dynamic base
     growth_direction: Whether the dynamic values count down or count up (3XS, 2XS, XS versus XL, 2XL, 3XL).
                         Positive means up, negative means down.
+    max_prefix: The largest prefix allowed for the dynamic size (ie: 5 allows up to 5XL).
+                        Optional - None means unlimited.
 
 Example:
 Say size_chart['XS'] = 0, size_chart['XL'] = 100  and DynOp('XS', 5, -1) and DynOp('XL', 10, 1)
 Then 2XS would be -5, 3XS would be -10, 2XL would be 110, 3XL would be 120, etc.
 """
-DynOp = namedtuple('DynOp', 'base_suffix sort_value_increment growth_direction ')
+DynOp = namedtuple('DynOp', 'base_suffix sort_value_increment growth_direction max_prefix')
+DynOp.__new__.__defaults__ = (None,)
 
 """Default mapping of sizes to Size objects"""
 SIZE_CHART_DEFAULTS = {
@@ -39,27 +51,132 @@ Default Size Chart formatting options
 
     verbose: Whether to display verbose name or just short value
     dynamic_size_verbose: Whether to display dynamics (XS/XL/etc.) sizes as verbose or not
-    dynamic_size_formatter: Formatting method for the small/larger dynamic sizes
+    x_size_formatter: Formatting method for the small/larger dynamic sizes (ie: str or to_x_notation)
 """
 SIZE_CHART_FORMAT_DEFAULTS = {'verbose': False,
                               'dynamic_size_verbose': False,
                               'x_size_formatter': str,
                              }
 
+"""
+Kinds of size keys, as returned by the size key tokenizer
+
+    KEY_KIND_BASE: A size of the Size Chart (ie: M, XL, 1XL)
+    KEY_KIND_DYNAMIC: A dynamic size generated from a DynOp (ie: 2XL)
+    KEY_KIND_NUMERIC: A numeric size not in the Size Chart (ie: 12)
+"""
+KEY_KIND_BASE = 'base'
+KEY_KIND_DYNAMIC = 'dynamic'
+KEY_KIND_NUMERIC = 'numeric'
+
+"""
+Policies for resolving unknown/invalid size keys (see `SizeChart.set_unknown_key_policy()`)
+
+    raise: Raise a ValueError (Default)
+    skip: Resolve to None, so the size is left out
+    first: Resolve to a Size sorting before all sizes
+    last: Resolve to a Size sorting after all sizes
+    fuzzy: Resolve regardless of case and X-notation (ie: xxl), otherwise to the closest size
+        key or verbose name of the Size Chart (see FUZZY_MATCH_CUTOFF), otherwise raise
+"""
+UNKNOWN_KEY_POLICIES = ('raise', 'skip', 'first', 'last', 'fuzzy')
+
+"""
+Modes of finding the size key of a sort value (see `SizeChart.key_for_value()`)
+
+    nearest: The size with the closest sort value (the larger size on ties)
+    floor: The largest size at or below the sort value
+    ceil: The smallest size at or above the sort value
+"""
+KEY_FOR_VALUE_MODES = ('nearest', 'floor', 'ceil')
+
+"""
+Maximum entries of the formatted sizes, generated ranges and unknown keys memos
+(oldest evicted first)
+"""
+FORMATTED_SIZES_MAX = 4096
+GENERATED_RANGES_MAX = 1024
+UNKNOWN_KEYS_MAX = 4096
+
+"""
+Fuzzy matching of unknown size keys (see UNKNOWN_KEY_POLICIES), after case and X-notation
+
+    FUZZY_MATCH_CUTOFF: The minimum similarity ratio of a match (see `difflib`)
+    FUZZY_MATCH_MIN_LENGTH: The minimum length of the size keys/verbose names matched,
+        as shorter ones (ie: X, XS, XL) are too alike to tell typos apart
+"""
+FUZZY_MATCH_CUTOFF = 0.8
+FUZZY_MATCH_MIN_LENGTH = 3
+
+"""Suffixes of the extreme sizes, which have an X-notation (ie: XXL for 2XL)"""
+X_NOTATION_SUFFIXES = ('XS', 'XL')
+
+
+def to_x_notation(size_key):
+    """
+    Formats a numeric-prefixed dynamic size key in X-notation (ie: 3XL to XXXL, 2XS to XXS).
+    Only extreme sizes have an X-notation (see X_NOTATION_SUFFIXES), other keys are unchanged.
+
+    :param str size_key: The size key with numeric prefix (or none)
+    :return: The size key as X-prefix
+    :rtype str
+
+    >>> to_x_notation('3XL')
+    'XXXL'
+    >>> to_x_notation('XS')
+    'XS'
+    >>> to_x_notation('3M')
+    '3M'
+    """
+    suffix = size_key.lstrip('0123456789')
+    if suffix not in X_NOTATION_SUFFIXES:
+        return size_key
+    prefix = size_key[:len(size_key) - len(suffix)]
+    return ('X' * (int(prefix) - 1) if prefix else '') + suffix
+
+
+def from_x_notation(size_key):
+    """
+    Parses an X-notation size key to a numeric-prefixed size key (ie: XXXL to 3XL, XXS to 2XS).
+    Only extreme sizes have an X-notation (see X_NOTATION_SUFFIXES), other keys are unchanged.
+
+    :param str size_key: The size key with X-prefix (or none)
+    :return: The size key with numeric prefix
+    :rtype str
+
+    >>> from_x_notation('XXXL')
+    '3XL'
+    >>> from_x_notation('XS')
+    'XS'
+    """
+    prefix, suffix = size_key[:-2], size_key[-2:]
+    if suffix not in X_NOTATION_SUFFIXES or prefix.strip('X'):
+        return size_key
+    return (str(len(prefix) + 1) if prefix else '') + suffix
+
 
 ####TODO
 '''
- ---Verbose
- ---N vs X
- ---Formatter
  ---Single Ended Dynamic Size
  ---No Dynamic Size in chart
  ---Baby Size/Toddler Size/Kids Size
  ---Dynamic Size prefix increments
- ---Dynamic Size limits
 
- decorator, generators
+ decorator
 '''
+def _memoize(memo, key, value, max_entries):
+    """Stores the value in the memo, evicting the oldest entry once the memo is full"""
+    if len(memo) >= max_entries:
+        del memo[next(iter(memo))]
+    memo[key] = value
+    return value
+
+
+def _size_chart_from_definition(cls, definition):
+    """Unpickles a Size Chart (see `SizeChart.__reduce__()`)"""
+    return cls.from_definition(definition)
+
+
 class SizeChart():
     """
     Wrapper class for a size chart
@@ -67,9 +184,6 @@ class SizeChart():
     Principle: Size should only be visible externally from constructor, otherwise remain internal
     """
 
-    """The maximum length of a size chart"""  #used to prevent endless loops for bad values also
-    MAX_SIZE_CHART_LENGTH = 68
-
     def __init__(self, size_chart=None, dyn_ops=None, *, formatting_options=None):
         """
         Initializes a size chart wrapper class.
@@ -77,17 +191,18 @@ class SizeChart():
 
         :param dict size_chart: Map of sizes and values
             Default - Uses SIZE_CHART_DEFAULTS map
-        :param dict dyn_ops: Map of dynamic keys to DynOp Tuples
+        :param dict dyn_ops: Map of dynamic keys to DynOp Tuples ({} for no DynOps)
             Default - Uses DYNAMIC_OPERATIONS_DEFAULTS
         :param dict formatting_options: Formatting options for the Size Chart
             Default - Uses SIZE_CHART_FORMAT_DEFAULTS map
 
         :raise ValueError: If the DynOp keys are not in the Size Chart or invalid
             (smaller_ should be negative, greater_ should be positive)
+        :raise ValueError: If two DynOps grow towards each other between the same sizes
         """
         self._dynamic_size_cache = False
 
-        self.dyn_ops = (dyn_ops if dyn_ops else DYNAMIC_OPERATIONS_DEFAULTS)
+        self.dyn_ops = (dyn_ops if dyn_ops is not None else DYNAMIC_OPERATIONS_DEFAULTS)
         size_chart_shallow = size_chart if size_chart else SIZE_CHART_DEFAULTS
 
         if not all([isinstance(v, Size) for v in size_chart_shallow.values()]):
@@ -100,31 +215,86 @@ class SizeChart():
             raise ValueError('DynOp sort_value_increment must be a positive number')
         if any([do.growth_direction not in (-1,1) for do in self.dyn_ops.values()]):
             raise ValueError('DynOp growth_direction must 1 or -1')
-
-        self.size_chart = deepcopy(size_chart_shallow)
-
-        #Setup double-linked pointers
-        previous_obj = None
-        for key,size_obj in sorted(self.size_chart.items(), key=lambda d: d[1]):
-
-            if previous_obj:
-                previous_obj.next_size_key = key                    #previous obj's next
-                size_obj.previous_size_key = previous_obj.key       #this obj's previous
-            previous_obj = size_obj
+        if any([do.max_prefix is not None and do.max_prefix < 1 for do in self.dyn_ops.values()]):
+            raise ValueError('DynOp max_prefix must be a positive number')
+
+        self.size_chart = {(sys.intern(key) if isinstance(key, str) else key): size
+                           for key, size in deepcopy(size_chart_shallow).items()}
+        self._base_keys = frozenset(self.size_chart)
+        self._interned_keys = {key: key for key in self._base_keys}     #size key => chart key
+
+        #Rank index: base sizes in parallel arrays, dynamic sizes ranked beyond the ends
+        ranked_sizes = sorted(self.size_chart.values())
+        self._ranked_keys = [size.key for size in ranked_sizes]
+        self._ranked_values = [size.sort_value for size in ranked_sizes]
+
+        lower_op = self.dyn_ops.get(self._ranked_keys[0])
+        upper_op = self.dyn_ops.get(self._ranked_keys[-1])
+        self._lower_dyn_op = lower_op if lower_op and lower_op.growth_direction < 0 else None
+        self._upper_dyn_op = upper_op if upper_op and upper_op.growth_direction > 0 else None
+
+        #Sizes of interior DynOps (ie: 2M, 3M of months) rank between their base size and the
+        #  neighbouring base size in their direction, up to the last one sorting before it
+        self._interior_runs = {}        #base key => tuple of growth direction, number of sizes
+        for idx, key in enumerate(self._ranked_keys):
+            dyn_op = self.dyn_ops.get(key)
+            if not dyn_op or dyn_op is self._lower_dyn_op or dyn_op is self._upper_dyn_op:
+                continue
+            gap = abs(self._ranked_values[idx + dyn_op.growth_direction] - self._ranked_values[idx])
+            run_length = max(0, math.ceil(gap / dyn_op.sort_value_increment) - 1)
+            if dyn_op.max_prefix is not None:
+                run_length = min(run_length, dyn_op.max_prefix - 1)
+            if run_length:
+                self._interior_runs[key] = (dyn_op.growth_direction, run_length)
+
+        self._base_ranks, self._key_ranks, rank = [], {}, 0
+        for idx, key in enumerate(self._ranked_keys):
+            direction, run_length = self._interior_runs.get(key, (0, 0))
+            if direction < 0:
+                if self._interior_runs.get(self._ranked_keys[idx - 1], (0,))[0] > 0:
+                    raise ValueError('DynOps grow into the same sizes: ' +
+                                     self._ranked_keys[idx - 1] + ' and ' + key)
+                rank += run_length
+            self._base_ranks.append(rank)
+            self._key_ranks[key] = rank
+            rank += 1 + (run_length if direction > 0 else 0)
+        self._last_rank = rank - 1
+
+        #Rank bounds, None when unlimited
+        self._min_rank = (0 if not self._lower_dyn_op
+                          else None if self._lower_dyn_op.max_prefix is None
+                          else 1 - self._lower_dyn_op.max_prefix)
+        self._max_rank = (self._last_rank if not self._upper_dyn_op
+                          else None if self._upper_dyn_op.max_prefix is None
+                          else self._last_rank - 1 + self._upper_dyn_op.max_prefix)
+
+        #Single-pass tokenizer of dynamic and numeric keys (longest suffix first)
+        suffixes = '|'.join(re.escape(suffix)
+                            for suffix in sorted(self.dyn_ops, key=len, reverse=True)) or '(?!)'
+        self._size_key_re = re.compile(r'(?:([1-9][0-9]*)?({}))\Z|(\d+)\Z'.format(suffixes))
+        self._dynamic_suffix_re = re.compile(r'(?:{})\Z'.format(suffixes))
+
+        #Setup double-linked pointers, following the rank index
+        for key in self._ranked_keys:
+            size_obj = self.size_chart[key]
 
             #Make sure the dynamic_size property is set in case user forgot
-            #  at same time, need to set double-linked pointers
             if key in self.dyn_ops:
                 size_obj.is_dynamic_size = True
-                if self.dyn_ops[key].growth_direction > 0:    #Incrementing sizes
-                    size_obj.next_size_key = '2' + key
-                else:                                          #Decrementing sizes
-                    size_obj.previous_size_key = '2' + key
+            self._link_size(size_obj, self._key_ranks[key])
 
         #Deepcopy since they can be overwritten after instantiation
-        self.formatting_options = deepcopy(formatting_options
-                                           if formatting_options
-                                           else SIZE_CHART_FORMAT_DEFAULTS)
+        self.formatting_options = deepcopy(SIZE_CHART_FORMAT_DEFAULTS)
+        self.formatting_options.update(formatting_options if formatting_options else {})
+        self._formatted_sizes = {}      #size key => formatted size, per formatting options
+        self._generated_ranges = {}     #(start key, end key) => tuple of formatted sizes
+
+        self._unknown_key_policy = 'raise'
+        self._aliases = {}
+        self._unknown_keys = {}         #unknown size key => resolution (Size, None or error)
+
+        self._key_profile = None        #Counter of resolved keys, when profiling
+        self._warmed_sizes = {}         #size key => Size, preloaded by warm()
 
     @classmethod
     def from_simple_dict(cls, simple_dict, dyn_ops=None):
@@ -143,6 +313,154 @@ class SizeChart():
         size_dict = {key: Size(key, value, key, False) for key, value in simple_dict.items()}
         return cls(size_dict, dyn_ops)
 
+    @classmethod
+    def from_definition(cls, definition):
+        """
+        Builds a SizeChart instance from a plain definition (ie: loaded from a JSON file)
+
+        Example:
+        {"sizes": {"S": 25, "M": {"sort_value": 50, "verbose": "Medium"}, "XL": 100},
+         "dyn_ops": {"XL": {"sort_value_increment": 10, "growth_direction": 1}},
+         "formatting_options": {"verbose": true}}
+
+        :param dict definition: Map of 'sizes' (key to sort value, or map or list of Size
+            arguments), and optionally 'dyn_ops' (suffix to map or list of DynOp fields)
+            and 'formatting_options'
+            Default - Each missing entry uses its defaults
+        :return: The Size Chart
+        :rtype SizeChart
+
+        :raise ValueError: If the definition is invalid
+        """
+        try:
+            size_dict = {}
+            for key, spec in definition.get('sizes', {}).items():
+                size = (Size(key, **spec) if isinstance(spec, dict)
+                        else Size(key, *spec) if isinstance(spec, (list, tuple))
+                        else Size(key, spec, key, False))
+                if not isinstance(size.sort_value, Number):
+                    raise ValueError('Size Chart sort values must be Numbers')
+                if not isinstance(size.verbose, str):
+                    raise ValueError('Size verbose names must be strings: ' + key)
+                size_dict[key] = size
+
+            dyn_ops = ({suffix: (DynOp(suffix, **spec) if isinstance(spec, dict)
+                                 else DynOp(suffix, *spec))
+                        for suffix, spec in definition['dyn_ops'].items()}
+                       if 'dyn_ops' in definition else None)
+            for dyn_op in (dyn_ops or {}).values():
+                if not isinstance(dyn_op.sort_value_increment, Number) or \
+                   not isinstance(dyn_op.growth_direction, Number) or \
+                   not isinstance(dyn_op.max_prefix, (Number, type(None))):
+                    raise ValueError('DynOp fields must be Numbers: ' + dyn_op.base_suffix)
+
+            formatting_options = definition.get('formatting_options')
+            if not isinstance(formatting_options, (dict, type(None))):
+                raise ValueError('Formatting options must be a map')
+        except (TypeError, AttributeError) as e:
+            raise ValueError('Invalid Size Chart definition: ' + str(e))
+
+        return cls(size_dict, dyn_ops, formatting_options=formatting_options)
+
+    @classmethod
+    def compose(cls, size_charts, offsets=None):
+        """
+        Merges Size Charts (ie: preemie/newborn, months, toddler and kids) into one Size Chart
+        with a single ordering, so sizes of all charts resolve with one lookup.
+
+        DynOps inside the composition are materialized as base sizes (2M, 3M, ... up to the
+        next size of their chart, or their max_prefix), so those growing from the ends of a
+        chart must have a max_prefix. Only the DynOp growing down from the smallest size of the
+        first chart, and up from the largest size of the last chart, stay dynamic.
+
+        :param list size_charts: The Size Charts, smallest sizes first
+        :param list offsets: The offset added to the sort values of each Size Chart
+            Default - None (Each chart starts 1 above the largest sort value of the previous)
+        :return: The composed Size Chart (with the formatting options of the first chart)
+        :rtype SizeChart
+
+        :raise ValueError: If there are no Size Charts, a DynOp inside the composition is not
+            bounded or its max_prefix overlaps the next size, a size key is in more than one
+            chart, or sort values collide or overlap
+        """
+        size_charts = list(size_charts)
+        if not size_charts:
+            raise ValueError('Compose needs at least one Size Chart')
+        if offsets is not None and len(offsets) != len(size_charts):
+            raise ValueError('Compose needs one offset per Size Chart')
+
+        size_dict, dyn_ops, previous_max = {}, {}, None
+        for idx, size_chart in enumerate(size_charts):
+            segment = [size_chart.size_chart[key] for key in size_chart._ranked_keys]
+
+            for suffix, dyn_op in size_chart.dyn_ops.items():
+                if (idx == 0 and dyn_op is size_chart._lower_dyn_op) or \
+                   (idx == len(size_charts) - 1 and dyn_op is size_chart._upper_dyn_op):
+                    dyn_ops[suffix] = dyn_op
+                    continue
+                if dyn_op is size_chart._lower_dyn_op or dyn_op is size_chart._upper_dyn_op:
+                    if dyn_op.max_prefix is None:
+                        raise ValueError('DynOp inside the composition must have a max_prefix: ' +
+                                         suffix)
+                    run_length = dyn_op.max_prefix - 1
+                else:       #Interior runs stop before the next size of the chart
+                    run_length = size_chart._interior_runs.get(suffix, (0, 0))[1]
+                    if dyn_op.max_prefix is not None and dyn_op.max_prefix - 1 > run_length:
+                        raise ValueError('DynOp sizes overlap the next size: ' +
+                                         str(run_length + 2) + suffix)
+
+                for prefix in range(2, run_length + 2):
+                    segment.append(size_chart._build_dynamic_size(str(prefix) + suffix,
+                                                                  prefix, suffix))
+
+            values = [size.sort_value for size in segment]
+            offset = (offsets[idx] if offsets is not None
+                      else 0 if previous_max is None else previous_max + 1 - min(values))
+            if previous_max is not None and min(values) + offset <= previous_max:
+                raise ValueError('Size Charts overlap when composed: ' + size_chart._ranked_keys[0])
+            previous_max = max(values) + offset
+
+            for size in segment:
+                if size.key in size_dict:
+                    raise ValueError('Size key in more than one Size Chart: ' + size.key)
+                size_dict[size.key] = Size(size.key, size.sort_value + offset, size.verbose,
+                                           size.is_dynamic_size)
+
+        ordered_sizes = sorted(size_dict.values())
+        for smaller, larger in zip(ordered_sizes, ordered_sizes[1:]):
+            if smaller.sort_value == larger.sort_value:
+                raise ValueError('Sort values collide: {} and {}'.format(smaller.key, larger.key))
+
+        return cls(size_dict, dyn_ops, formatting_options=size_charts[0].formatting_options)
+
+    def to_definition(self):
+        """
+        Exports the canonical definition of the Size Chart (see `from_definition()`).
+        Dynamic sizes cached in the Size Chart are not included.
+
+        note:: The x_size_formatter formatting option is a function, so is not JSON serializable.
+
+        :return: Map of 'sizes', 'dyn_ops' and 'formatting_options'
+        :rtype dict
+        """
+        return {
+            'sizes': {key: [size.sort_value, size.verbose, size.is_dynamic_size]
+                      for key, size in self.size_chart.items() if key in self._base_keys},
+            'dyn_ops': {suffix: list(dyn_op[1:]) for suffix, dyn_op in self.dyn_ops.items()},
+            'formatting_options': dict(self.formatting_options),
+        }
+
+    def __reduce__(self):
+        """
+        Pickles only the canonical definition, whether the Dynamic Size Cache is enabled and
+        the unknown key policy (with its aliases), so workers resolve sizes like the parent.
+        Indexes are rebuilt and dynamic sizes regenerated on demand after unpickling.
+        """
+        return (_size_chart_from_definition, (type(self), self.to_definition()),
+                {'_dynamic_size_cache': self._dynamic_size_cache,
+                 '_unknown_key_policy': self._unknown_key_policy,
+                 '_aliases': dict(self._aliases)})
+
     def __len__(self):
         """
         Returns the length of the Size Chart
@@ -165,6 +483,51 @@ class SizeChart():
                    if size_key.endswith(base_suffix)]
         return dyn_ops[0] if len(dyn_ops) > 0 else None
 
+    def _tokenize_size_key(self, size_key):
+        """
+        Tokenizes the size key in a single pass against the Size Chart and its DynOps.
+        A prefix of 1 is stripped from any base key (ie: 1M is M), numeric keys are any
+        decimal digits (including unicode digits, ie: fullwidth), dynamic prefixes are ASCII.
+
+        :param str size_key: The size key to tokenize
+        :returns A tuple of the prefix count (0 for numeric, 1 for base), the base key
+                (the number for numeric) and the kind of key (KEY_KIND_*)
+        :rtype tuple(int, str, str)
+
+        :raises ValueError: If the key is not valid for the Size Chart.
+            Examples: '-5XL', '+3XL', '4L' {non-dynamic} or 'X' {invalid size}
+        """
+        if isinstance(size_key, Number):
+            size_key = str(size_key)
+        elif not isinstance(size_key, str):
+            raise ValueError('Size key must be a string or a number')
+
+        if size_key in self._base_keys:
+            return (1, size_key, KEY_KIND_BASE)
+        if size_key[:1] == '1' and not size_key[1:2].isdigit() and \
+           size_key[1:] in self._base_keys:        #A prefix of 1 is the size itself (ie: 1M)
+            return (1, size_key[1:], KEY_KIND_BASE)
+
+        match = self._size_key_re.match(size_key)
+        if match is None:
+            if self._dynamic_suffix_re.search(size_key):
+                raise ValueError('Prefix of Dynamic Key must be a positive number or not set')
+            raise ValueError('Suffix is not defined as Dynamic Size')
+
+        prefix, suffix, numeric = match.groups()
+        if numeric:
+            return (0, numeric, KEY_KIND_NUMERIC)
+
+        prefix_count = int(prefix) if prefix else 1
+        if prefix_count == 1:
+            return (1, suffix, KEY_KIND_BASE)
+
+        max_prefix = self.dyn_ops[suffix].max_prefix
+        if max_prefix is not None and prefix_count > max_prefix:
+            raise ValueError('Prefix of Dynamic Key exceeds the DynOp max_prefix')
+
+        return (prefix_count, suffix, KEY_KIND_DYNAMIC)
+
     def _handle_single_prefix(self, size_key):
         """
         Removes any unncessary prefixes which means the same as another key (ie: 1XS to XS, '2' to 2)
@@ -172,21 +535,11 @@ class SizeChart():
         :param str size_key: The size key to look up in our chart.
         :returns The size key with/without removed prefix
         :rtype str
-        """
-
-        #If it's a numeric key, return as String
-        if isinstance(size_key, Number):
-            return str(size_key)
 
-        #If it's all digits, return as is
-        if size_key.isdigit():
-            return size_key
-
-        #If size key begins with a 1, and the second character is not numeric, then needs fix
-        if size_key[0].isdigit() and size_key[0] == '1' and not(size_key[1].isdigit()):
-            return size_key[1:]
-
-        return size_key
+        :raises ValueError: If the key is not valid for the Size Chart.
+        """
+        prefix_count, base_key, kind = self._tokenize_size_key(size_key)
+        return base_key if kind != KEY_KIND_DYNAMIC else str(prefix_count) + base_key
 
     def _parse_size_key(self, size_key):
         """
@@ -199,16 +552,34 @@ class SizeChart():
 
         :raises ValueError: If the key is not parsable (invalid characters, etc.)
         """
-        dyn_op = self._find_dynamic_operation(size_key)
-        if not dyn_op:
-            return ('', size_key, False)
+        prefix_count, base_key, kind = self._tokenize_size_key(size_key)
+        return (str(prefix_count) if kind == KEY_KIND_DYNAMIC else '', base_key,
+                kind != KEY_KIND_NUMERIC and base_key in self.dyn_ops)
 
-        suff_len = len(dyn_op.base_suffix)
-        prefix = size_key[:-suff_len]
-        if not(prefix == '' or prefix.isalnum()):
-            raise ValueError('Prefix of Dynamic Key must be a positive number or not set')
+    def _build_dynamic_size(self, size_key, prefix_count, base_key):
+        """
+        Calculates a dynamic Size from the tokenized key and the DynOp of the Chart.
 
-        return (prefix if prefix not in ['1'] else '', size_key[-suff_len:], True)
+        :param str size_key: The Dynamic Key of the Size (ie: 3XL)
+        :param int prefix_count: The prefix of the Dynamic Key (ie: 3), greater than 1
+        :param str base_key: The base suffix of the Dynamic Key (ie: XL)
+        :return The generated Dynamic Size
+        :rtype Size
+        """
+        base_size = self.size_chart[base_key]
+        dyn_op = self.dyn_ops[base_key]
+
+        int_prefix = prefix_count - 1
+        sort_value = (base_size.sort_value +
+                      int_prefix * (dyn_op.growth_direction * dyn_op.sort_value_increment))
+
+        verbose = str(prefix_count) + base_size.verbose
+        dynamic_size = Size(size_key, sort_value, verbose, True)
+        rank = self._dynamic_rank(prefix_count, base_key)
+        if rank is not None:                #Sizes past an interior run are not linked
+            self._link_size(dynamic_size, rank)
+
+        return dynamic_size
 
     def _generate_dynamic_size(self, size_key):
         """
@@ -221,54 +592,14 @@ class SizeChart():
         :raises ValueError: If the key is not parsable (invalid characters, etc.) or it it wasn't
             a dynamic size per Size Chart
         """
-
-        """INLINE"""
-        def __prefix_to_key(prefix, dyn_op):
-            if prefix == 0:
-                base_size = self.size_chart[dyn_op.base_suffix]
-                return (base_size.previous_size_key
-                       if dyn_op.growth_direction > 0  #If 0XS, then we want S which is next
-                       else base_size.next_size_key)   #If 0XL, we want L which is previous
-            if prefix == 1:
-                return dyn_op.base_suffix
-            return str(prefix) + dyn_op.base_suffix
-
-        """INLINE"""
-        def __set_previous_next(dynamic_size, int_prefix, dyn_op):
-            #int_prefix is current prefix - 1       XS = 0, 2XL = 1
-            up_key = __prefix_to_key(int_prefix+2, dyn_op)
-            down_key = __prefix_to_key(int_prefix, dyn_op)
-
-            if dyn_op.growth_direction > 0:                 #Positive... so L, XL, 2XL
-                dynamic_size.previous_size_key = down_key
-                dynamic_size.next_size_key = up_key
-            else:                                           #Negative... so 3XS, 2XS, XS
-                dynamic_size.previous_size_key = up_key
-                dynamic_size.next_size_key = down_key
-
-        prefix, suffix, is_dynamic_size = self._parse_size_key(size_key)
-        if not is_dynamic_size:
+        prefix_count, base_key, kind = self._tokenize_size_key(size_key)
+        if kind == KEY_KIND_NUMERIC or base_key not in self.dyn_ops:
             raise ValueError('Suffix is not defined as Dynamic Size')
-        
-        base_size = self.size_chart[suffix]
-        if prefix == '':  #Its a base dynamic key, so just return it
-            return base_size
-
-        sort_value = base_size.sort_value
 
-        dyn_op = self.dyn_ops[base_size.key]
-        
-        int_prefix = (int(prefix) - 1 if prefix else 0)
-        if int_prefix:  #Not empty
-            sort_value += int_prefix * (dyn_op.growth_direction * dyn_op.sort_value_increment)
-        else:
-            size_key = base_size.key
-
-        verbose = prefix + base_size.verbose
-        dynamic_size = Size(size_key, sort_value, verbose, True)
-        __set_previous_next(dynamic_size, int_prefix, dyn_op)
+        if kind == KEY_KIND_BASE:  #Its a base dynamic key, so just return it
+            return self.size_chart[base_key]
 
-        return dynamic_size
+        return self._build_dynamic_size(size_key, prefix_count, base_key)
 
     def _size_key_to_size(self, size_key):
         """
@@ -281,19 +612,20 @@ class SizeChart():
         :raises ValueError: If an invalid dynamic size is passed in.
             Examples: '-5XL', '+3XL', '4L' {non-dynamic} or 'X' {invalid size}
         """
-        size_key = self._handle_single_prefix(size_key)
+        try:
+            prefix_count, base_key, kind = self._tokenize_size_key(size_key)
+        except ValueError as e:
+            raise ValueError('Base size not defined and/or not Dynamic: ' + str(e))
 
-        size = self.size_chart.get(size_key)
+        key = base_key if kind != KEY_KIND_DYNAMIC else str(size_key)
+        size = self.size_chart.get(key)
         is_new = size is None
 
         if is_new:
-            try:
-                if size_key.isnumeric():
-                    size = Size(size_key, float(size_key), size_key, False)
-                else: 
-                    size = self._generate_dynamic_size(size_key)
-            except Exception as e:
-                raise ValueError('Base size not defined and/or not Dynamic: ' + str(e))
+            if kind == KEY_KIND_NUMERIC:
+                size = Size(key, float(key), key, False)
+            else:
+                size = self._build_dynamic_size(key, prefix_count, base_key)
 
         return (size,is_new)
 
@@ -310,13 +642,478 @@ class SizeChart():
         :raises ValueError: If an invalid dynamic size is passed in.
             Examples: '-5XL', '+3XL', '4L' {non-dynamic} or 'X' {invalid size}
         """
-        size, is_new = self._size_key_to_size(size_key)
+        size = self._get_or_create_size(size_key)
+        if self._key_profile is not None:
+            self._key_profile[size.key] += 1
+        return size
 
-        if is_new and self._dynamic_size_cache:
-            self.size_chart[size_key] = size
+    def _get_or_create_size(self, size_key):
+        """Same as `get_or_create_size()`, without key profiling"""
+        size = self.size_chart.get(size_key)       #Fast path for chart (and cached) keys
+        if size is None:
+            size = self._warmed_sizes.get(size_key)
+        if size is None:
+            size, is_new = self._size_key_to_size(size_key)
+
+            if is_new and self._dynamic_size_cache:
+                self.size_chart[size.key] = size
+
+        return size
+
+    def set_unknown_key_policy(self, policy, aliases=None):
+        """
+        Sets how `resolve_size()` handles unknown/invalid size keys (see UNKNOWN_KEY_POLICIES)
+
+        :param str policy: One of 'raise', 'skip', 'first', 'last' or 'fuzzy'
+        :param dict aliases: Map of unknown size keys to size keys (ie: {'Lg': 'L'}),
+            which are used before the policy applies
+            Default - None (No aliases)
+
+        :raises ValueError: If the policy is not known or an alias is to an invalid size
+        """
+        if policy not in UNKNOWN_KEY_POLICIES:
+            raise ValueError('Unknown key policy must be one of: ' +
+                             ', '.join(UNKNOWN_KEY_POLICIES))
+        aliases = dict(aliases) if aliases else {}
+        for size_key in aliases.values():
+            self._get_or_create_size(size_key)
+
+        self._unknown_key_policy = policy
+        self._aliases = aliases
+        self._unknown_keys.clear()
+
+    def _resolve_unknown_size(self, size_key, error):
+        """
+        Resolves the unknown size key per the aliases and the unknown key policy
+
+        :param str size_key: The unknown size key
+        :param ValueError error: The error raised when resolving the size key
+        :return: The resolved Size, None if skipped, or the error to raise
+        :rtype Size
+        """
+        alias = self._aliases.get(size_key)
+        if alias is not None:
+            return self._get_or_create_size(alias)
+
+        policy = self._unknown_key_policy
+        if policy == 'skip':
+            return None
+        if policy in ('first', 'last'):
+            return Size(str(size_key), float('-inf') if policy == 'first' else float('inf'))
+        if policy == 'fuzzy':
+            candidates = {}
+            for key in self._ranked_keys:
+                size = self.size_chart[key]
+                candidates.setdefault(size.verbose.lower(), key)
+                candidates[key.lower()] = key
+            size_key = str(size_key).strip()
+            key = candidates.get(size_key.lower())
+            if key is not None:
+                return self.size_chart[key]
+
+            #Case and X-notation (ie: xxl is 2XL) before typos
+            try:
+                return self._get_or_create_size(from_x_notation(size_key.upper()))
+            except ValueError:
+                pass
+
+            if len(size_key) >= FUZZY_MATCH_MIN_LENGTH:
+                matches = get_close_matches(size_key.lower(),
+                                            [candidate for candidate in candidates
+                                             if len(candidate) >= FUZZY_MATCH_MIN_LENGTH],
+                                            1, FUZZY_MATCH_CUTOFF)
+                if matches:
+                    return self.size_chart[candidates[matches[0]]]
+
+        return error
+
+    def resolve_size(self, size_key):
+        """
+        Retrieves the size like `get_or_create_size()`, but resolves unknown/invalid size keys
+        per the unknown key policy (see `set_unknown_key_policy()`).
+        Resolutions of unknown size keys are cached, so repeated bad keys cost a lookup.
+        Every call is counted when key profiling is enabled (see `enable_key_profiling()`).
+
+        :param str size_key: The size to look up in our chart.
+        :return: The Size object, or None if the size is to be skipped
+        :rtype Size
+
+        :raises ValueError: If the size is invalid and the policy is to raise
+            (or no fuzzy match was found)
+        """
+        size = self._resolve_size(size_key)
+        if self._key_profile is not None and size is not None:
+            self._key_profile[size.key] += 1
+        return size
+
+    def _resolve_size(self, size_key):
+        """Same as `resolve_size()`, without key profiling"""
+        size = self.size_chart.get(size_key) if isinstance(size_key, str) else None
+        if size is None:
+            try:
+                size = self._unknown_keys[size_key]
+            except KeyError:
+                try:
+                    size = self._get_or_create_size(size_key)
+                except ValueError as e:
+                    size = _memoize(self._unknown_keys, size_key,
+                                    self._resolve_unknown_size(size_key, e), UNKNOWN_KEYS_MAX)
+
+            if isinstance(size, ValueError):
+                raise ValueError(*size.args)
 
         return size
 
+    def intern_key(self, size_key):
+        """
+        Canonicalizes the size key to the interned key of the Size Chart (ie: '1XL' to 'XL').
+        Canonical keys are looked up on identity, so ingestion should canonicalize once.
+
+        note:: Every valid key passed in is remembered (as the vocabulary of sizes is small).
+
+        :param str size_key: The size key to canonicalize
+        :return: The interned chart key
+        :rtype str
+
+        :raises ValueError: If an invalid size is passed in.
+        """
+        key = self._interned_keys.get(size_key)
+        if key is None:
+            try:
+                prefix_count, base_key, kind = self._tokenize_size_key(size_key)
+            except ValueError as e:
+                raise ValueError('Base size not defined and/or not Dynamic: ' + str(e))
+
+            key = sys.intern(base_key if kind != KEY_KIND_DYNAMIC else str(size_key))
+            self._interned_keys[size_key] = self._interned_keys[key] = key
+
+        return key
+
+    def rank_of(self, size_key):
+        """
+        Retrieves the rank (position) of the size in the Size Chart ordering.
+        Dynamic sizes beyond the smallest/largest sizes rank before 0 or after the last size,
+        dynamic sizes of the other DynOps rank between their base size and the next base size.
+
+        :param str size_key: The size key to rank
+        :return: The rank of the size
+        :rtype int
+
+        :raises ValueError: If the size is invalid or has no rank
+            (numeric sizes not in Size Chart, dynamic sizes reaching the next base size)
+        """
+        try:
+            prefix_count, base_key, kind = self._tokenize_size_key(size_key)
+        except ValueError as e:
+            raise ValueError('Base size not defined and/or not Dynamic: ' + str(e))
+
+        if kind == KEY_KIND_BASE:
+            return self._key_ranks[base_key]
+        rank = self._dynamic_rank(prefix_count, base_key) if kind == KEY_KIND_DYNAMIC else None
+        if rank is None:
+            raise ValueError('Size has no rank in Size Chart: ' + str(size_key))
+        return rank
+
+    def _dynamic_rank(self, prefix_count, base_key):
+        """Calculates the rank of a tokenized dynamic size, None if it has no rank"""
+        run = self._interior_runs.get(base_key)
+        if run is not None:
+            direction, run_length = run
+            if prefix_count - 1 <= run_length:
+                return self._key_ranks[base_key] + direction * (prefix_count - 1)
+        elif self._upper_dyn_op and base_key == self._upper_dyn_op.base_suffix:
+            return self._last_rank - 1 + prefix_count
+        elif self._lower_dyn_op and base_key == self._lower_dyn_op.base_suffix:
+            return 1 - prefix_count
+        return None
+
+    @property
+    def chart_ranks(self):
+        """
+        Ranks of the sizes of the Size Chart (and of its interior DynOps).
+        Dynamic sizes beyond the smallest/largest sizes rank outside of them.
+
+        :rtype range
+        """
+        return range(self._last_rank + 1)
+
+    def _locate_rank(self, rank):
+        """
+        Locates a rank within the Size Chart (0 to the last rank)
+
+        :return: Tuple of the index of the base size and the number of DynOp steps from it
+        :rtype tuple(int, int)
+        """
+        if not self._interior_runs:
+            return (rank, 0)
+
+        idx = bisect_right(self._base_ranks, rank) - 1
+        steps = rank - self._base_ranks[idx]
+        direction, run_length = self._interior_runs.get(self._ranked_keys[idx], (0, 0))
+        if steps and (direction < 0 or steps > run_length):
+            idx += 1                            #Run of the next base size, growing down
+            steps = self._base_ranks[idx] - rank
+        return (idx, steps)
+
+    def key_at_rank(self, rank):
+        """
+        Retrieves the size key at the rank (position) of the Size Chart ordering.
+        Ranks of dynamic sizes are computed arithmetically.
+
+        :param int rank: The rank of the size
+        :return: The size key
+        :rtype str
+
+        :raises ValueError: If the rank is outside of the Size Chart (and its DynOp limits)
+        """
+        key = self._key_at_rank(rank)
+        if key is None:
+            raise ValueError('Rank out of range of Size Chart: ' + str(rank))
+        return key
+
+    def _key_at_rank(self, rank):
+        """Same as `key_at_rank()`, but None if the rank is out of range"""
+        if 0 <= rank <= self._last_rank:
+            idx, steps = self._locate_rank(rank)
+            key = self._ranked_keys[idx]
+            return str(steps + 1) + key if steps else key
+        if (self._min_rank is not None and rank < self._min_rank) or \
+           (self._max_rank is not None and rank > self._max_rank):
+            return None
+
+        if rank < 0:
+            return str(1 - rank) + self._lower_dyn_op.base_suffix
+        return str(rank - self._last_rank + 1) + self._upper_dyn_op.base_suffix
+
+    def _link_size(self, size, rank):
+        """Sets the double-linked pointers of the size to the sizes ranked around it"""
+        size.previous_size_key = self._key_at_rank(rank - 1)
+        size.next_size_key = self._key_at_rank(rank + 1)
+
+    def _sort_value_at_rank(self, rank):
+        """Calculates the sort value of the rank, arithmetically for dynamic sizes"""
+        if rank < 0:
+            return self._ranked_values[0] + rank * self._lower_dyn_op.sort_value_increment
+        if rank > self._last_rank:
+            return (self._ranked_values[-1] +
+                    (rank - self._last_rank) * self._upper_dyn_op.sort_value_increment)
+
+        idx, steps = self._locate_rank(rank)
+        if not steps:
+            return self._ranked_values[idx]
+        dyn_op = self.dyn_ops[self._ranked_keys[idx]]
+        return (self._ranked_values[idx] +
+                steps * dyn_op.growth_direction * dyn_op.sort_value_increment)
+
+    def _floor_ceil_ranks(self, value):
+        """
+        Finds the ranks of the largest size at or below, and the smallest size at or above
+        the sort value. For dynamic sizes the DynOp increments are inverted arithmetically.
+
+        :return: Tuple of the floor and ceil ranks (None where there is no such size)
+        :rtype tuple(int, int)
+        """
+        values, last_rank = self._ranked_values, self._last_rank
+        if value < values[0]:
+            dyn_op = self._lower_dyn_op
+            position = (value - values[0]) / dyn_op.sort_value_increment if dyn_op else None
+            floor_rank = math.floor(position) if dyn_op else None
+            ceil_rank = math.ceil(position) if dyn_op else 0
+        elif value > values[-1]:
+            dyn_op = self._upper_dyn_op
+            position = (last_rank + (value - values[-1]) / dyn_op.sort_value_increment
+                        if dyn_op else None)
+            floor_rank = math.floor(position) if dyn_op else last_rank
+            ceil_rank = math.ceil(position) if dyn_op else None
+        else:
+            idx = bisect_left(values, value)
+            floor_rank = ceil_rank = self._base_ranks[idx]
+            if values[idx] != value:
+                floor_rank = self._base_ranks[idx - 1]
+                #Sizes of an interior DynOp in between, growing up or down
+                for base_idx, direction in ((idx - 1, 1), (idx, -1)):
+                    run = self._interior_runs.get(self._ranked_keys[base_idx])
+                    if run is None or run[0] != direction:
+                        continue
+                    dyn_op = self.dyn_ops[self._ranked_keys[base_idx]]
+                    position = abs(value - values[base_idx]) / dyn_op.sort_value_increment
+                    near_steps, far_steps = (min(math.floor(position), run[1]),
+                                             math.ceil(position))
+                    if direction > 0:
+                        floor_rank = self._base_ranks[base_idx] + near_steps
+                        if far_steps <= run[1]:
+                            ceil_rank = self._base_ranks[base_idx] + far_steps
+                    else:
+                        ceil_rank = self._base_ranks[base_idx] - near_steps
+                        if far_steps <= run[1]:
+                            floor_rank = self._base_ranks[base_idx] - far_steps
+
+        #DynOp limits
+        if floor_rank is not None:
+            if self._min_rank is not None and floor_rank < self._min_rank:
+                floor_rank = None
+            elif self._max_rank is not None and floor_rank > self._max_rank:
+                floor_rank = self._max_rank
+        if ceil_rank is not None:
+            if self._max_rank is not None and ceil_rank > self._max_rank:
+                ceil_rank = None
+            elif self._min_rank is not None and ceil_rank < self._min_rank:
+                ceil_rank = self._min_rank
+
+        return floor_rank, ceil_rank
+
+    def key_for_value(self, value, mode='nearest'):
+        """
+        Finds the size key of a sort value (ie: from a measurement or fit prediction). O(log N)
+
+        :param Number value: The sort value
+        :param str mode: One of 'nearest', 'floor' or 'ceil' (see KEY_FOR_VALUE_MODES)
+            Default - 'nearest'
+        :return: The size key, None if there is no size at or below (floor) or at or above (ceil)
+        :rtype str
+
+        :raises ValueError: If the mode is not known or the value is not a number
+        """
+        return self.keys_for_values((value,), mode)[0]
+
+    def keys_for_values(self, values, mode='nearest'):
+        """
+        Finds the size keys of sort values (see `key_for_value()`)
+
+        :param iterable values: The sort values (ie: an array)
+        :param str mode: One of 'nearest', 'floor' or 'ceil' (see KEY_FOR_VALUE_MODES)
+            Default - 'nearest'
+        :return: The size keys (None where there is no size)
+        :rtype list
+
+        :raises ValueError: If the mode is not known or a value is not a number
+        """
+        if mode not in KEY_FOR_VALUE_MODES:
+            raise ValueError('Mode must be one of: ' + ', '.join(KEY_FOR_VALUE_MODES))
+
+        keys = []
+        for value in values:
+            if not isinstance(value, Number) or not math.isfinite(value):
+                raise ValueError('Sort value must be a finite number: ' + str(value))
+
+            floor_rank, ceil_rank = self._floor_ceil_ranks(value)
+            if mode == 'floor' or (mode == 'nearest' and ceil_rank is None):
+                rank = floor_rank
+            elif mode == 'ceil' or floor_rank is None:
+                rank = ceil_rank
+            else:
+                rank = (floor_rank if value - self._sort_value_at_rank(floor_rank) <
+                        self._sort_value_at_rank(ceil_rank) - value else ceil_rank)
+            keys.append(self.key_at_rank(rank) if rank is not None else None)
+
+        return keys
+
+    def next_of(self, size_key, n=1):
+        """
+        Retrieves the size n sizes larger than the size. O(1)
+
+        :param str size_key: The size key to start from
+        :param int n: The number of sizes to move up
+            Default - 1
+        :return: The size key
+        :rtype str
+
+        :raises ValueError: If the size is invalid, has no rank or the result is out of range
+        """
+        return self.key_at_rank(self.rank_of(size_key) + n)
+
+    def prev_of(self, size_key, n=1):
+        """
+        Retrieves the size n sizes smaller than the size. O(1)
+
+        :param str size_key: The size key to start from
+        :param int n: The number of sizes to move down
+            Default - 1
+        :return: The size key
+        :rtype str
+
+        :raises ValueError: If the size is invalid, has no rank or the result is out of range
+        """
+        return self.key_at_rank(self.rank_of(size_key) - n)
+
+    def histogram(self, iterable, weights=None):
+        """
+        Counts the sizes of the iterable, in Size Chart order (see `SizeHistogram`)
+
+        :param iterable iterable: The size keys to count
+        :param iterable weights: The weight of each size key (ie: quantity sold)
+            Default - None (Each size key counts 1)
+        :return: The histogram of the sizes
+        :rtype SizeHistogram
+
+        :raises ValueError: If a size is invalid or has no rank in the Size Chart
+        """
+        return SizeHistogram(self).update(iterable, weights)
+
+    def to_pandas_categorical(self, values):
+        """
+        Builds an ordered pandas Categorical of the sizes, with categories in Size Chart order
+        (including the dynamic sizes present). Requires pandas (see `categorical`).
+
+        :param iterable values: The size keys (ie: a Series or list). None/NaN are missing
+        :return: The ordered Categorical
+        :rtype pandas.Categorical
+
+        :raises ImportError: If pandas is not installed
+        :raises ValueError: If a value is an invalid size (and the unknown key policy is to raise)
+        """
+        from .categorical import to_pandas_categorical      #Optional dependency
+        return to_pandas_categorical(self, values)
+
+    def to_arrow_dictionary(self, values):
+        """
+        Builds an ordered Arrow DictionaryArray of the sizes, with the dictionary in Size Chart
+        order (including the dynamic sizes present). Requires pyarrow (see `categorical`).
+
+        :param iterable values: The size keys (ie: an Arrow array or list). Nulls are missing
+        :return: The ordered DictionaryArray
+        :rtype pyarrow.DictionaryArray
+
+        :raises ImportError: If pyarrow is not installed
+        :raises ValueError: If a value is an invalid size (and the unknown key policy is to raise)
+        """
+        from .categorical import to_arrow_dictionary        #Optional dependency
+        return to_arrow_dictionary(self, values)
+
+    def memory_report(self, seen=None):
+        """
+        Reports the memory used by the Size Chart, via `sys.getsizeof()` traversal.
+
+        :param set seen: Ids of objects already counted elsewhere, which are skipped (updated)
+            Default - None (Count everything)
+        :return: Map of bytes used by 'base_sizes', 'dynamic_cache' (cached and warmed sizes),
+            'formatting' (options and formatted sizes), 'indexes' (rank and tokenizer indexes)
+            and the 'total'
+        :rtype dict
+        """
+        seen = set() if seen is None else seen
+        seen.update((id(self), id(self.size_chart)))
+
+        report = dict.fromkeys(('base_sizes', 'dynamic_cache', 'formatting', 'indexes'), 0)
+        #Growth of the Size Chart map (beyond the base sizes) is due to the Dynamic Size Cache
+        report['base_sizes'] = sys.getsizeof(dict.fromkeys(self._base_keys))
+        report['dynamic_cache'] = max(0, sys.getsizeof(self.size_chart) - report['base_sizes'])
+        for key, size in self.size_chart.items():
+            section = 'base_sizes' if key in self._base_keys else 'dynamic_cache'
+            report[section] += deep_getsizeof(key, seen) + deep_getsizeof(size, seen)
+        if self._warmed_sizes:
+            report['dynamic_cache'] += deep_getsizeof(self._warmed_sizes, seen)
+
+        for obj in (self.formatting_options, self._formatted_sizes, self._generated_ranges):
+            report['formatting'] += deep_getsizeof(obj, seen)
+        for obj in (self._base_keys, self._ranked_keys, self._ranked_values, self._key_ranks,
+                    self._base_ranks, self._interior_runs, self._interned_keys,
+                    self._size_key_re, self._dynamic_suffix_re):
+            report['indexes'] += deep_getsizeof(obj, seen)
+
+        report['total'] = sum(report.values()) + deep_getsizeof(vars(self), seen)
+        return report
+
     def enable_dynamic_size_cache(self):
         """
         Disables saving of generated dynamic sizes into Size Chart (Disabled by Default).
@@ -324,6 +1121,108 @@ class SizeChart():
         """
         self._dynamic_size_cache = True
 
+    def enable_key_profiling(self):
+        """
+        Counts the sizes resolved by `get_or_create_size()` and `resolve_size()`
+        (Disabled by Default), so the most frequent sizes can be exported
+        (see `export_key_profile()`) to warm the caches of new processes (see `warm()`).
+
+        note:: Callers memoizing resolved sizes (ie: SizeSorter) add the sizes taken from
+            their memo in bulk (see `count_keys()`), so each occurrence is counted.
+        """
+        if self._key_profile is None:
+            self._key_profile = Counter()
+
+    def count_keys(self, size_keys, resolved=()):
+        """
+        Counts the occurrences of size keys in the key profile, in bulk (ie: once per batch of a
+        caller memoizing resolved sizes). Does nothing unless key profiling is enabled,
+        in which case the size keys are only iterated then.
+
+        :param iterable size_keys: The size keys, each occurrence (ie: a batch of inputs)
+        :param iterable resolved: The size keys already counted once by `resolve_size()`
+            (ie: memo misses), which are counted one less
+            Default - () (None)
+        """
+        if self._key_profile is None:
+            return
+
+        key_counts = Counter(size_keys)
+        key_counts.subtract(resolved)
+        for size_key, key_count in key_counts.items():
+            if key_count <= 0:
+                continue
+            try:
+                size = self._resolve_size(size_key)
+            except ValueError:
+                continue
+            if size is not None:
+                self._key_profile[size.key] += key_count
+
+    @property
+    def key_profiling(self):
+        """Whether key profiling is enabled (see `enable_key_profiling()`)"""
+        return self._key_profile is not None
+
+    def key_profile(self, n=None):
+        """
+        Lists the most frequently resolved sizes (see `enable_key_profiling()`)
+
+        :param int n: The number of sizes to list
+            Default - None (All sizes)
+        :return: List of tuple of size key and count, most frequent first
+        :rtype list
+        """
+        return self._key_profile.most_common(n) if self._key_profile is not None else []
+
+    def export_key_profile(self, path, n=None):
+        """
+        Writes the most frequently resolved sizes to a JSON profile file (see `warm()`)
+
+        :param str path: Path of the profile file
+        :param int n: The number of sizes to export
+            Default - None (All sizes)
+        :return: The number of sizes exported
+        :rtype int
+        """
+        profile = self.key_profile(n)
+        with open(path, 'w', encoding='utf-8') as profile_file:
+            json.dump([[key, count] for key, count in profile], profile_file)
+        return len(profile)
+
+    def warm(self, keys_or_profile_file):
+        """
+        Preloads the resolution caches with the sizes, in bulk (ie: at process startup).
+        Dynamic and numeric sizes are generated once here, into a memo apart from the Size Chart,
+        so the sizes listed by the Size Chart (and the Dynamic Size Cache setting) are unchanged.
+
+        note:: Invalid sizes are skipped, so a stale profile does not fail startup.
+
+        :param iterable keys_or_profile_file: The size keys (or tuples of size key and count),
+            or the path of a profile file (see `export_key_profile()`)
+        :return: The number of sizes warmed
+        :rtype int
+        """
+        if isinstance(keys_or_profile_file, (str, bytes)) or \
+           hasattr(keys_or_profile_file, '__fspath__'):
+            with open(keys_or_profile_file, encoding='utf-8') as profile_file:
+                keys_or_profile_file = json.load(profile_file)
+
+        warmed = 0
+        for size_key in keys_or_profile_file:
+            if isinstance(size_key, (list, tuple)):
+                size_key = size_key[0]
+            try:
+                self.intern_key(size_key)
+                size = self._get_or_create_size(size_key)       #Warming is not profiled
+            except ValueError:
+                continue
+            if size_key not in self.size_chart:
+                self._warmed_sizes[size_key] = size
+            warmed += 1
+
+        return warmed
+
     def set_formatting_options(self, formatting_options):
         """
         Override the Formatting options for the Size Chart
@@ -333,6 +1232,44 @@ class SizeChart():
 
         #In case only single option is passed in, we merge
         self.formatting_options.update(formatting_options)
+        self._formatted_sizes.clear()
+        self._generated_ranges.clear()
+
+    def format_size(self, size_key):
+        """
+        Formats the size per the Formatting Options.
+        Memoized (up to FORMATTED_SIZES_MAX sizes) until the Formatting Options are changed
+        by `set_formatting_options()`.
+
+        :param str size_key: The size key to format
+        :return: The formatted size
+        :rtype str
+
+        :raises ValueError: If an invalid size is passed in.
+        """
+        formatted = self._formatted_sizes.get(size_key)
+        if formatted is None:
+            size = self.get_or_create_size(size_key)
+            if size.is_dynamic_size:
+                formatted = (size.verbose if self.formatting_options['dynamic_size_verbose']
+                             else self.formatting_options['x_size_formatter'](size.key))
+            else:
+                formatted = size.verbose if self.formatting_options['verbose'] else size.key
+            _memoize(self._formatted_sizes, size_key, formatted, FORMATTED_SIZES_MAX)
+
+        return formatted
+
+    def format_sizes(self, size_keys):
+        """
+        Formats the sizes per the Formatting Options.
+
+        :param iterable size_keys: The size keys to format
+        :return: List of formatted sizes
+        :rtype list
+
+        :raises ValueError: If an invalid size is passed in.
+        """
+        return [self.format_size(size_key) for size_key in size_keys]
 
     def generate_lengthed_list(self, list_length=len(SIZE_CHART_DEFAULTS)):
         """
@@ -345,16 +1282,15 @@ class SizeChart():
 
         :param int list_length: The length of the size list to generate
             Default - len(SIZE_CHART_DEFAULTS) (5)
-            Maximum length is SizeChart.MAX_SIZE_CHART_LENGTH
+            Unlimited, unless the DynOps have a max_prefix
         :return: List of sizes of specified length per formatting options
         :rtype list
 
-        :raises ValueError If the list_length exceeds the Maximum
+        :raises ValueError If the list_length exceeds the sizes available
+            (per the DynOp max_prefix limits)
         """
         if list_length is None:  #For Pytest parameter hack
             list_length = len(SIZE_CHART_DEFAULTS)
-        elif list_length > SizeChart.MAX_SIZE_CHART_LENGTH:
-            raise ValueError('Length of list exceeds maximum length')
         
         ##TODO - Move this to Sorter class??
         sorted_sizes = [key for key,_ in sorted(self.size_chart.items(), key=lambda d: d[1])]
@@ -369,14 +1305,60 @@ class SizeChart():
             sorted_sizes[mid+1:len(sorted_sizes)-left_cnt]
 
         elif list_length > len(sorted_sizes):       #Will need to add
-            for cnt in range(0, max(left_cnt,right_cnt)):
-                if cnt < left_cnt:
-                    left = self._size_key_to_size(sorted_sizes[0])
-                    sorted_sizes.insert(0, left[0].previous_size_key)
-                right = self._size_key_to_size(sorted_sizes[-1])
-                sorted_sizes.insert(len(sorted_sizes), right[0].next_size_key)
+            #If one end runs out of sizes (limit or no DynOp), the other end makes up for it
+            left = list(islice(self.iter_down_from(sorted_sizes[0]), 1, left_cnt + 1))
+            right = list(islice(self.iter_up_from(sorted_sizes[-1]), 1,
+                                right_cnt + (left_cnt - len(left)) + 1))
+            if len(right) < addl_needed - len(left):
+                left = list(islice(self.iter_down_from(sorted_sizes[0]), 1,
+                                   addl_needed - len(right) + 1))
+            if len(left) + len(right) < addl_needed:
+                raise ValueError('Length of list exceeds the sizes available in Size Chart')
+
+            sorted_sizes = left[::-1] + sorted_sizes + right
+
+        return self.format_sizes(sorted_sizes)
+
+    def _iter_ranks_from(self, rank, direction):
+        """
+        Lazily iterates the size keys from the rank in the given direction, until the rank bounds.
+        Endless if the DynOp of that end has no max_prefix.
+
+        :param int rank: The rank to start from (included)
+        :param int direction: 1 to iterate up, -1 to iterate down
+        :return: Iterator of size keys
+        :rtype iterator
+        """
+        bound = self._max_rank if direction > 0 else self._min_rank
+        ranks = (count(rank, direction) if bound is None
+                 else range(rank, bound + direction, direction))
+        return (self.key_at_rank(rank) for rank in ranks)
+
+    def iter_up_from(self, size_key):
+        """
+        Lazily iterates the sizes from the size key (inclusive) upwards.
+        Endless if the largest size is dynamic without a DynOp max_prefix.
+
+        :param str size_key: The size key to start from
+        :return: Iterator of size keys
+        :rtype iterator
+
+        :raises ValueError: If the size key is invalid or has no rank
+        """
+        return self._iter_ranks_from(self.rank_of(size_key), 1)
 
-        return sorted_sizes
+    def iter_down_from(self, size_key):
+        """
+        Lazily iterates the sizes from the size key (inclusive) downwards.
+        Endless if the smallest size is dynamic without a DynOp max_prefix.
+
+        :param str size_key: The size key to start from
+        :return: Iterator of size keys
+        :rtype iterator
+
+        :raises ValueError: If the size key is invalid or has no rank
+        """
+        return self._iter_ranks_from(self.rank_of(size_key), -1)
 
     def generate_range_iter(self, start_range_key, end_range_key):
         """
@@ -385,25 +1367,27 @@ class SizeChart():
 
         :param str start_range_key: The start size (key) of the list
         :param str end_range_key: The end size (key) of the list
-        :return: List of sizes in the range
-        :rtype list
+        :return: Iterator of sizes in the range
+        :rtype iterator
 
         :raises ValueError: If the base of the range keys don't exist in the Size Chart
+        :raises ValueError: If the end of the range is not reachable from the start
         """
 
         #validate and get anchors
-        start_size = self.get_or_create_size(start_range_key)
-        self.get_or_create_size(end_range_key)  #To ensure its valid
+        self.get_or_create_size(start_range_key)
+        self.get_or_create_size(end_range_key)
 
-        next_size = start_size
-        yield start_size.key
+        try:
+            start_rank, end_rank = self.rank_of(start_range_key), self.rank_of(end_range_key)
+        except ValueError:
+            start_rank, end_rank = 0, -1
+        if end_rank < start_rank:
+            raise ValueError('End of range is not reachable from start of range: ' +
+                             str(end_range_key))
 
-        endless_loop_control = SizeChart.MAX_SIZE_CHART_LENGTH - 1
-
-        while next_size.key != end_range_key and endless_loop_control:
-            next_size = self.get_or_create_size(next_size.next_size_key)
-            yield next_size.key
-            endless_loop_control -= 1
+        for rank in range(start_rank, end_rank + 1):
+            yield self.format_size(self.key_at_rank(rank))
 
     def generate_range_list(self, start_range_key, end_range_key):
         """
@@ -418,3 +1402,65 @@ class SizeChart():
         :raises ValueError: If the base of the range keys don't exist in the Size Chart
         """
         return list(self.generate_range_iter(start_range_key, end_range_key))
+
+    def generate_ranges(self, pairs):
+        """
+        Generates the Sizes between each pair of start and end sizes (inclusive), in bulk.
+        Per Formatting Options.
+
+        note:: Each distinct endpoint is resolved once, and overlapping ranges are sliced from
+        one shared ordering. Ranges are memoized per pair (up to GENERATED_RANGES_MAX pairs,
+        until the formatting options change).
+
+        :param iterable pairs: Tuples of start and end size keys
+        :return: List of tuple of sizes in each range, in the order of the pairs
+        :rtype list
+
+        :raises ValueError: If the base of the range keys don't exist in the Size Chart
+        :raises ValueError: If the end of a range is not reachable from its start
+        """
+        pairs = [tuple(pair) for pair in pairs]
+        ranges, rank_memo, spans = {}, {}, {}   #pair => sizes, size key => rank, pair => span
+
+        for pair in pairs:
+            if pair in ranges or pair in spans:
+                continue
+            generated = self._generated_ranges.get(pair)
+            if generated is not None:
+                ranges[pair] = generated
+                continue
+
+            for size_key in pair:
+                if size_key not in rank_memo:
+                    self.get_or_create_size(size_key)       #validate
+                    try:
+                        rank_memo[size_key] = self.rank_of(size_key)
+                    except ValueError:
+                        rank_memo[size_key] = None
+
+            start_rank, end_rank = rank_memo[pair[0]], rank_memo[pair[1]]
+            if start_rank is None or end_rank is None or end_rank < start_rank:
+                raise ValueError('End of range is not reachable from start of range: ' +
+                                 str(pair[1]))
+            spans[pair] = (start_rank, end_rank)
+
+        #Overlapping spans are merged, so each size is formatted once per merged span
+        merged = []     #list of [low rank, high rank, pairs]
+        for pair, (start_rank, end_rank) in sorted(spans.items(), key=lambda item: item[1]):
+            if merged and start_rank <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end_rank)
+                merged[-1][2].append(pair)
+            else:
+                merged.append([start_rank, end_rank, [pair]])
+
+        for low_rank, high_rank, span_pairs in merged:
+            ordering = [self.format_size(self.key_at_rank(rank))
+                        for rank in range(low_rank, high_rank + 1)]
+            for pair in span_pairs:
+                start_rank, end_rank = spans[pair]
+                ranges[pair] = _memoize(self._generated_ranges, pair,
+                                        tuple(ordering[start_rank - low_rank:
+                                                       end_rank - low_rank + 1]),
+                                        GENERATED_RANGES_MAX)
+
+        return [ranges[pair] for pair in pairs]
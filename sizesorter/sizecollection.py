@@ -0,0 +1,186 @@
+"""
+Sorted multiset of sizes
+"""
+
+from bisect import bisect_left, bisect_right
+
+from .sizechart import SizeChart
+
+class SortedSizeCollection():
+    """
+    Keeps size keys ordered by their Size Chart sort value.
+    Lookups are O(log N) via bisect over a parallel list of sort values.
+
+    note:: Keys are stored as the Size Chart's key (ie: '1XL' is stored as 'XL')
+    """
+
+    def __init__(self, size_chart=None, iterable=None):
+        """
+        Initializes a sorted collection for the given Size Chart
+
+        :param SizeChart size_chart: The Size Chart to order sizes by
+            Default - A SizeChart built from the defaults
+        :param iterable iterable: Size keys to initially add
+            Default - None (Empty collection)
+
+        :raises ValueError: If an invalid size is in the iterable
+        """
+        self.size_chart = size_chart if size_chart else SizeChart()
+
+        self._resolved = {}      #size key => (chart key, sort value)
+        self._keys = []
+        self._sort_values = []
+
+        if iterable:
+            self.update(iterable)
+
+    def _resolve(self, size_key):
+        """
+        Resolves the size key to its chart key and sort value (once per distinct key)
+
+        :param str size_key: The size key to resolve
+        :return: The chart key and sort value
+        :rtype tpl(str, Number)
+
+        :raises ValueError: If an invalid size is passed in
+        """
+        resolved = self._resolved.get(size_key)
+        if resolved is None:
+            size = self.size_chart.get_or_create_size(size_key)
+            resolved = self._resolved[size_key] = (size.key, size.sort_value)
+        return resolved
+
+    def _find(self, size_key):
+        """
+        Finds the index of the size in the collection
+
+        :param str size_key: The size key to find
+        :return: The index of the size, or -1 if not in collection
+        :rtype int
+        """
+        key, sort_value = self._resolve(size_key)
+        lo = bisect_left(self._sort_values, sort_value)
+        hi = bisect_right(self._sort_values, sort_value, lo)
+        for idx in range(lo, hi):
+            if self._keys[idx] == key:
+                return idx
+        return -1
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(self._keys)
+
+    def __contains__(self, size_key):
+        return self._find(size_key) > -1
+
+    def __getitem__(self, index):
+        return self._keys[index]
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._keys)
+
+    def add(self, size_key):
+        """
+        Adds the size to the collection, after any equal sizes
+
+        :param str size_key: The size key to add
+
+        :raises ValueError: If an invalid size is passed in
+        """
+        key, sort_value = self._resolve(size_key)
+        idx = bisect_right(self._sort_values, sort_value)
+        self._sort_values.insert(idx, sort_value)
+        self._keys.insert(idx, key)
+
+    def update(self, iterable):
+        """
+        Adds all sizes of the iterable to the collection
+
+        :param iterable iterable: The size keys to add
+
+        :raises ValueError: If an invalid size is in the iterable
+        """
+        for size_key in iterable:
+            self.add(size_key)
+
+    def remove(self, size_key):
+        """
+        Removes one occurrence of the size from the collection
+
+        :param str size_key: The size key to remove
+
+        :raises ValueError: If the size is not in the collection or is invalid
+        """
+        idx = self._find(size_key)
+        if idx < 0:
+            raise ValueError('Size not in collection: ' + str(size_key))
+        del self._sort_values[idx]
+        del self._keys[idx]
+
+    def discard(self, size_key):
+        """
+        Removes one occurrence of the size from the collection if present
+
+        :param str size_key: The size key to remove
+
+        :raises ValueError: If the size is invalid
+        """
+        idx = self._find(size_key)
+        if idx > -1:
+            del self._sort_values[idx]
+            del self._keys[idx]
+
+    def count(self, size_key):
+        """
+        Counts the occurrences of the size in the collection
+
+        :param str size_key: The size key to count
+        :return: The number of occurrences
+        :rtype int
+
+        :raises ValueError: If the size is invalid
+        """
+        key, sort_value = self._resolve(size_key)
+        lo = bisect_left(self._sort_values, sort_value)
+        hi = bisect_right(self._sort_values, sort_value, lo)
+        return self._keys[lo:hi].count(key)
+
+    def counts(self):
+        """
+        Counts the occurrences of each size in the collection
+
+        :return: List of size key and count, in size order
+        :rtype list
+        """
+        counts = []
+        for key in self._keys:
+            if counts and counts[-1][0] == key:
+                counts[-1][1] += 1
+            else:
+                counts.append([key, 1])
+        return [tuple(count) for count in counts]
+
+    def irange(self, start_size_key=None, end_size_key=None):
+        """
+        Iterates the sizes between the two sizes (inclusive)
+
+        :param str start_size_key: The smallest size to include
+            Default - None (From the smallest size)
+        :param str end_size_key: The largest size to include
+            Default - None (To the largest size)
+        :return: Iterator of size keys in size order
+        :rtype iterator
+
+        :raises ValueError: If either size is invalid
+        """
+        lo, hi = 0, len(self._keys)
+        if start_size_key is not None:
+            lo = bisect_left(self._sort_values, self._resolve(start_size_key)[1])
+        if end_size_key is not None:
+            hi = bisect_right(self._sort_values, self._resolve(end_size_key)[1])
+        return (self._keys[idx] for idx in range(lo, hi))
@@ -0,0 +1,150 @@
+"""
+Compact column of sizes, stored as their Size Chart ranks
+"""
+
+from array import array
+
+from .sizechart import SizeChart
+
+"""Type code of the rank array (signed 16 bit, as dynamic sizes rank below 0)"""
+RANK_TYPECODE = 'h'
+
+class SizeColumn():
+    """
+    Holds sizes (ie: per SKU) as Size Chart ranks in an `array('h')`, 2 bytes per size.
+    Ranks compare in Size Chart order, so sorting and filtering never resolve sizes again.
+
+    note:: Sizes are decoded to the Size Chart's key (ie: '1XL' decodes as 'XL').
+        Only sizes with a rank can be stored (see `SizeChart.rank_of()`).
+    """
+
+    def __init__(self, size_chart=None, iterable=None):
+        """
+        Initializes a size column for the given Size Chart
+
+        :param SizeChart size_chart: The Size Chart ranking the sizes
+            Default - A SizeChart built from the defaults
+        :param iterable iterable: Size keys to initially append
+            Default - None (Empty column)
+
+        :raises ValueError: If a size is invalid or has no rank
+        """
+        self.size_chart = size_chart if size_chart else SizeChart()
+        self.ranks = array(RANK_TYPECODE)
+
+        if iterable:
+            self.extend(iterable)
+
+    @classmethod
+    def _from_ranks(cls, size_chart, ranks):
+        """Creates a column holding the ranks (not copied)"""
+        column = cls(size_chart)
+        column.ranks = ranks
+        return column
+
+    def _encode(self, iterable):
+        """
+        Converts the size keys to ranks, resolving each distinct size key once
+
+        :raises ValueError: If a size is invalid, has no rank or its rank does not fit
+        """
+        ranks, rank_memo = array(RANK_TYPECODE), {}
+        for size_key in iterable:
+            rank = rank_memo.get(size_key)
+            if rank is None:
+                rank = rank_memo[size_key] = self.size_chart.rank_of(size_key)
+            try:
+                ranks.append(rank)
+            except OverflowError:
+                raise ValueError('Size rank does not fit in the column: ' + str(size_key))
+        return ranks
+
+    def append(self, size_key):
+        """
+        Appends the size to the column
+
+        :param str size_key: The size key
+
+        :raises ValueError: If the size is invalid or has no rank
+        """
+        self.ranks.extend(self._encode((size_key,)))
+
+    def extend(self, iterable):
+        """
+        Appends the sizes to the column
+
+        :param iterable iterable: The size keys
+
+        :raises ValueError: If a size is invalid or has no rank (nothing is appended)
+        """
+        self.ranks.extend(self._encode(iterable))
+
+    def __len__(self):
+        return len(self.ranks)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self._from_ranks(self.size_chart, self.ranks[idx])
+        return self.size_chart.key_at_rank(self.ranks[idx])
+
+    def __iter__(self):
+        return iter(self.to_keys())
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.to_keys())
+
+    def to_keys(self):
+        """
+        Decodes the column back to size keys
+
+        :return: The size keys, in column order
+        :rtype list
+        """
+        key_memo = {}
+        keys = []
+        for rank in self.ranks:
+            key = key_memo.get(rank)
+            if key is None:
+                key = key_memo[rank] = self.size_chart.key_at_rank(rank)
+            keys.append(key)
+        return keys
+
+    def sort(self, reverse=False):
+        """
+        Sorts the column in place by Size Chart order
+
+        :param boolean reverse: Whether to sort descending
+            Default - False
+        """
+        self.ranks = array(RANK_TYPECODE, sorted(self.ranks, reverse=reverse))
+
+    def argsort(self, reverse=False):
+        """
+        Finds the indices which would sort the column. Stable.
+
+        :param boolean reverse: Whether to sort descending
+            Default - False
+        :return: The indices of the column in sorted order
+        :rtype list
+        """
+        return sorted(range(len(self.ranks)), key=self.ranks.__getitem__, reverse=reverse)
+
+    def filter_range(self, start_key=None, end_key=None):
+        """
+        Filters the column to the sizes between the start and end sizes (inclusive)
+
+        :param str start_key: The smallest size to keep
+            Default - None (No lower bound)
+        :param str end_key: The largest size to keep
+            Default - None (No upper bound)
+        :return: A new column of the sizes in range, in column order
+        :rtype SizeColumn
+
+        :raises ValueError: If a bound is invalid or has no rank
+        """
+        lo = self.size_chart.rank_of(start_key) if start_key is not None else None
+        hi = self.size_chart.rank_of(end_key) if end_key is not None else None
+        ranks = array(RANK_TYPECODE, (rank for rank in self.ranks
+                                      if (lo is None or rank >= lo) and
+                                         (hi is None or rank <= hi)))
+        return self._from_ranks(self.size_chart, ranks)
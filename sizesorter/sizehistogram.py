@@ -0,0 +1,178 @@
+"""
+Distribution of sizes (counts per size) in Size Chart order
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+
+class SizeHistogram():
+    """
+    Counts (or weights) per size, held in a list indexed by the Size Chart rank of the size.
+    Dynamic sizes beyond the ends of the Size Chart are counted in a map by rank, so a far
+    dynamic size (ie: 3000000XL) costs one entry.
+
+    Histograms of the same Size Chart (ie: from parallel shards) can be merged.
+    """
+
+    def __init__(self, size_chart):
+        """
+        Initializes an empty histogram for the given Size Chart
+
+        :param SizeChart size_chart: The Size Chart ranking the sizes
+        """
+        self.size_chart = size_chart
+        self._counts = [0] * len(size_chart.chart_ranks)
+        self._dynamic_counts = {}       #rank => count, beyond the ends of the Size Chart
+
+    def _count(self, rank, weight):
+        if 0 <= rank < len(self._counts):
+            self._counts[rank] += weight
+        else:
+            self._dynamic_counts[rank] = self._dynamic_counts.get(rank, 0) + weight
+
+    def _rank_counts(self):
+        """
+        Lists the ranks counted and their counts
+
+        :return: List of tuple of rank and count, in rank order
+        :rtype list
+        """
+        dynamic = sorted(item for item in self._dynamic_counts.items() if item[1])
+        split = bisect_left(dynamic, (0,))
+        return (dynamic[:split] +
+                [(rank, count) for rank, count in enumerate(self._counts) if count] +
+                dynamic[split:])
+
+    def update(self, iterable, weights=None):
+        """
+        Counts the sizes of the iterable. Each distinct size key is only ranked once.
+
+        :param iterable iterable: The size keys to count
+        :param iterable weights: The weight of each size key (ie: quantity sold)
+            Default - None (Each size key counts 1)
+        :return: The histogram (for chaining)
+        :rtype SizeHistogram
+
+        :raises ValueError: If a size is invalid or has no rank in the Size Chart,
+            or there is not one weight per size key (nothing is counted)
+        """
+        ranks, rank_memo = array('l'), {}
+        for size_key in iterable:
+            rank = rank_memo.get(size_key)
+            if rank is None:
+                rank = rank_memo[size_key] = self.size_chart.rank_of(size_key)
+            ranks.append(rank)
+
+        if weights is None:
+            weights = repeat(1, len(ranks))
+        else:
+            weights = list(weights)
+            if len(weights) != len(ranks):
+                raise ValueError('Weights must be one per size: {} weights for {} sizes'.format(
+                                 len(weights), len(ranks)))
+
+        for rank, weight in zip(ranks, weights):
+            self._count(rank, weight)
+
+        return self
+
+    def add(self, size_key, weight=1):
+        """
+        Counts the size
+
+        :param str size_key: The size key to count
+        :param Number weight: The weight of the size key
+            Default - 1
+
+        :raises ValueError: If the size is invalid or has no rank in the Size Chart
+        """
+        self.update((size_key,), (weight,))
+
+    def __getitem__(self, size_key):
+        rank = self.size_chart.rank_of(size_key)
+        return (self._counts[rank] if 0 <= rank < len(self._counts)
+                else self._dynamic_counts.get(rank, 0))
+
+    def __len__(self):
+        """Number of sizes counted"""
+        return len(self._rank_counts())
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    @property
+    def total(self):
+        return sum(self._counts) + sum(self._dynamic_counts.values())
+
+    def items(self):
+        """
+        Lists the sizes counted and their counts
+
+        :return: List of tuple of size key and count, in Size Chart order
+        :rtype list
+        """
+        return [(self.size_chart.key_at_rank(rank), count) for rank, count in self._rank_counts()]
+
+    def cumulative(self):
+        """
+        Lists the sizes counted and their cumulative counts
+
+        :return: List of tuple of size key and cumulative count, in Size Chart order
+        :rtype list
+        """
+        cumulative, running = [], 0
+        for key, count in self.items():
+            running += count
+            cumulative.append((key, running))
+        return cumulative
+
+    def percentile_size(self, q):
+        """
+        Finds the smallest size at or below which q percent of the counts fall
+
+        :param Number q: The percentile, between 0 and 100
+        :return: The size key
+        :rtype str
+
+        :raises ValueError: If q is not between 0 and 100 or the histogram is empty
+        """
+        if not 0 <= q <= 100:
+            raise ValueError('Percentile must be between 0 and 100')
+        total = self.total
+        if not total:
+            raise ValueError('Histogram is empty')
+
+        threshold, running = total * q / 100, 0
+        for rank, count in self._rank_counts():
+            running += count
+            if running >= threshold:
+                return self.size_chart.key_at_rank(rank)
+
+    def merge(self, other):
+        """
+        Adds the counts of the other histogram (ie: from a parallel shard) to this histogram
+
+        :param SizeHistogram other: The histogram to merge in
+        :return: The histogram (for chaining)
+        :rtype SizeHistogram
+
+        :raises ValueError: If the histograms are not of the same Size Chart
+        """
+        if other.size_chart is not self.size_chart:
+            definition, other_definition = (self.size_chart.to_definition(),
+                                            other.size_chart.to_definition())
+            if (definition['sizes'], definition['dyn_ops']) != \
+               (other_definition['sizes'], other_definition['dyn_ops']):
+                raise ValueError('Histograms must be of the same Size Chart')
+
+        for rank, count in enumerate(other._counts):
+            self._counts[rank] += count
+        for rank, count in other._dynamic_counts.items():
+            self._count(rank, count)
+
+        return self
+
+    def __add__(self, other):
+        merged = SizeHistogram(self.size_chart)
+        return merged.merge(self).merge(other)
@@ -0,0 +1,252 @@
+"""
+On-disk index of record offsets grouped by size, for range queries without scanning the records
+"""
+
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .fileformat import detect_format
+
+"""Header of the index file: magic, version and number of groups"""
+INDEX_HEADER = struct.Struct('<4sHQ')
+INDEX_MAGIC = b'SZIX'
+INDEX_VERSION = 2
+
+"""Ranks of the groups are stored as little-endian signed 64 bit"""
+RANK_STRUCT = struct.Struct('<q')
+
+"""Offsets (and group pointers) are stored as little-endian unsigned 64 bit"""
+OFFSET_STRUCT = struct.Struct('<Q')
+
+
+def _little_endian(offsets):
+    """Converts the array of offsets between native and little-endian byte order (in place)"""
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    return offsets
+
+
+def iter_line_offsets(data_path, column, file_format=None):
+    """
+    Reads the size and byte offset of each record of a CSV or JSONL file.
+    Records must be one per line (CSV fields with line breaks are not supported).
+
+    :param str data_path: Path to the CSV or JSONL file
+    :param str column: Name of the size column/field
+    :param str file_format: 'csv' or 'jsonl'
+        Default - None (From the file extension, else csv)
+    :return: Iterator of tuple of size key and byte offset of the record
+    :rtype iterator
+
+    :raises ValueError: If the size column is missing
+    """
+    if file_format is None:
+        file_format = detect_format(data_path)
+
+    with open(data_path, 'rb') as data_file:
+        offset, column_idx = 0, None
+        for line in data_file:
+            line_offset, offset = offset, offset + len(line)
+            text = line.decode('utf-8')
+            if not text.strip():
+                continue
+
+            if file_format == 'jsonl':
+                record = json.loads(text)
+                if column not in record:
+                    raise ValueError('Size field not in record: ' + text.strip())
+                yield (record[column], line_offset)
+                continue
+
+            row = next(csv.reader([text]))
+            if column_idx is None:          #Header
+                if column not in row:
+                    raise ValueError('Size column not in CSV header: ' + column)
+                column_idx = row.index(column)
+            elif len(row) <= column_idx:
+                raise ValueError('Size column missing at offset {}'.format(line_offset))
+            else:
+                yield (row[column_idx], line_offset)
+
+
+def build_size_index(records, size_chart, index_path):
+    """
+    Builds the index file, grouping the record offsets by the Size Chart rank of their size.
+    Only the ranks present are stored, each with the pointer to its group of offsets
+    (CSR layout). Groups are in rank order, offsets in record order within a group.
+    The index file is replaced atomically.
+
+    :param iterable records: Tuples of size key and record offset
+    :param SizeChart size_chart: The Size Chart ranking the sizes
+    :param str index_path: Path of the index file to write
+    :return: The number of records indexed
+    :rtype int
+
+    :raises ValueError: If a size is invalid or has no rank in the Size Chart
+    """
+    groups, rank_memo = {}, {}          #rank => array of offsets, size key => rank
+    for size_key, offset in records:
+        rank = rank_memo.get(size_key)
+        if rank is None:
+            rank = rank_memo[size_key] = size_chart.rank_of(size_key)
+        group = groups.get(rank)
+        if group is None:
+            group = groups[rank] = array('Q')
+        group.append(offset)
+
+    ranks = sorted(groups)
+
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'wb') as index_file:
+        index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(ranks)))
+        index_file.write(_little_endian(array('q', ranks)).tobytes())
+
+        pointers, total = array('Q', [0]), 0
+        for rank in ranks:
+            total += len(groups[rank])
+            pointers.append(total)
+        index_file.write(_little_endian(pointers).tobytes())
+
+        for rank in ranks:
+            index_file.write(_little_endian(groups[rank]).tobytes())
+    os.replace(temp_path, index_path)
+
+    return total
+
+
+class SizeIndex():
+    """
+    Memory-mapped index of record offsets grouped by Size Chart rank (see `build_size_index()`).
+    Range queries binary search the start/end ranks in the ranks present, which bound a single
+    contiguous slice of the offsets, so nothing is scanned.
+
+    note:: The index must be opened with the Size Chart it was built with.
+    """
+
+    def __init__(self, index_path, size_chart):
+        """
+        Opens the index file
+
+        :param str index_path: Path to the index file
+        :param SizeChart size_chart: The Size Chart the index was built with
+
+        :raises ValueError: If the file is not a size index
+        """
+        self.size_chart = size_chart
+
+        with open(index_path, 'rb') as index_file:
+            header = index_file.read(INDEX_HEADER.size)
+            if len(header) < INDEX_HEADER.size:
+                raise ValueError('Not a size index file: ' + index_path)
+            magic, version, group_count = INDEX_HEADER.unpack(header)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError('Not a size index file: ' + index_path)
+
+            rank_bytes = index_file.read(group_count * RANK_STRUCT.size)
+            if len(rank_bytes) < group_count * RANK_STRUCT.size:
+                raise ValueError('Not a size index file: ' + index_path)
+            self._ranks = _little_endian(array('q', rank_bytes))     #One per size present
+
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._pointers_start = INDEX_HEADER.size + group_count * RANK_STRUCT.size
+        self._offsets_start = self._pointers_start + (group_count + 1) * OFFSET_STRUCT.size
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _pointer(self, group):
+        """Position (in offsets) of the start of the group"""
+        return OFFSET_STRUCT.unpack_from(self._mmap,
+                                         self._pointers_start + group * OFFSET_STRUCT.size)[0]
+
+    def __len__(self):
+        """Number of records indexed"""
+        return self._pointer(len(self._ranks))
+
+    def _span(self, start_key, end_key):
+        """
+        Translates the sizes to the span of the offsets of the records between them
+
+        :return: Tuple of the start and end positions in the offsets
+        :rtype tuple(int, int)
+        """
+        lo = (bisect_left(self._ranks, self.size_chart.rank_of(start_key))
+              if start_key is not None else 0)
+        hi = (bisect_right(self._ranks, self.size_chart.rank_of(end_key))
+              if end_key is not None else len(self._ranks))
+
+        if lo >= hi:
+            return (0, 0)
+        return (self._pointer(lo), self._pointer(hi))
+
+    def count_between(self, start_key=None, end_key=None):
+        """
+        Counts the records with a size between the start and end sizes (inclusive)
+
+        :param str start_key: The smallest size
+            Default - None (No lower bound)
+        :param str end_key: The largest size
+            Default - None (No upper bound)
+        :return: The number of records
+        :rtype int
+
+        :raises ValueError: If a bound is invalid or has no rank
+        """
+        start, end = self._span(start_key, end_key)
+        return end - start
+
+    def offsets_between(self, start_key=None, end_key=None):
+        """
+        Finds the offsets of the records with a size between the start and end sizes (inclusive)
+
+        :param str start_key: The smallest size
+            Default - None (No lower bound)
+        :param str end_key: The largest size
+            Default - None (No upper bound)
+        :return: The record offsets, in size order (record order within a size)
+        :rtype array
+
+        :raises ValueError: If a bound is invalid or has no rank
+        """
+        start, end = self._span(start_key, end_key)
+        offsets = array('Q')
+        offsets.frombytes(self._mmap[self._offsets_start + start * OFFSET_STRUCT.size:
+                                     self._offsets_start + end * OFFSET_STRUCT.size])
+        return _little_endian(offsets)
+
+    def records_between(self, data_path, start_key=None, end_key=None):
+        """
+        Reads the records (lines) with a size between the start and end sizes (inclusive)
+
+        :param str data_path: Path to the indexed CSV or JSONL file
+        :param str start_key: The smallest size
+            Default - None (No lower bound)
+        :param str end_key: The largest size
+            Default - None (No upper bound)
+        :return: Iterator of the records, in size order
+        :rtype iterator
+
+        :raises ValueError: If a bound is invalid or has no rank
+        """
+        offsets = self.offsets_between(start_key, end_key)
+
+        def _records():
+            with open(data_path, 'rb') as data_file:
+                for offset in offsets:
+                    data_file.seek(offset)
+                    yield data_file.readline().decode('utf-8')
+
+        return _records()
@@ -2,13 +2,199 @@
 Worker module class for sorting sizes
 """
 
+import heapq
+from itertools import islice
+from operator import itemgetter
+
+from .sizechart import SizeChart, from_x_notation, to_x_notation
+
+"""Number of size keys resolved per batch, whose memo hits are profiled at once"""
+KEY_BATCH_SIZE = 4096
+
 class SizeSorter:
     """
     Sorts an iterable by apparal size
     """
 
-    def __init__(self, size_chart_values=None):
-        pass
+    def __init__(self, size_chart=None):
+        """
+        Initializes a sorter for the given Size Chart
+
+        :param SizeChart size_chart: The Size Chart to resolve sizes against
+            Default - A SizeChart built from the defaults (on first use)
+        """
+        self._size_chart = size_chart
+
+    @property
+    def size_chart(self):
+        if self._size_chart is None:
+            self._size_chart = SizeChart()
+        return self._size_chart
+
+    def sort_records(self, records, keys=None, size_field='size', chart_field=None,
+                     size_charts=None, reverse=False):
+        """
+        Sorts records (mappings) by a composite key where one of the fields is a size.
+        The composite sort tuple is built once per record and the sort is stable.
+
+        note:: Each distinct (chart, size key) pair is resolved only once per call
+        (the other occurrences are profiled in bulk, see `SizeChart.count_keys()`).
+        Unknown size keys are resolved per the unknown key policy of the Size Chart
+        (see `SizeChart.set_unknown_key_policy()`), records with skipped sizes are dropped.
+
+        :param iterable records: The records to sort. Fields are accessed by `record[field]`
+        :param list keys: The fields to sort by, in priority order
+            Default - [size_field]
+        :param str size_field: The field in `keys` holding the size key
+            Default - 'size'
+        :param str chart_field: The field holding the name of the Size Chart to use per record
+            Default - None (Always use the sorter's Size Chart)
+        :param dict size_charts: Map of chart names (values of chart_field) to SizeChart
+            Records whose chart name is not in the map use the sorter's Size Chart
+        :param boolean reverse: Whether to sort descending
+            Default - False
+        :return: The sorted records
+        :rtype list
+
+        :raises ValueError: If size_field is not one of the keys
+        :raises ValueError: If an invalid size is in one of the records (and the policy is to raise)
+        """
+        keys = list(keys) if keys else [size_field]
+        if size_field not in keys:
+            raise ValueError('size_field must be one of the sort keys')
+
+        size_index = keys.index(size_field)
+        size_charts = size_charts if size_charts else {}
+        sort_values = {}     #(id(chart), size key) => sort value (None if skipped)
+        resolved = {}        #id(chart) => tuple of chart and its size keys resolved
+
+        def _chart_of(record):
+            return (size_charts.get(record[chart_field], self.size_chart)
+                    if chart_field else self.size_chart)
+
+        decorated = []
+        for record in records:
+            composite = [record[key] for key in keys]
+
+            chart = _chart_of(record)
+            size_key = composite[size_index]
+            cache_key = (id(chart), size_key)
+            try:
+                sort_value = sort_values[cache_key]
+            except KeyError:
+                size = chart.resolve_size(size_key)
+                sort_value = sort_values[cache_key] = None if size is None else size.sort_value
+                resolved.setdefault(id(chart), (chart, []))[1].append(size_key)
+
+            if sort_value is not None:
+                composite[size_index] = sort_value
+                decorated.append((tuple(composite), record))
+
+        for chart, chart_keys in resolved.values():
+            chart.count_keys((record[size_field] for _, record in decorated
+                              if _chart_of(record) is chart), chart_keys)
+
+        decorated.sort(key=itemgetter(0), reverse=reverse)
+        return [record for _, record in decorated]
+
+    def _decorated(self, iterable):
+        """
+        Pairs each size key with its sort value (resolved once per size key in the iterable),
+        leaving out the size keys skipped by the unknown key policy.
+        Size keys are read in batches of KEY_BATCH_SIZE, whose occurrences are profiled at once
+        (see `SizeChart.count_keys()`).
+
+        :return: Iterator of tuple of sort value and size key
+        :rtype iterator
+        """
+        size_chart, sort_values = self.size_chart, {}   #size key => sort value (None if skipped)
+        iterator = iter(iterable)
+
+        batch = list(islice(iterator, KEY_BATCH_SIZE))
+        while batch:
+            resolved = []
+            for size_key in batch:
+                try:
+                    sort_value = sort_values[size_key]
+                except KeyError:
+                    size = size_chart.resolve_size(size_key)
+                    sort_value = sort_values[size_key] = (None if size is None
+                                                          else size.sort_value)
+                    resolved.append(size_key)
+                if sort_value is not None:
+                    yield (sort_value, size_key)
+
+            size_chart.count_keys(batch, resolved)
+            batch = list(islice(iterator, KEY_BATCH_SIZE))
+
+    def sort(self, iterable, reverse=False):
+        """
+        Sorts the sizes by the Size Chart. Stable.
+        Sizes skipped by the unknown key policy of the Size Chart are left out.
+
+        :param iterable iterable: The size keys
+        :param boolean reverse: Whether to sort descending
+            Default - False
+        :return: The sorted size keys
+        :rtype list
+
+        :raises ValueError: If an invalid size is in the iterable (and the policy is to raise)
+        """
+        decorated = list(self._decorated(iterable))
+        decorated.sort(key=itemgetter(0), reverse=reverse)
+        return [size_key for _, size_key in decorated]
+
+    def nsmallest(self, k, iterable):
+        """
+        Returns the k smallest sizes without sorting the whole iterable. O(N log K)
+
+        :param int k: The number of sizes to return
+        :param iterable iterable: The size keys
+        :return: The k smallest size keys, smallest first
+        :rtype list
+
+        :raises ValueError: If an invalid size is in the iterable
+        """
+        return [size_key for _, size_key in
+                heapq.nsmallest(k, self._decorated(iterable), key=itemgetter(0))]
+
+    def nlargest(self, k, iterable):
+        """
+        Returns the k largest sizes without sorting the whole iterable. O(N log K)
+
+        :param int k: The number of sizes to return
+        :param iterable iterable: The size keys
+        :return: The k largest size keys, largest first
+        :rtype list
+
+        :raises ValueError: If an invalid size is in the iterable
+        """
+        return [size_key for _, size_key in
+                heapq.nlargest(k, self._decorated(iterable), key=itemgetter(0))]
+
+    def min_size(self, iterable):
+        """
+        Returns the smallest size of the iterable. O(N)
+
+        :param iterable iterable: The size keys
+        :return: The smallest size key
+        :rtype str
+
+        :raises ValueError: If the iterable is empty or an invalid size is in the iterable
+        """
+        return min(self._decorated(iterable), key=itemgetter(0))[1]
+
+    def max_size(self, iterable):
+        """
+        Returns the largest size of the iterable. O(N)
+
+        :param iterable iterable: The size keys
+        :return: The largest size key
+        :rtype str
+
+        :raises ValueError: If the iterable is empty or an invalid size is in the iterable
+        """
+        return max(self._decorated(iterable), key=itemgetter(0))[1]
 
 
     @staticmethod
@@ -33,8 +219,7 @@ class SizeSorter:
         assert size[:-2].isnumeric(), 'Size must be numeric'
         assert size[-2:] in ['XS','XL'], 'Size must end in XS/XL'   #TODO
 
-        numeric, suffix = int(size[:-2]), size[-1]
-        return 'X'*numeric + suffix
+        return to_x_notation(size)
 
     @staticmethod
     def _x_to_numeric(size):
@@ -58,7 +243,6 @@ class SizeSorter:
         assert size.isalpha(), 'Size must be all alpha characters'
         assert size[-2:] in ['XS','XL'], 'Size must end in XS/XL'   #TODO
 
-        length_x, suffix = len(size[:-1]), size[-2:]   #[:-1] to catch final X
-        return (str(length_x) if length_x > 1 else '') + suffix
+        return from_x_notation(size)
 
 
@@ -0,0 +1,74 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import SizeChart
+from sizesorter.categorical import _ordered_categories
+
+SIZES = ['L', 'M', '3XL', None, 'S', '1XL', 'M', 'XL', '2XS']
+
+def test_ordered_categories():
+    size_chart = SizeChart()
+    categories, codes = _ordered_categories(size_chart, ['L', 'M', '3XL', None, float('nan'),
+                                                          '1XL', 'XL', '2XS'])
+    assert categories == ['2XS', 'M', 'L', 'XL', '3XL']
+    assert codes == [2, 1, 4, -1, -1, 3, 3, 0]
+
+    size_chart.set_unknown_key_policy('skip')
+    assert _ordered_categories(size_chart, ['M', 'B']) == (['M'], [0, -1])
+
+    with pytest.raises(ValueError) as ee:
+        _ordered_categories(SizeChart(), ['M', 'B'])
+    assert str(ee.value).find('Base size not') > -1
+
+def test_to_pandas_categorical():
+    pd = pytest.importorskip('pandas')
+
+    categorical = SizeChart().to_pandas_categorical(pd.Series(SIZES))
+    assert categorical.ordered
+    assert list(categorical.categories) == ['2XS', 'S', 'M', 'L', 'XL', '3XL']
+    assert list(categorical.codes) == [3, 2, 5, -1, 1, 4, 2, 4, 0]
+    assert categorical.min() == '2XS'
+    assert categorical.max() == '3XL'
+
+    series = pd.Series(categorical).sort_values(na_position='last')
+    assert list(series.dropna()) == ['2XS', 'S', 'M', 'M', 'L', 'XL', 'XL', '3XL']
+
+    assert list(SizeChart().to_pandas_categorical(iter(['M', 'S'])).categories) == ['S', 'M']
+
+    size_chart = SizeChart()
+    size_chart.enable_key_profiling()
+    profiled = size_chart.to_pandas_categorical(pd.Series(SIZES))
+    assert list(profiled.codes) == list(categorical.codes)
+    assert dict(size_chart.key_profile()) == {'M': 2, 'XL': 2, 'L': 1, '3XL': 1, 'S': 1, '2XS': 1}
+
+    strings = pd.Series(['S', pd.NA, 'M', 'S'], dtype='string')
+    assert list(size_chart.to_pandas_categorical(strings).codes) == [0, -1, 1, 0]
+    assert dict(size_chart.key_profile())['S'] == 3
+
+def test_to_arrow_dictionary():
+    pa = pytest.importorskip('pyarrow')
+
+    dictionary = SizeChart().to_arrow_dictionary(SIZES)
+    assert dictionary.type.ordered
+    assert dictionary.dictionary.to_pylist() == ['2XS', 'S', 'M', 'L', 'XL', '3XL']
+    assert dictionary.indices.to_pylist() == [3, 2, 5, None, 1, 4, 2, 4, 0]
+
+    chunked = pa.chunked_array([['M', 'S'], ['L']])
+    assert SizeChart().to_arrow_dictionary(chunked).to_pylist() == ['M', 'S', 'L']
+
+    size_chart = SizeChart()
+    size_chart.enable_key_profiling()
+    profiled = size_chart.to_arrow_dictionary(SIZES)
+    assert profiled.indices.to_pylist() == dictionary.indices.to_pylist()
+    assert dict(size_chart.key_profile()) == {'M': 2, 'XL': 2, 'L': 1, '3XL': 1, 'S': 1, '2XS': 1}
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_categorical.py'])
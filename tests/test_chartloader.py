@@ -0,0 +1,131 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import json
+import time
+
+import pytest
+
+from sizesorter import ReloadingSizeChart, SizeSorter, load_chart_file
+
+TOML_CHART = ('[sizes]\n'
+              'XS = 0\n'
+              'S = 4\n'
+              'M = { sort_value = 8, verbose = "Medium" }\n'
+              'XL = 16\n'
+              '\n'
+              '[dyn_ops]\n'
+              'XL = { sort_value_increment = 4, growth_direction = 1, max_prefix = 3 }\n'
+              'XS = [2, -1]\n')
+
+def _write(path, definition):
+    with open(path, 'w') as out:
+        out.write(definition if isinstance(definition, str) else json.dumps(definition))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))   #Always a new mtime
+    return path
+
+def test_load_chart_file(tmp_path):
+    pytest.importorskip('tomllib' if sys.version_info >= (3, 11) else 'tomli')
+
+    size_chart = load_chart_file(_write(str(tmp_path.joinpath('chart.toml')), TOML_CHART))
+    assert size_chart.generate_range_list('2XS', '3XL') == ['2XS', 'XS', 'S', 'M', 'XL', '2XL',
+                                                            '3XL']
+    assert size_chart.get_or_create_size('M').verbose == 'Medium'
+    assert size_chart.get_or_create_size('3XL').sort_value == 24
+
+@pytest.mark.parametrize("name, content, expected_error",
+    [('chart.json', '["XS", "S"]', 'not a map'),
+     ('chart.json', '{"sizes": {"S": 1', 'Expecting'),
+     ('chart.toml', 'sizes = [', 'Invalid'),
+     ('chart.json', '{"sizes": {"S": "small"}}', 'sort values must be Numbers'),
+    ],)
+def test_load_chart_file_exception(tmp_path, name, content, expected_error):
+    if name.endswith('.toml'):
+        pytest.importorskip('tomllib' if sys.version_info >= (3, 11) else 'tomli')
+
+    with pytest.raises(ValueError) as ee:
+        load_chart_file(_write(str(tmp_path.joinpath(name)), content))
+    assert str(ee.value).find(expected_error) > -1
+
+def test_reload(tmp_path):
+    chart_path = _write(str(tmp_path.joinpath('chart.json')),
+                        {'sizes': {'XS': 1, 'M': 2, 'XL': 3}})
+    charts = ReloadingSizeChart(chart_path,
+                                configure=lambda chart: chart.enable_dynamic_size_cache())
+    snapshot = charts.snapshot
+    assert snapshot._dynamic_size_cache
+    assert not charts.check()                               #Unchanged
+
+    _write(chart_path, {'sizes': {'XS': 1, 'M': 2, 'L': 3, 'XL': 4}})
+    assert charts.check()
+    assert charts.snapshot is not snapshot
+    assert charts.snapshot._dynamic_size_cache
+    assert SizeSorter(charts.snapshot).max_size(['XL', 'L']) == 'XL'
+    assert len(snapshot) == 3                               #In-flight readers keep their chart
+
+    snapshot = charts.snapshot
+    _write(chart_path, {'sizes': {'S': 'small'}})
+    assert not charts.check()
+    assert charts.snapshot is snapshot                      #Invalid definition is not swapped in
+    assert str(charts.last_error).find('sort values must be Numbers') > -1
+
+    os.remove(chart_path)
+    assert not charts.check()
+    assert not charts.reload()
+    assert isinstance(charts.last_error, OSError)
+    assert charts.snapshot is snapshot
+
+def test_reload_thread(tmp_path):
+    chart_path = _write(str(tmp_path.joinpath('chart.json')), {'sizes': {'XS': 1, 'XL': 2}})
+    with ReloadingSizeChart(chart_path) as charts:
+        charts.start(poll_interval=0.01)
+        charts.start(poll_interval=0.01)                    #Already started
+        _write(chart_path, {'sizes': {'XS': 1, 'M': 2, 'XL': 3}})
+
+        for _ in range(500):
+            if len(charts.snapshot) == 3:
+                break
+            time.sleep(0.01)
+        assert len(charts.snapshot) == 3
+    assert charts._thread is None
+
+    with pytest.raises(ValueError):
+        ReloadingSizeChart(_write(chart_path, '[]'))
+
+def test_reload_thread_errors(tmp_path):
+    chart_path = _write(str(tmp_path.joinpath('chart.json')), {'sizes': {'XS': 1, 'XL': 2}})
+
+    def _configure(size_chart):
+        if len(size_chart) == 3:
+            raise RuntimeError('configure failed')
+
+    def _wait_for(condition):
+        for _ in range(500):
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    with ReloadingSizeChart(chart_path, configure=_configure) as charts:
+        charts.start(poll_interval=0.01)
+        _write(chart_path, {'sizes': {'S': 1}, 'dyn_ops': {'S': ['a', 1]}})
+        assert _wait_for(lambda: isinstance(charts.last_error, ValueError))
+        assert str(charts.last_error).find('DynOp fields must be') > -1
+
+        _write(chart_path, {'sizes': {'XS': 1, 'M': 2, 'XL': 3}})
+        assert _wait_for(lambda: isinstance(charts.last_error, RuntimeError))
+        assert charts._thread.is_alive()                    #Polling goes on
+
+        _write(chart_path, {'sizes': {'XS': 1, 'S': 2, 'M': 3, 'XL': 4}})
+        assert _wait_for(lambda: len(charts.snapshot) == 4)
+        assert charts.last_error is None
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_chartloader.py'])
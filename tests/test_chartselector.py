@@ -0,0 +1,77 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import ChartSelector, SizeChart, DynOp
+from sizechart_samples import (
+    SIZE_CHART_BABY_TODDLER_KID_SIZES,
+    DYNAMIC_OPS_BABY_TODDLER_KID_SIZES,
+    SIZE_CHART_SIMPLE,
+)
+
+def selector_factory():
+    return ChartSelector({
+        'adult': SizeChart(),
+        'kids': SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES, DYNAMIC_OPS_BABY_TODDLER_KID_SIZES),
+        'limited': SizeChart.from_simple_dict(SIZE_CHART_SIMPLE,
+                                              {'XL': DynOp('XL', 10, 1, 2)}),
+    })
+
+def test_class():
+    selector = selector_factory()
+    assert list(selector.size_charts) == ['adult', 'kids', 'limited']
+
+    with pytest.raises(ValueError) as ee:
+        ChartSelector({})
+    assert str(ee.value).find('at least one Size Chart') > -1
+
+@pytest.mark.parametrize("sizes, expected_scores",
+    [([], {'adult': 0, 'kids': 0, 'limited': 0}),
+     (['M', 'XL', '3XS'], {'adult': 3, 'kids': 1, 'limited': 2}),
+     (['NB', '6M', '3T', '5', 'M'], {'adult': 2, 'kids': 5, 'limited': 2}),
+     (['1XL', '2XL', '3XL'], {'adult': 3, 'kids': 0, 'limited': 2}),
+     (['1M', 12, 'B'], {'adult': 2, 'kids': 2, 'limited': 2}),
+    ],)
+def test_scores(sizes, expected_scores):
+    assert selector_factory().scores(sizes) == expected_scores
+
+@pytest.mark.parametrize("sizes, expected_name",
+    [(['M', 'XL', '3XS'], 'adult'),
+     (['NB', '6M', '3T', '5', 'M'], 'kids'),
+     (['S', 'M', 'L'], 'adult'),              #Tie is won by the earlier chart
+     (['4', '5', '6'], 'kids'),               #Numbers are only specific where base keys
+     (iter(['P', '24M', 'B']), 'kids'),
+    ],)
+def test_select(sizes, expected_name):
+    assert selector_factory().select(sizes) == expected_name
+
+def test_select_exception():
+    with pytest.raises(ValueError) as ee:
+        selector_factory().select(['B', 'Q'])
+    assert str(ee.value).find('No Size Chart matches') > -1
+
+def test_sort():
+    selector = selector_factory()
+    assert selector.sort(['5', '3T', 'NB', '12M', 'P', '6M']) == \
+           ('kids', ['P', 'NB', '6M', '12M', '3T', '5'])
+    assert selector.sort(['M', '2XL', 'XS'], reverse=True) == ('adult', ['2XL', 'M', 'XS'])
+
+    with pytest.raises(ValueError) as ee:
+        selector.sort(['M', 'L', 'B'])
+    assert str(ee.value).find('Base size not') > -1
+
+def test_sort_records():
+    records = [{'sku': 1, 'size': '3T'}, {'sku': 2, 'size': 'NB'}, {'sku': 3, 'size': '6M'}]
+    name, sorted_records = selector_factory().sort_records(records, reverse=True)
+    assert name == 'kids'
+    assert [record['sku'] for record in sorted_records] == [1, 3, 2]
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_chartselector.py'])
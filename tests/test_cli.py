@@ -0,0 +1,142 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import json
+
+import pytest
+
+from sizesorter.cli import main, chunked_sort, load_chart_file
+from sizesorter import SizeChart
+
+CSV_INPUT = ('sku,size,color\n'
+             '1,XL,red\n'
+             '2,M,blue\n'
+             '3,2XS,red\n'
+             '4,M,red\n'
+             '5,3XL,green\n'
+             '6,S,blue\n')
+
+JSONL_INPUT = ('{"sku": 1, "size": "L"}\n'
+               '{"sku": 2, "size": "XS"}\n'
+               '\n'
+               '{"sku": 3, "size": "2XL"}\n'
+               '{"sku": 4,   "size": "L"}')
+
+def _write(tmp_path, name, content):
+    path = str(tmp_path.joinpath(name))
+    with open(path, 'w', newline='') as out:
+        out.write(content)
+    return path
+
+def _read(path):
+    with open(path, newline='') as in_file:
+        return in_file.read()
+
+@pytest.mark.parametrize("extra_args, expected_skus",
+    [([], ['3', '6', '2', '4', '1', '5']),
+     (['--reverse'], ['5', '1', '2', '4', '6', '3']),
+     (['--chunk-size', '2'], ['3', '6', '2', '4', '1', '5']),
+     (['--chunk-size', '2', '--spill'], ['3', '6', '2', '4', '1', '5']),
+     (['--chunk-size', '1', '--spill', '-r'], ['5', '1', '2', '4', '6', '3']),
+    ],)
+def test_main_csv(tmp_path, extra_args, expected_skus):
+    in_path = _write(tmp_path, 'in.csv', CSV_INPUT)
+    out_path = str(tmp_path.joinpath('out.csv'))
+
+    args = [in_path, '-c', 'size', '-o', out_path, '--temp-dir', str(tmp_path)] + extra_args
+    assert main(args) == 0
+
+    lines = _read(out_path).splitlines()
+    assert lines[0] == 'sku,size,color'
+    assert [line.split(',')[0] for line in lines[1:]] == expected_skus
+
+def test_main_jsonl(tmp_path):
+    in_path = _write(tmp_path, 'in.jsonl', JSONL_INPUT)
+    out_path = str(tmp_path.joinpath('out.jsonl'))
+
+    assert main([in_path, '--column', 'size', '--output', out_path]) == 0
+
+    lines = _read(out_path).splitlines()
+    assert [json.loads(line)['sku'] for line in lines] == [2, 1, 4, 3]
+    assert lines[2] == '{"sku": 4,   "size": "L"}'   #Not re-serialized
+
+def test_main_chart_file(tmp_path):
+    chart_path = _write(tmp_path, 'chart.json', json.dumps(
+        {'sizes': {'XS': 0, 'S': 4, 'M': 8, 'L': 12, 'XL': 16}}))
+    in_path = _write(tmp_path, 'in.txt', 'size\nL\n3XL\nXS\n')
+    out_path = str(tmp_path.joinpath('out.csv'))
+
+    assert main([in_path, '-c', 'size', '-o', out_path, '-f', 'csv', '--chart', chart_path]) == 0
+    assert _read(out_path).splitlines() == ['size', 'XS', 'L', '3XL']
+
+    size_chart = load_chart_file(chart_path)
+    assert size_chart.get_or_create_size('3XL').sort_value == 36
+
+@pytest.mark.parametrize("content, column, expected_error",
+    [(CSV_INPUT, 'waist', 'Size column not in CSV header'),
+     (CSV_INPUT + '7,B,red\n', 'size', 'Base size not'),
+     (CSV_INPUT + '7\n', 'size', 'Size column missing on line 8'),
+    ],)
+def test_main_error(tmp_path, capsys, content, column, expected_error):
+    in_path = _write(tmp_path, 'in.csv', content)
+    out_path = str(tmp_path.joinpath('out.csv'))
+
+    assert main([in_path, '-c', column, '-o', out_path]) == 1
+    assert capsys.readouterr().err.find(expected_error) > -1
+    assert not os.path.exists(out_path)
+
+@pytest.mark.parametrize("content, expected_error",
+    [('{"size": ["M"]}\n', 'unhashable'),
+     ('{"size": {"M": 1}}\n', 'unhashable'),
+     ('5\n', 'not iterable'),
+    ],)
+def test_main_jsonl_error(tmp_path, capsys, content, expected_error):
+    in_path = _write(tmp_path, 'in.jsonl', JSONL_INPUT + '\n' + content)
+    out_path = str(tmp_path.joinpath('out.jsonl'))
+
+    assert main([in_path, '-c', 'size', '-o', out_path]) == 1
+    assert capsys.readouterr().err.find(expected_error) > -1
+
+def test_main_csv_error(tmp_path, capsys):
+    in_path = _write(tmp_path, 'in.csv', CSV_INPUT + '7,M,"' + 'x' * 200000 + '"\n')
+    out_path = str(tmp_path.joinpath('out.csv'))
+
+    assert main([in_path, '-c', 'size', '-o', out_path]) == 1
+    assert capsys.readouterr().err.find('field larger than field limit') > -1
+
+def test_chunked_sort():
+    records = [('M', 1), ('XS', 2), ('M', 3), ('4XL', 4), ('S', 5)]
+    for chunk_size in (1, 2, 10):
+        assert list(chunked_sort(records, SizeChart(), chunk_size=chunk_size)) == [2, 5, 1, 3, 4]
+        assert list(chunked_sort(records, SizeChart(), reverse=True, spill=True,
+                                 chunk_size=chunk_size)) == [4, 1, 3, 5, 2]
+    assert list(chunked_sort([], SizeChart())) == []
+
+    size_chart = SizeChart()
+    size_chart.enable_key_profiling()
+    assert list(chunked_sort(records, size_chart)) == [2, 5, 1, 3, 4]
+    assert size_chart.key_profile(1) == [('M', 2)]
+
+
+def test_main_unknown(tmp_path, capsys):
+    in_path = _write(tmp_path, 'in.csv', CSV_INPUT + '7,B,red\n')
+    out_path = str(tmp_path.joinpath('out.csv'))
+
+    assert main([in_path, '-c', 'size', '-o', out_path]) == 1
+    assert capsys.readouterr().err.find('Base size not') > -1
+
+    assert main([in_path, '-c', 'size', '-o', out_path, '--unknown', 'skip']) == 0
+    assert [line.split(',')[0] for line in _read(out_path).splitlines()[1:]] == \
+           ['3', '6', '2', '4', '1', '5']
+
+    assert main([in_path, '-c', 'size', '-o', out_path, '--unknown', 'last']) == 0
+    assert _read(out_path).splitlines()[-1] == '7,B,red'
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_cli.py'])
@@ -0,0 +1,67 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import CompoundSizeChart, DynOp, SizeChart, SizeSorter
+
+LENGTH_CHART = SizeChart.from_simple_dict({'Short': 0, 'Regular': 1, 'Tall': 2},
+                                          {'Tall': DynOp('Tall', 1, 1)})
+
+def test_class():
+    compound_chart = CompoundSizeChart([None, None])
+    assert compound_chart.dimensions == [None, None]
+    assert compound_chart.bits == 16
+
+    for args, expected_error in [(([],), 'at least one dimension'),
+                                 (([None], ''), 'at least one separator'),
+                                 (([None], 'x', 1), 'at least 2')]:
+        with pytest.raises(ValueError) as ee:
+            CompoundSizeChart(*args)
+        assert str(ee.value).find(expected_error) > -1
+
+@pytest.mark.parametrize("dimensions, sizes, expected_sizes",
+    [([None, None], ['32x34', '30x32', '32x30', '30x34', '32', 31],
+                    ['30x32', '30x34', 31, '32', '32x30', '32x34']),
+     ([SizeChart(), SizeChart()], ['L/XL', 'M/L', 'S', 'XS/S', '2XL/3XL', '3XS/2XS'],
+                                  ['3XS/2XS', 'XS/S', 'S', 'M/L', 'L/XL', '2XL/3XL']),
+     ([SizeChart(), LENGTH_CHART], ['XL-Tall', 'M', 'XL-2Tall', 'M-Regular', '2XL'],
+                                   ['M', 'M-Regular', 'XL-Tall', 'XL-2Tall', '2XL']),
+    ],)
+def test_sort(dimensions, sizes, expected_sizes):
+    compound_chart = CompoundSizeChart(dimensions)
+    assert compound_chart.sort(sizes) == expected_sizes
+    assert compound_chart.sort(sizes, reverse=True) == expected_sizes[::-1]
+    assert SizeSorter(compound_chart).min_size(sizes) == expected_sizes[0]
+
+def test_sort_value():
+    compound_chart = CompoundSizeChart([SizeChart(), None], bits=8)
+    assert compound_chart.sort_value('M') == (128 + 2) << 8
+    assert compound_chart.sort_value('M-30') == ((128 + 2) << 8) + 31
+    assert compound_chart.get_or_create_size('M-30') is compound_chart.get_or_create_size('M-30')
+
+    assert compound_chart.unpack(compound_chart.sort_value('3XS/32')) == ('3XS', '32')
+    assert compound_chart.unpack(compound_chart.sort_value('XL')) == ('XL', None)
+
+@pytest.mark.parametrize("size_key, expected_error",
+    [('MxLx2', 'too many dimensions'),
+     ('M/B', 'must be a whole number'),
+     ('B/32', 'Base size not'),
+     ('30x32', 'has no rank'),
+     ('M/32.5', 'must be a whole number'),
+     ('M/300', 'does not fit in 8 bits'),
+     ('200XL', 'does not fit in 8 bits'),
+    ],)
+def test_sort_value_exception(size_key, expected_error):
+    with pytest.raises(ValueError) as ee:
+        CompoundSizeChart([SizeChart(), None], bits=8).sort_value(size_key)
+    assert str(ee.value).find(expected_error) > -1
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_compoundsizechart.py'])
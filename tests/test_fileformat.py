@@ -0,0 +1,26 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter.fileformat import FORMATS, detect_format
+
+@pytest.mark.parametrize("path, expected_format",
+    [('in.jsonl', 'jsonl'),
+     ('IN.NDJSON', 'jsonl'),
+     ('in.csv', 'csv'),
+     ('in.txt', 'csv'),
+     ('-', 'csv'),
+    ],)
+def test_detect_format(path, expected_format):
+    assert detect_format(path) == expected_format
+    assert detect_format(path) in FORMATS
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_fileformat.py'])
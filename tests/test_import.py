@@ -0,0 +1,58 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import subprocess
+
+import pytest
+
+import sizesorter
+
+"""Import time budget (microseconds) of the sizesorter package itself"""
+BUDGET_IMPORT_TIME_US = 50000
+
+def _run_python(code, *options):
+    return subprocess.run([sys.executable] + list(options) + ['-c', code], cwd=parentdir,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Requires module __getattr__')
+def test_lazy_import():
+    result = _run_python('import sys, sizesorter\n'
+                         'print(sorted(m for m in sys.modules if m.startswith("sizesorter")))\n'
+                         'sizesorter.SizeChart\n'
+                         'print("sizesorter.sizechart" in sys.modules)\n'
+                         'print("sizesorter.cli" in sys.modules)\n')
+    assert result.stdout.splitlines() == ["['sizesorter']", 'True', 'False']
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Requires -X importtime')
+def test_import_time_benchmark():
+    result = _run_python('import sizesorter', '-X', 'importtime')
+    import_times = [line.split('|') for line in result.stderr.splitlines()
+                    if line.rstrip().endswith(' sizesorter')]
+    assert len(import_times) == 1
+    assert int(import_times[0][1]) < BUDGET_IMPORT_TIME_US       #Cumulative
+
+def test_public_names():
+    for name in sizesorter.__all__:
+        assert getattr(sizesorter, name) is not None
+        assert name in dir(sizesorter)
+
+    assert sizesorter.SizeChart is sizesorter.sizechart.SizeChart
+
+    with pytest.raises(AttributeError):
+        sizesorter.NotAName
+
+def test_default_chart_deferred():
+    sorter = sizesorter.SizeSorter()
+    assert sorter._size_chart is None
+    assert isinstance(sorter.size_chart, sizesorter.SizeChart)
+    assert sorter.size_chart is sorter.size_chart
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_import.py'])
@@ -0,0 +1,75 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import SizeChart
+from sizesorter.memory import deep_getsizeof, charts_memory_report
+from sizechart_samples import (
+    SIZE_CHART_BABY_TODDLER_KID_SIZES,
+    DYNAMIC_OPS_BABY_TODDLER_KID_SIZES,
+)
+
+"""Memory budgets (bytes) which the charts must stay within"""
+BUDGET_DEFAULT_CHART = 16 * 1024
+BUDGET_PER_CACHED_DYNAMIC_SIZE = 1024
+
+def test_deep_getsizeof():
+    assert deep_getsizeof([]) == sys.getsizeof([])
+
+    key = 'XL'
+    assert deep_getsizeof([key]) == sys.getsizeof([key]) + sys.getsizeof(key)
+    assert deep_getsizeof([key, key]) == sys.getsizeof([key, key]) + sys.getsizeof(key)
+
+    seen = set()
+    assert deep_getsizeof(key, seen) == sys.getsizeof(key)
+    assert deep_getsizeof(key, seen) == 0
+    assert deep_getsizeof(str) == 0            #Classes/functions are shared
+
+def test_memory_report():
+    size_chart = SizeChart()
+    report = size_chart.memory_report()
+
+    assert set(report) == {'base_sizes', 'dynamic_cache', 'formatting', 'indexes', 'total'}
+    assert report['dynamic_cache'] == 0
+    assert report['total'] >= report['base_sizes'] + report['formatting'] + report['indexes']
+    assert report['total'] < BUDGET_DEFAULT_CHART
+
+@pytest.mark.parametrize("cached_count", [10, 1000])
+def test_memory_report_dynamic_cache(cached_count):
+    size_chart = SizeChart()
+    before = size_chart.memory_report()
+
+    size_chart.enable_dynamic_size_cache()
+    for prefix in range(2, cached_count + 2):
+        size_chart.get_or_create_size(str(prefix) + 'XL')
+    after = size_chart.memory_report()
+
+    assert after['base_sizes'] == before['base_sizes']
+    assert 0 < after['dynamic_cache'] < cached_count * BUDGET_PER_CACHED_DYNAMIC_SIZE
+    assert after['total'] - before['total'] == after['dynamic_cache']
+
+def test_charts_memory_report():
+    size_charts = {'adult': SizeChart(),
+                   'kids': SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES,
+                                     DYNAMIC_OPS_BABY_TODDLER_KID_SIZES)}
+    report, total = charts_memory_report(size_charts)
+
+    assert sorted(report) == ['adult', 'kids']
+    assert total == report['adult']['total'] + report['kids']['total']
+    assert report['adult']['total'] == size_charts['adult'].memory_report()['total']
+    assert total < len(size_charts) * BUDGET_DEFAULT_CHART
+
+    size_charts['total'] = SizeChart()                      #Not confused with the total
+    report, total = charts_memory_report(size_charts)
+    assert sorted(report['total']) == sorted(report['adult'])
+    assert total == sum(chart_report['total'] for chart_report in report.values())
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_memory.py'])
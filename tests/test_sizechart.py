@@ -6,6 +6,9 @@ if parentdir not in sys.path:
     sys.path.insert(0, parentdir)
 ###
 
+from itertools import islice
+import pickle
+
 import pytest
 from sizesorter import (
      Size,
@@ -14,6 +17,16 @@ from sizesorter import (
      SIZE_CHART_DEFAULTS,
      DYNAMIC_OPERATIONS_DEFAULTS,
      SIZE_CHART_FORMAT_DEFAULTS,
+     to_x_notation,
+     from_x_notation,
+)
+from sizesorter.sizechart import (
+     FORMATTED_SIZES_MAX,
+     GENERATED_RANGES_MAX,
+     UNKNOWN_KEYS_MAX,
+     KEY_KIND_BASE,
+     KEY_KIND_DYNAMIC,
+     KEY_KIND_NUMERIC,
 )
 from sizechart_samples import (
     SIZE_CHART_SIMPLE,
@@ -470,13 +483,14 @@ def test_generate_lengthed_list(size_chart, list_length, expected_list):
     #TODO - Test Verbose and XXL keys
     #TODO - Test Single-Ended
 
-@pytest.mark.parametrize("size_chart, list_length, expected_tpl", 
-    [(default_size_chart, 100, (ValueError, 'Length of list exceeds')),
+@pytest.mark.parametrize("dyn_ops, list_length, expected_tpl", 
+    [({}, 6, (ValueError, 'Length of list exceeds')),
+     ({'XL': DynOp('XL', 10, 1, 2)}, 7, (ValueError, 'Length of list exceeds')),
     ],)
-def test_generate_lengthed_list_exception(size_chart, list_length, expected_tpl):
+def test_generate_lengthed_list_exception(dyn_ops, list_length, expected_tpl):
 
     with pytest.raises(expected_tpl[0]) as ee:
-        default_size_chart().generate_lengthed_list(list_length)
+        SizeChart(SIZE_CHART_DEFAULTS, dyn_ops).generate_lengthed_list(list_length)
 
     assert str(ee.value).find(expected_tpl[1]) > -1
 
@@ -532,6 +546,667 @@ def test_generate_range_exception(size_chart, start_range, end_range, expected_t
         size_chart().generate_range_list(start_range, end_range)
 
     assert str(ee.value).find(expected_tpl[1]) > -1
+def custom_size_chart_factory():
+    return SizeChart.from_simple_dict({'A': 1, 'B': 2, 'C': 3}, custom_dynops())
+
+def baby_toddler_kids_size_chart_factory():
+    return SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES, DYNAMIC_OPS_BABY_TODDLER_KID_SIZES)
+
+def limited_size_chart():
+    return SizeChart(SIZE_CHART_DEFAULTS, {'XS': DynOp('XS', 10, -1, 1), 'XL': DynOp('XL', 10, 1, 3)})
+
+def test_dyn_op_max_prefix():
+    assert DynOp('XL', 10, 1).max_prefix is None
+
+    size_chart = limited_size_chart()
+    assert size_chart.get_or_create_size('3XL').sort_value == 120
+    assert size_chart.get_or_create_size('3XL').next_size_key is None
+    assert size_chart.get_or_create_size('2XL').next_size_key == '3XL'
+    assert size_chart.get_or_create_size('XS').previous_size_key is None
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.get_or_create_size('4XL')
+    assert str(ee.value).find('exceeds the DynOp max_prefix') > -1
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.get_or_create_size('2XS')
+    assert str(ee.value).find('exceeds the DynOp max_prefix') > -1
+
+    with pytest.raises(ValueError) as ee:
+        SizeChart(SIZE_CHART_DEFAULTS, {'XL': DynOp('XL', 10, 1, 0)})
+    assert str(ee.value).find('max_prefix must be a positive number') > -1
+
+@pytest.mark.parametrize("size_chart, size_key, length, expected_up, expected_down",
+    [(SizeChart, 'M', 5, ['M','L','XL','2XL','3XL'], ['M','S','XS','2XS','3XS']),
+     (SizeChart, '1XL', 3, ['XL','2XL','3XL'], ['XL','L','M']),
+     (SizeChart, '3XS', 4, ['3XS','2XS','XS','S'], ['3XS','4XS','5XS','6XS']),
+     (SizeChart, '99XL', 2, ['99XL','100XL'], ['99XL','98XL']),
+     (limited_size_chart, 'M', 10, ['M','L','XL','2XL','3XL'], ['M','S','XS']),
+     (limited_size_chart, '2XL', 10, ['2XL','3XL'], ['2XL','XL','L','M','S','XS']),
+    ],)
+def test_iter_up_down_from(size_chart, size_key, length, expected_up, expected_down):
+    assert list(islice(size_chart().iter_up_from(size_key), length)) == expected_up
+    assert list(islice(size_chart().iter_down_from(size_key), length)) == expected_down
+
+@pytest.mark.parametrize("size_chart, list_length, expected_list",
+    [(limited_size_chart, 6, ['XS','S','M','L','XL','2XL']),
+     (limited_size_chart, 7, ['XS','S','M','L','XL','2XL','3XL']),
+    ],)
+def test_generate_lengthed_list_limited(size_chart, list_length, expected_list):
+    assert size_chart().generate_lengthed_list(list_length) == expected_list
+
+def test_generate_lengthed_list_unbounded():
+    sizes = SizeChart().generate_lengthed_list(1000)       #No fixed maximum length
+    assert len(sizes) == 1000
+    assert (sizes[0], sizes[-1]) == ('498XS', '499XL')
+
+def test_generate_lengthed_list_limited_exception():
+    with pytest.raises(ValueError) as ee:
+        limited_size_chart().generate_lengthed_list(8)
+    assert str(ee.value).find('exceeds the sizes available') > -1
+
+@pytest.mark.parametrize("size_chart, start_range, end_range, expected_list",
+    [(SizeChart, '2XS', '1XL', ['2XS','XS','S','M','L','XL']),
+     (SizeChart, 'XL', '80XL', ['XL'] + [str(p) + 'XL' for p in range(2, 81)]),
+     (limited_size_chart, 'L', '3XL', ['L','XL','2XL','3XL']),
+     (baby_toddler_kids_size_chart_factory, '2T', '4T', ['2T','3T','4T']),
+     (baby_toddler_kids_size_chart_factory, '48M', '2T', ['48M','49M','50M','T','2T']),
+    ],)
+def test_generate_range_unbounded(size_chart, start_range, end_range, expected_list):
+    assert size_chart().generate_range_list(start_range, end_range) == expected_list
+
+def test_generate_range_interior_dyn_ops():
+    size_chart = baby_toddler_kids_size_chart_factory()
+    assert size_chart.generate_range_list('P', '4') == \
+           (['P', 'NB', 'M'] + [str(p) + 'M' for p in range(2, 51)] +
+            ['T'] + [str(p) + 'T' for p in range(2, 21)] + ['4'])
+
+    #Growing down towards the previous size, bounded by the max_prefix
+    size_chart = SizeChart.from_simple_dict({'A': 0, 'B': 10, 'C': 20},
+                                            {'B': DynOp('B', 3, -1), 'C': DynOp('C', 2, -1, 3)})
+    assert size_chart.generate_range_list('A', 'C') == ['A','4B','3B','2B','B','3C','2C','C']
+    assert size_chart.keys_for_values([2, 5], 'floor') == ['4B', '3B']
+    assert size_chart.keys_for_values([2, 5], 'ceil') == ['3B', '2B']
+
+    with pytest.raises(ValueError) as ee:
+        SizeChart.from_simple_dict({'A': 0, 'B': 10}, {'A': DynOp('A', 3, 1),
+                                                       'B': DynOp('B', 3, -1)})
+    assert str(ee.value).find('DynOps grow into the same sizes') > -1
+
+@pytest.mark.parametrize("size_key, expected_tpl",
+    [('NB', ('P', 'M')),
+     ('M', ('NB', '2M')),
+     ('50M', ('49M', 'T')),
+     ('T', ('50M', '2T')),
+     ('20T', ('19T', '4')),
+     ('4', ('20T', '5')),
+    ],)
+def test_interior_dyn_op_double_pointers(size_key, expected_tpl):
+    size_chart = baby_toddler_kids_size_chart_factory()
+    size = size_chart.get_or_create_size(size_key)
+    assert (size.previous_size_key, size.next_size_key) == expected_tpl
+    assert size.next_size_key == size_chart.next_of(size_key)
+    assert size.previous_size_key == size_chart.prev_of(size_key)
+
+    size_chart = SizeChart.from_simple_dict({'A': 0, 'B': 10}, {'B': DynOp('B', 3, -1)})
+    assert size_chart.size_chart['A'].next_size_key == '4B'
+    assert size_chart.get_or_create_size('4B').previous_size_key == 'A'
+    assert size_chart.get_or_create_size('5B').next_size_key is None    #Past the run
+
+@pytest.mark.parametrize("size_chart, start_range, end_range, expected_tpl",
+    [(SizeChart, 'L', 'M', (ValueError, 'not reachable from start')),
+     (SizeChart, '2XL', 'XL', (ValueError, 'not reachable from start')),
+     (SizeChart, 'XS', '12', (ValueError, 'not reachable from start')),
+     (limited_size_chart, 'L', '4XL', (ValueError, 'exceeds the DynOp max_prefix')),
+    ],)
+def test_generate_range_unreachable(size_chart, start_range, end_range, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        size_chart().generate_range_list(start_range, end_range)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+@pytest.mark.parametrize("size_key, expected",
+    [('XL', 'XL'), ('1XL', 'XL'), ('2XL', 'XXL'), ('3XS', 'XXXS'), ('10XL', 'XXXXXXXXXXL'),
+     ('M', 'M'), ('3A', '3A'), ('2M', '2M'), ('12', '12'),
+    ],)
+def test_to_x_notation(size_key, expected):
+    assert to_x_notation(size_key) == expected
+
+@pytest.mark.parametrize("size_key, expected",
+    [('XL', 'XL'), ('XXL', '2XL'), ('XXXS', '3XS'), ('M', 'M'), ('XXM', 'XXM'), ('XYL', 'XYL'),
+     ('2XL', '2XL'),
+    ],)
+def test_from_x_notation(size_key, expected):
+    assert from_x_notation(size_key) == expected
+    assert from_x_notation(to_x_notation(size_key)) == from_x_notation(size_key)
+
+@pytest.mark.parametrize("formatting_options, expected_list",
+    [({}, ['2XS','XS','S','M','L','XL','2XL']),
+     ({'x_size_formatter': to_x_notation}, ['XXS','XS','S','M','L','XL','XXL']),
+     ({'verbose': True}, ['2XS','XS','Small','Medium','Large','XL','2XL']),
+     ({'dynamic_size_verbose': True}, ['2X-Small','X-Small','S','M','L','X-Large','2X-Large']),
+     ({'verbose': True, 'dynamic_size_verbose': True},
+      ['2X-Small','X-Small','Small','Medium','Large','X-Large','2X-Large']),
+    ],)
+def test_format_size(formatting_options, expected_list):
+    size_chart = SizeChart(formatting_options=formatting_options)
+    keys = ['2XS','XS','S','M','L','XL','2XL']
+
+    assert size_chart.format_sizes(keys) == expected_list
+    assert size_chart.generate_range_list('2XS', '2XL') == expected_list
+    assert size_chart.generate_lengthed_list(7) == expected_list
+    assert size_chart.format_size('1XL') == expected_list[-2]
+
+def test_set_formatting_options():
+    size_chart = SizeChart()
+    assert size_chart.format_size('M') == 'M'
+    assert size_chart.format_size('3XL') == '3XL'
+
+    size_chart.set_formatting_options({'verbose': True, 'x_size_formatter': to_x_notation})
+    assert size_chart.formatting_options['dynamic_size_verbose'] is False
+    assert size_chart.format_size('M') == 'Medium'
+    assert size_chart.format_size('3XL') == 'XXXL'
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.format_size('B')
+    assert str(ee.value).find('Base size not') > -1
+
+    size_chart = baby_toddler_kids_size_chart_factory()
+    size_chart.set_formatting_options({'x_size_formatter': to_x_notation})
+    assert size_chart.format_sizes(['NB', '3M', '2T', '4']) == ['NB', '3M', '2T', '4']
+
+def test_from_definition():
+    size_chart = SizeChart.from_definition({
+        'sizes': {'XS': 0, 'S': {'sort_value': 4, 'verbose': 'Small'}, 'M': 8, 'XL': 16},
+        'dyn_ops': {'XS': [2, -1], 'XL': {'sort_value_increment': 4, 'growth_direction': 1,
+                                          'max_prefix': 3}},
+        'formatting_options': {'verbose': True},
+    })
+    assert len(size_chart) == 4
+    assert size_chart.get_or_create_size('3XS').sort_value == -4
+    assert size_chart.get_or_create_size('3XL').sort_value == 24
+    assert size_chart.format_size('S') == 'Small'
+    assert size_chart.dyn_ops['XL'].max_prefix == 3
+
+    assert len(SizeChart.from_definition({})) == len(SIZE_CHART_DEFAULTS)
+
+@pytest.mark.parametrize("definition, expected_tpl",
+    [({'sizes': {'XS': 'small', 'XL': 1}}, (ValueError, 'sort values must be Numbers')),
+     ({'sizes': {'XS': {'value': 1}, 'XL': 1}}, (ValueError, 'Invalid Size Chart definition')),
+     ({'sizes': {'XS': 0, 'XL': 1}, 'dyn_ops': {'XL': [1]}}, (ValueError, 'Invalid Size Chart')),
+     ({'sizes': {'S': 0, 'XL': 1}}, (ValueError, 'base suffix not in size_chart')),
+     ({'sizes': {'S': 1}, 'dyn_ops': {'S': ['a', 1]}}, (ValueError, 'DynOp fields must be')),
+     ({'sizes': {'S': 1}, 'dyn_ops': {'S': [1, 1, '3']}}, (ValueError, 'DynOp fields must be')),
+     ({'sizes': {'S': [1, 2]}}, (ValueError, 'verbose names must be strings')),
+     ({'sizes': {'S': 1}, 'formatting_options': []}, (ValueError, 'must be a map')),
+     ({'sizes': []}, (ValueError, 'Invalid Size Chart definition')),
+    ],)
+def test_from_definition_exception(definition, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        SizeChart.from_definition(definition)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+@pytest.mark.parametrize("size_chart, size_key, expected_tpl",
+    [(SizeChart, 'M', (1, 'M', KEY_KIND_BASE)),
+     (SizeChart, 'XL', (1, 'XL', KEY_KIND_BASE)),
+     (SizeChart, '1XL', (1, 'XL', KEY_KIND_BASE)),
+     (SizeChart, '2XS', (2, 'XS', KEY_KIND_DYNAMIC)),
+     (SizeChart, '15XL', (15, 'XL', KEY_KIND_DYNAMIC)),
+     (SizeChart, '12', (0, '12', KEY_KIND_NUMERIC)),
+     (SizeChart, 12, (0, '12', KEY_KIND_NUMERIC)),
+     (custom_size_chart_factory, '3A', (3, 'A', KEY_KIND_DYNAMIC)),
+     (custom_size_chart_factory, 'B', (1, 'B', KEY_KIND_BASE)),
+     (baby_toddler_kids_size_chart_factory, '4', (1, '4', KEY_KIND_BASE)),
+     (baby_toddler_kids_size_chart_factory, '9', (0, '9', KEY_KIND_NUMERIC)),
+     (baby_toddler_kids_size_chart_factory, '3T', (3, 'T', KEY_KIND_DYNAMIC)),
+     (baby_toddler_kids_size_chart_factory, '14', (0, '14', KEY_KIND_NUMERIC)),
+     (SizeChart, '1M', (1, 'M', KEY_KIND_BASE)),
+     (SizeChart, '1S', (1, 'S', KEY_KIND_BASE)),
+     (SizeChart, '\uff11\uff12', (0, '\uff11\uff12', KEY_KIND_NUMERIC)),      #Fullwidth 12
+    ],)
+def test_tokenize_size_key(size_chart, size_key, expected_tpl):
+    assert size_chart()._tokenize_size_key(size_key) == expected_tpl
+
+def test_single_prefix_and_unicode_digits():
+    size_chart = SizeChart()
+    assert size_chart.get_or_create_size('1M') is size_chart.get_or_create_size('M')
+    assert size_chart.intern_key('1S') == 'S'
+    assert size_chart.rank_of('1L') == size_chart.rank_of('L')
+    assert size_chart.get_or_create_size('\uff11\uff12').sort_value == 12
+
+@pytest.mark.parametrize("size_chart, size_key, expected_tpl",
+    [(SizeChart, '-5XL', (ValueError, 'positive number or not set')),
+     (SizeChart, '+3XL', (ValueError, 'positive number or not set')),
+     (SizeChart, '0XL', (ValueError, 'positive number or not set')),
+     (SizeChart, '02XL', (ValueError, 'positive number or not set')),
+     (SizeChart, 'X2XL', (ValueError, 'positive number or not set')),
+     (SizeChart, '4L', (ValueError, 'Suffix is not defined as Dynamic')),
+     (SizeChart, 'X', (ValueError, 'Suffix is not defined as Dynamic')),
+     (SizeChart, '', (ValueError, 'Suffix is not defined as Dynamic')),
+     (SizeChart, '4.5', (ValueError, 'Suffix is not defined as Dynamic')),
+     (SizeChart, '11M', (ValueError, 'Suffix is not defined as Dynamic')),
+     (SizeChart, '\u00b2', (ValueError, 'Suffix is not defined as Dynamic')),      #Superscript 2
+     (custom_size_chart_factory, '2B', (ValueError, 'Suffix is not defined as Dynamic')),
+     (limited_size_chart, '4XL', (ValueError, 'exceeds the DynOp max_prefix')),
+    ],)
+def test_tokenize_size_key_exception(size_chart, size_key, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        size_chart()._tokenize_size_key(size_key)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+@pytest.mark.parametrize("size_chart, size_key, expected_rank",
+    [(SizeChart, 'XS', 0), (SizeChart, 'M', 2), (SizeChart, '1XL', 4), (SizeChart, '2XL', 5),
+     (SizeChart, '10XL', 13), (SizeChart, '2XS', -1), (SizeChart, '5XS', -4),
+     (custom_size_chart_factory, '3A', -2), (custom_size_chart_factory, 'C', 2),
+     (limited_size_chart, '3XL', 6),
+     (baby_toddler_kids_size_chart_factory, '3M', 4),
+     (baby_toddler_kids_size_chart_factory, 'T', 52),
+     (baby_toddler_kids_size_chart_factory, '20T', 71),
+     (baby_toddler_kids_size_chart_factory, '4', 72),
+    ],)
+def test_rank_of_key_at_rank(size_chart, size_key, expected_rank):
+    size_chart = size_chart()
+    assert size_chart.rank_of(size_key) == expected_rank
+    assert size_chart.key_at_rank(expected_rank) == size_chart.get_or_create_size(size_key).key
+
+@pytest.mark.parametrize("size_chart, size_key, expected_tpl",
+    [(SizeChart, 'B', (ValueError, 'Base size not')),
+     (SizeChart, '12', (ValueError, 'has no rank')),
+     (baby_toddler_kids_size_chart_factory, '51M', (ValueError, 'has no rank')),
+     (limited_size_chart, '2XS', (ValueError, 'exceeds the DynOp max_prefix')),
+    ],)
+def test_rank_of_exception(size_chart, size_key, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        size_chart().rank_of(size_key)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+@pytest.mark.parametrize("size_chart, size_key, n, expected_next, expected_prev",
+    [(SizeChart, 'M', 1, 'L', 'S'),
+     (SizeChart, 'M', 2, 'XL', 'XS'),
+     (SizeChart, 'M', 3, '2XL', '2XS'),
+     (SizeChart, '1XL', 50, '51XL', '47XS'),
+     (SizeChart, '3XS', 4, 'M', '7XS'),
+     (SizeChart, 'S', 0, 'S', 'S'),
+     (SizeChart, 'S', -1, 'XS', 'M'),
+     (limited_size_chart, 'L', 3, '3XL', 'XS'),
+     (baby_toddler_kids_size_chart_factory, '2T', 1, '3T', 'T'),
+     (baby_toddler_kids_size_chart_factory, 'T', 1, '2T', '50M'),
+    ],)
+def test_next_of_prev_of(size_chart, size_key, n, expected_next, expected_prev):
+    assert size_chart().next_of(size_key, n) == expected_next
+    assert size_chart().prev_of(size_key, n) == expected_prev
+
+@pytest.mark.parametrize("size_chart, size_key, n, expected_tpl",
+    [(limited_size_chart, '2XL', 2, (ValueError, 'Rank out of range')),
+     (limited_size_chart, 'M', -5, (ValueError, 'Rank out of range')),
+     (SizeChart, '-2XL', 1, (ValueError, 'positive number or not set')),
+    ],)
+def test_next_of_exception(size_chart, size_key, n, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        size_chart().next_of(size_key, n)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+@pytest.mark.parametrize("size_key, expected_key",
+    [('M', 'M'), ('XL', 'XL'), ('1XL', 'XL'), ('3XL', '3XL'), ('12', '12'), (12, '12')],)
+def test_intern_key(size_key, expected_key):
+    size_chart = SizeChart()
+
+    fresh_key = ''.join(list(str(size_key))) if isinstance(size_key, str) else size_key
+    interned_key = size_chart.intern_key(fresh_key)
+    assert interned_key == expected_key
+    assert interned_key is sys.intern(expected_key)
+    assert size_chart.intern_key(fresh_key) is interned_key
+    assert size_chart.get_or_create_size(interned_key).key is interned_key
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.intern_key('4L')
+    assert str(ee.value).find('Base size not') > -1
+
+def test_interned_sizes():
+    verbose = ''.join(['Me', 'dium'])
+    size_chart = SizeChart({'XS': Size('XS', 0), ''.join(['M']): Size(''.join(['M']), 5, verbose),
+                            'XL': Size('XL', 10)})
+
+    assert next(key for key in size_chart.size_chart if key == 'M') is sys.intern('M')
+    assert size_chart.get_or_create_size('M').verbose is sys.intern('Medium')
+    assert size_chart.get_or_create_size('2XL').key is sys.intern('2XL')
+
+@pytest.mark.parametrize("size_chart", [SizeChart, custom_size_chart_factory, limited_size_chart,
+                                        baby_toddler_kids_size_chart_factory])
+def test_to_definition(size_chart):
+    size_chart = size_chart()
+    definition = size_chart.to_definition()
+    rebuilt = SizeChart.from_definition(definition)
+
+    assert rebuilt.to_definition() == definition
+    assert rebuilt.dyn_ops == size_chart.dyn_ops
+    assert [(size.key, size.sort_value, size.verbose, size.is_dynamic_size)
+            for size in rebuilt.size_chart.values()] == \
+           [(size.key, size.sort_value, size.verbose, size.is_dynamic_size)
+            for size in size_chart.size_chart.values()]
+
+def test_pickle():
+    size_chart = SizeChart(formatting_options={'x_size_formatter': to_x_notation})
+    size_chart.enable_dynamic_size_cache()
+    pickled_empty = pickle.dumps(size_chart)
+    for prefix in range(2, 100):
+        size_chart.get_or_create_size(str(prefix) + 'XL')
+
+    pickled = pickle.dumps(size_chart)
+    assert len(pickled) == len(pickled_empty)       #Cached dynamic sizes are not shipped
+
+    unpickled = pickle.loads(pickled)
+    assert isinstance(unpickled, SizeChart)
+    assert unpickled._dynamic_size_cache
+    assert len(unpickled) == len(SIZE_CHART_DEFAULTS)
+    assert unpickled.format_size('3XL') == 'XXXL'
+    assert unpickled.generate_range_list('2XS', '2XL') == \
+           size_chart.generate_range_list('2XS', '2XL')
+    assert unpickled._unknown_key_policy == 'raise'
+
+def test_pickle_unknown_key_policy():
+    size_chart = SizeChart()
+    size_chart.set_unknown_key_policy('skip', {'Lg': 'L'})
+
+    unpickled = pickle.loads(pickle.dumps(size_chart))
+    assert unpickled.resolve_size('zz') is None
+    assert unpickled.resolve_size('Lg').key == 'L'
+    assert unpickled._aliases == {'Lg': 'L'}
+
+
+@pytest.mark.parametrize("policy, aliases, size_key, expected_key",
+    [('skip', None, 'B', None),
+     ('first', None, 'B', 'B'),
+     ('last', None, 'B', 'B'),
+     ('raise', {'Lg': 'L'}, 'Lg', 'L'),
+     ('skip', {'Lg': 'L'}, 'Lg', 'L'),
+     ('fuzzy', None, 'large', 'L'),
+     ('fuzzy', None, 'Larg', 'L'),
+     ('fuzzy', None, 'x-small', 'XS'),
+     ('fuzzy', None, 'M', 'M'),
+     ('fuzzy', None, '3XL', '3XL'),
+     ('fuzzy', None, 'XXL', '2XL'),
+     ('fuzzy', None, '2xl', '2XL'),
+     ('fuzzy', None, 'xxxs', '3XS'),
+     ('fuzzy', None, 'medum', 'M'),
+     ('fuzzy', None, ' l ', 'L'),
+    ],)
+def test_resolve_size(policy, aliases, size_key, expected_key):
+    size_chart = SizeChart()
+    size_chart.set_unknown_key_policy(policy, aliases)
+
+    size = size_chart.resolve_size(size_key)
+    assert (size.key if size else None) == expected_key
+    if size_key not in ('M', '3XL'):
+        assert size_chart.resolve_size(size_key) is size    #Cached resolution
+    if policy == 'first':
+        assert size.sort_value < size_chart.get_or_create_size('100XS').sort_value
+    if policy == 'last':
+        assert size.sort_value > size_chart.get_or_create_size('100XL').sort_value
+
+def test_resolve_size_exception():
+    size_chart = SizeChart()
+    for _ in range(2):
+        with pytest.raises(ValueError) as ee:
+            size_chart.resolve_size('B')
+        assert str(ee.value).find('Base size not') > -1
+    assert 'B' in size_chart._unknown_keys
+
+    size_chart.set_unknown_key_policy('fuzzy')
+    assert not size_chart._unknown_keys
+    for size_key in ('Q', 'X', 'XLL', 'XXM'):               #Not typos of a size
+        with pytest.raises(ValueError) as ee:
+            size_chart.resolve_size(size_key)
+        assert str(ee.value).find('Base size not') > -1
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.resolve_size(None)
+    assert str(ee.value).find('must be a string or a number') > -1
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.set_unknown_key_policy('nearest')
+    assert str(ee.value).find('Unknown key policy must be one of') > -1
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.set_unknown_key_policy('raise', {'Lg': 'B'})
+    assert str(ee.value).find('Base size not') > -1
+
+def test_unknown_keys_bounds():
+    size_chart = SizeChart()
+    size_chart.set_unknown_key_policy('skip')
+    for idx in range(UNKNOWN_KEYS_MAX + 10):
+        assert size_chart.resolve_size('B' + str(idx)) is None
+    assert len(size_chart._unknown_keys) == UNKNOWN_KEYS_MAX
+    assert 'B0' not in size_chart._unknown_keys            #Oldest evicted first
+    assert size_chart.resolve_size('B0') is None
+
+
+def test_key_profile(tmp_path):
+    size_chart = SizeChart()
+    size_chart.get_or_create_size('M')
+    assert size_chart.key_profile() == []
+
+    size_chart.enable_key_profiling()
+    for size_key in ['M', '3XL', '1XL', 'M', '3XL', 'XL', '2XS', '3XL']:
+        size_chart.get_or_create_size(size_key)
+    with pytest.raises(ValueError):
+        size_chart.get_or_create_size('B')
+
+    assert size_chart.key_profile() == [('3XL', 3), ('M', 2), ('XL', 2), ('2XS', 1)]
+    assert size_chart.key_profile(2) == [('3XL', 3), ('M', 2)]
+
+    profile_path = str(tmp_path.joinpath('profile.json'))
+    assert size_chart.export_key_profile(profile_path, 3) == 3
+
+    warm_chart = SizeChart()
+    assert warm_chart.warm(profile_path) == 3
+    assert not warm_chart._dynamic_size_cache
+    assert '3XL' in warm_chart._warmed_sizes
+    assert warm_chart._interned_keys['3XL'] == '3XL'
+    assert warm_chart.key_profile() == []
+
+def test_key_profile_resolve_size():
+    size_chart = SizeChart()
+    size_chart.enable_key_profiling()
+    size_chart.set_unknown_key_policy('skip', {'Lg': 'L'})
+    for size_key in ['M', 'M', '2XL', '2XL', '2XL', 'Lg', 'L', 'B']:
+        size_chart.resolve_size(size_key)
+    assert size_chart.key_profile() == [('2XL', 3), ('M', 2), ('L', 2)]
+    assert size_chart.key_profiling
+    assert not SizeChart().key_profiling
+
+def test_warm():
+    size_chart = SizeChart()
+    size_chart.enable_key_profiling()
+    assert size_chart.warm(['2XS', ('4XL', 10), 'B', 12, '1XL']) == 4
+    assert all(key in size_chart._warmed_sizes for key in ['2XS', '4XL', 12])
+    assert size_chart.get_or_create_size('4XL') is size_chart._warmed_sizes['4XL']
+    assert size_chart.key_profile() == [('4XL', 1)]       #Warming is not profiled
+
+    size_chart = SizeChart()
+    assert size_chart.warm(['12', '3XL']) == 2
+    assert len(size_chart) == len(SIZE_CHART_DEFAULTS)     #The Size Chart is unchanged
+    assert not size_chart._dynamic_size_cache
+    assert size_chart.generate_lengthed_list(5) == ['XS', 'S', 'M', 'L', 'XL']
+    assert size_chart.resolve_size('12') is size_chart._warmed_sizes['12']
+
+def test_count_keys():
+    size_chart = SizeChart()
+    size_chart.count_keys(['M', 'M'])
+    assert size_chart.key_profile() == []
+
+    size_chart.enable_key_profiling()
+    size_chart.set_unknown_key_policy('skip')
+    size_chart.resolve_size('M')
+    size_chart.count_keys(iter(['M', '1XL', 'M', 'B', '3XL']), ['M'])
+    assert size_chart.key_profile() == [('M', 2), ('XL', 1), ('3XL', 1)]
+
+
+def kids_segment_charts():
+    return [SizeChart({'P': Size('P', 0, 'Preemie'), 'NB': Size('NB', 1, 'Newborn')}, {}),
+            SizeChart({'M': Size('M', 0, 'mo.')}, {'M': DynOp('M', 1, 1, 24)}),
+            SizeChart({'T': Size('T', 0, 'T')}, {'T': DynOp('T', 1, 1, 5)}),
+            SizeChart.from_simple_dict({'4': 4, '5': 5, '6': 6, '7': 7}, {})]
+
+def test_compose():
+    size_chart = SizeChart.compose(kids_segment_charts())
+    assert size_chart.dyn_ops == {}
+    assert len(size_chart) == 2 + 24 + 5 + 4
+    assert size_chart.generate_range_list('P', '7')[:4] == ['P', 'NB', 'M', '2M']
+    assert size_chart.generate_range_list('22M', '5') == ['22M', '23M', '24M', 'T', '2T', '3T',
+                                                          '4T', '5T', '4', '5']
+    assert size_chart.get_or_create_size('3T').verbose == '3T'
+    assert size_chart.get_or_create_size('3T').sort_value == \
+           size_chart.get_or_create_size('24M').sort_value + 3
+    assert sorted(['3T', '6M', 'NB', '5', 'P'], key=size_chart.get_or_create_size) == \
+           ['P', 'NB', '6M', '3T', '5']
+
+    with pytest.raises(ValueError) as ee:
+        size_chart.get_or_create_size('25M')
+    assert str(ee.value).find('Base size not') > -1
+
+def test_compose_interior_dyn_ops():
+    kids_chart = baby_toddler_kids_size_chart_factory()
+    size_chart = SizeChart.compose([kids_chart])
+    assert size_chart.dyn_ops == {}
+    assert len(size_chart) == len(SIZE_CHART_BABY_TODDLER_KID_SIZES) + 49 + 19
+    assert size_chart.generate_range_list('P', '4') == kids_chart.generate_range_list('P', '4')
+    assert size_chart.get_or_create_size('50M').next_size_key == 'T'
+
+    for options in ({'verbose': True, 'dynamic_size_verbose': True},
+                    {'x_size_formatter': to_x_notation}):
+        kids_chart.set_formatting_options(options)
+        size_chart.set_formatting_options(options)
+        assert size_chart.generate_range_list('NB', '3T') == \
+               kids_chart.generate_range_list('NB', '3T')
+
+    size_chart = SizeChart.compose([limited_size_chart(), kids_segment_charts()[0]])
+    assert size_chart.get_or_create_size('2XL').is_dynamic_size
+    size_chart.set_formatting_options({'x_size_formatter': to_x_notation})
+    assert size_chart.generate_range_list('L', 'P') == ['L', 'XL', 'XXL', 'XXXL', 'P']
+
+def test_compose_dynamic_ends():
+    size_chart = SizeChart.compose([limited_size_chart(), kids_segment_charts()[0],
+                                    SizeChart({'T': Size('T', 0)}, {'T': DynOp('T', 1, 1)})],
+                                   offsets=[0, 300, 400])
+    assert sorted(size_chart.dyn_ops) == ['T', 'XS']
+    assert size_chart.generate_range_list('XS', '2T')[-6:] == ['2XL', '3XL', 'P', 'NB', 'T', '2T']
+    assert size_chart.get_or_create_size('NB').sort_value == 301
+    assert size_chart.get_or_create_size('100T').sort_value == 499
+
+@pytest.mark.parametrize("size_charts, offsets, expected_error",
+    [([], None, 'at least one Size Chart'),
+     ([SizeChart()], [0, 1], 'one offset per Size Chart'),
+     ([SizeChart(), kids_segment_charts()[0]], None, 'must have a max_prefix: XL'),
+     ([limited_size_chart(), limited_size_chart()], None, 'in more than one Size Chart'),
+     (kids_segment_charts()[:2], [0, 1], 'overlap when composed: M'),
+     ([SizeChart({'M': Size('M', 0), 'T': Size('T', 10)}, {'M': DynOp('M', 1, 1, 12)})], None,
+      'overlap the next size: 11M'),
+     ([SizeChart.from_simple_dict({'A': 0, 'B': 1, 'C': 1}, {})], None, 'Sort values collide'),
+    ],)
+def test_compose_exception(size_charts, offsets, expected_error):
+    with pytest.raises(ValueError) as ee:
+        SizeChart.compose(size_charts, offsets)
+    assert str(ee.value).find(expected_error) > -1
+
+
+@pytest.mark.parametrize("size_chart, value, expected_keys",
+    [(SizeChart, 50, ('M', 'M', 'M')),
+     (SizeChart, 60, ('M', 'M', 'L')),
+     (SizeChart, 62.5, ('L', 'M', 'L')),             #Ties go to the larger size
+     (SizeChart, 70, ('L', 'M', 'L')),
+     (SizeChart, 120, ('3XL', '3XL', '3XL')),
+     (SizeChart, 124, ('3XL', '3XL', '4XL')),
+     (SizeChart, -1000, ('101XS', '101XS', '101XS')),
+     (SizeChart, -1003, ('101XS', '102XS', '101XS')),
+     (limited_size_chart, -5, ('XS', None, 'XS')),
+     (limited_size_chart, 1000, ('3XL', '3XL', None)),
+     (limited_size_chart, 115, ('3XL', '2XL', '3XL')),
+     (custom_size_chart_factory, 0, ('A', '2A', 'A')),
+     (custom_size_chart_factory, 9, ('2C', '2C', '3C')),
+     (baby_toddler_kids_size_chart_factory, 61.2, ('2T', '2T', '3T')),
+     (baby_toddler_kids_size_chart_factory, 59.5, ('T', '50M', 'T')),
+    ],)
+def test_key_for_value(size_chart, value, expected_keys):
+    size_chart = size_chart()
+    assert tuple(size_chart.key_for_value(value, mode)
+                 for mode in ('nearest', 'floor', 'ceil')) == expected_keys
+    assert size_chart.keys_for_values([value, value], 'floor') == [expected_keys[1]] * 2
+
+def test_key_for_value_no_dyn_ops():
+    size_chart = SizeChart.from_simple_dict({'A': 0, 'B': 10, 'C': 20}, {})
+    assert size_chart.keys_for_values([-5, 4, 6, 25]) == ['A', 'A', 'B', 'C']
+    assert size_chart.keys_for_values([-5, 25], 'floor') == [None, 'C']
+    assert size_chart.keys_for_values([-5, 25], 'ceil') == ['A', None]
+
+    for size_key in ['A', 'B', 'C']:
+        assert size_chart.key_for_value(size_chart.get_or_create_size(size_key).sort_value) \
+               == size_key
+
+@pytest.mark.parametrize("value, mode, expected_error",
+    [(50, 'round', 'Mode must be one of'),
+     ('M', 'nearest', 'must be a finite number'),
+     (float('nan'), 'floor', 'must be a finite number'),
+     (float('inf'), 'ceil', 'must be a finite number'),
+    ],)
+def test_key_for_value_exception(value, mode, expected_error):
+    with pytest.raises(ValueError) as ee:
+        SizeChart().key_for_value(value, mode)
+    assert str(ee.value).find(expected_error) > -1
+
+
+@pytest.mark.parametrize("size_chart", [SizeChart, custom_size_chart_factory, limited_size_chart])
+def test_generate_ranges(size_chart):
+    size_chart = size_chart()
+    keys = [size_chart.key_at_rank(rank) for rank in range(-1 if size_chart._min_rank is None
+                                                            else size_chart._min_rank, 6)]
+    pairs = [(start_key, end_key) for start_key in keys for end_key in keys
+             if size_chart.rank_of(start_key) <= size_chart.rank_of(end_key)]
+
+    ranges = size_chart.generate_ranges(pairs + pairs[:3])
+    assert ranges == [tuple(size_chart.generate_range_list(*pair)) for pair in pairs + pairs[:3]]
+    assert size_chart.generate_ranges([pairs[-1]])[0] is ranges[len(pairs) - 1]    #Memoized
+    assert size_chart.generate_ranges([]) == []
+
+def test_generate_ranges_formatting():
+    size_chart = SizeChart()
+    assert size_chart.generate_ranges([('XL', '3XL'), ['M', 'XL']]) == \
+           [('XL', '2XL', '3XL'), ('M', 'L', 'XL')]
+
+    size_chart.set_formatting_options({'x_size_formatter': to_x_notation})
+    assert size_chart.generate_ranges([('XL', '3XL')]) == [('XL', 'XXL', 'XXXL')]
+
+def test_generate_ranges_disjoint():
+    size_chart = SizeChart()
+    ranges = size_chart.generate_ranges([('S', 'XL'), ('200000XL', '200002XL'), ('M', '2XL')])
+    assert ranges == [('S', 'M', 'L', 'XL'), ('200000XL', '200001XL', '200002XL'),
+                      ('M', 'L', 'XL', '2XL')]
+    assert len(size_chart._formatted_sizes) == 8            #Only the sizes of the ranges
+
+def test_generate_ranges_memo_bounds():
+    size_chart = SizeChart()
+    size_chart.generate_range_list('XL', str(FORMATTED_SIZES_MAX + 10) + 'XL')
+    assert len(size_chart._formatted_sizes) == FORMATTED_SIZES_MAX
+
+    pairs = [('XL', str(prefix) + 'XL') for prefix in range(2, GENERATED_RANGES_MAX + 12)]
+    assert size_chart.generate_ranges(pairs)[-1][-1] == str(GENERATED_RANGES_MAX + 11) + 'XL'
+    assert len(size_chart._generated_ranges) == GENERATED_RANGES_MAX
+    assert ('XL', '2XL') not in size_chart._generated_ranges            #Oldest evicted
+
+@pytest.mark.parametrize("pairs, expected_error",
+    [([('S', 'L'), ('L', 'S')], 'End of range is not reachable'),
+     ([('S', '12')], 'End of range is not reachable'),
+     ([('S', 'B')], 'Base size not'),
+    ],)
+def test_generate_ranges_exception(pairs, expected_error):
+    with pytest.raises(ValueError) as ee:
+        SizeChart().generate_ranges(pairs)
+    assert str(ee.value).find(expected_error) > -1
+
 
 if __name__ == "__main__":
     pytest.main(['-q', '-s', '--no-cov', 'tests/test_sizechart.py'])
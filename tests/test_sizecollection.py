@@ -0,0 +1,83 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import SizeChart, SortedSizeCollection
+from sizechart_samples import SIZE_CHART_WOMENS_TOPS
+
+def test_class():
+    collection = SortedSizeCollection()
+    assert id(collection) > 0
+    assert len(collection) == 0
+    assert isinstance(collection.size_chart, SizeChart)
+
+@pytest.mark.parametrize("sizes, expected_list",
+    [([], []),
+     (['M'], ['M']),
+     (['XL', 'S', 'M', 'XS'], ['XS', 'S', 'M', 'XL']),
+     (['2XL', '1XL', 'M', '3XS', 'M', 'L'], ['3XS', 'M', 'M', 'L', 'XL', '2XL']),
+    ],)
+def test_add(sizes, expected_list):
+    collection = SortedSizeCollection(iterable=sizes)
+    assert list(collection) == expected_list
+    assert list(reversed(collection)) == expected_list[::-1]
+    assert len(collection) == len(expected_list)
+
+    collection.add('4XL')
+    assert collection[-1] == '4XL'
+
+def test_remove_discard():
+    collection = SortedSizeCollection(iterable=['S', 'M', 'M', 'XL', '2XL'])
+
+    collection.remove('M')
+    assert list(collection) == ['S', 'M', 'XL', '2XL']
+    collection.remove('1XL')
+    assert list(collection) == ['S', 'M', '2XL']
+
+    collection.discard('L')
+    collection.discard('2XL')
+    assert list(collection) == ['S', 'M']
+
+    with pytest.raises(ValueError) as ee:
+        collection.remove('L')
+    assert str(ee.value).find('Size not in collection') > -1
+
+    with pytest.raises(ValueError) as ee:
+        collection.add('B')
+    assert str(ee.value).find('Base size not') > -1
+
+def test_count_contains():
+    collection = SortedSizeCollection(iterable=['S', 'M', 'M', 'XL', '2XL', 'M'])
+    assert collection.count('M') == 3
+    assert collection.count('1XL') == 1
+    assert collection.count('3XL') == 0
+    assert 'S' in collection
+    assert 'L' not in collection
+    assert collection.counts() == [('S', 1), ('M', 3), ('XL', 1), ('2XL', 1)]
+
+@pytest.mark.parametrize("start_key, end_key, expected_list",
+    [(None, None, ['2XS', 'S', 'M', 'M', 'XL', '3XL']),
+     ('S', 'M', ['S', 'M', 'M']),
+     ('XS', 'L', ['S', 'M', 'M']),
+     ('M', None, ['M', 'M', 'XL', '3XL']),
+     (None, '2XL', ['2XS', 'S', 'M', 'M', 'XL']),
+     ('4XL', None, []),
+    ],)
+def test_irange(start_key, end_key, expected_list):
+    collection = SortedSizeCollection(iterable=['M', 'S', '3XL', 'M', '2XS', 'XL'])
+    assert list(collection.irange(start_key, end_key)) == expected_list
+
+def test_custom_chart():
+    size_chart = SizeChart.from_simple_dict(SIZE_CHART_WOMENS_TOPS)
+    collection = SortedSizeCollection(size_chart, ['XL', '2XS', 'M'])
+    assert list(collection) == ['2XS', 'M', 'XL']
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_sizecollection.py'])
@@ -0,0 +1,79 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import SizeChart, SizeColumn
+from sizechart_samples import SIZE_CHART_WOMENS_TOPS
+
+SIZES = ['L', '3XL', 'S', '1XL', 'M', '2XS', 'M', 'XS']
+
+def test_class():
+    column = SizeColumn()
+    assert id(column) > 0
+    assert len(column) == 0
+    assert isinstance(column.size_chart, SizeChart)
+    assert column.ranks.typecode == 'h'
+
+def test_append_extend():
+    column = SizeColumn(iterable=SIZES)
+    assert len(column) == len(SIZES)
+    assert column.ranks.itemsize == 2
+    assert column.to_keys() == ['L', '3XL', 'S', 'XL', 'M', '2XS', 'M', 'XS']
+    assert list(column) == column.to_keys()
+    assert column[1] == '3XL'
+    assert column[-1] == 'XS'
+    assert column[2:4].to_keys() == ['S', 'XL']
+
+    column.append('4XS')
+    column.extend(iter(['M', '10XL']))
+    assert column.to_keys()[-3:] == ['4XS', 'M', '10XL']
+
+    with pytest.raises(ValueError) as ee:
+        column.extend(['S', 'B'])
+    assert str(ee.value).find('Base size not') > -1
+    assert len(column) == len(SIZES) + 3        #Nothing appended
+
+    with pytest.raises(ValueError) as ee:
+        column.append('40000XL')
+    assert str(ee.value).find('does not fit in the column') > -1
+
+@pytest.mark.parametrize("reverse, expected_sizes",
+    [(False, ['2XS', 'XS', 'S', 'M', 'M', 'L', 'XL', '3XL']),
+     (True, ['3XL', 'XL', 'L', 'M', 'M', 'S', 'XS', '2XS']),
+    ],)
+def test_sort_argsort(reverse, expected_sizes):
+    column = SizeColumn(iterable=SIZES)
+    indices = column.argsort(reverse=reverse)
+    assert [column[idx] for idx in indices] == expected_sizes
+    assert indices[3:5] == [4, 6]               #Stable
+
+    column.sort(reverse=reverse)
+    assert column.to_keys() == expected_sizes
+
+@pytest.mark.parametrize("start_key, end_key, expected_sizes",
+    [(None, None, ['L', '3XL', 'S', 'XL', 'M', '2XS', 'M', 'XS']),
+     ('S', 'L', ['L', 'S', 'M', 'M']),
+     ('1XL', None, ['3XL', 'XL']),
+     (None, 'XS', ['2XS', 'XS']),
+     ('4XL', None, []),
+    ],)
+def test_filter_range(start_key, end_key, expected_sizes):
+    column = SizeColumn(iterable=SIZES)
+    assert column.filter_range(start_key, end_key).to_keys() == expected_sizes
+
+def test_custom_chart():
+    size_chart = SizeChart.from_simple_dict(SIZE_CHART_WOMENS_TOPS)
+    column = SizeColumn(size_chart, ['XL', '2XS', 'M'])
+    column.sort()
+    assert repr(column) == "SizeColumn(['2XS', 'M', 'XL'])"
+    assert column.filter_range('M').size_chart is size_chart
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_sizecolumn.py'])
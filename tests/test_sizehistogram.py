@@ -0,0 +1,117 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pickle
+
+import pytest
+
+from sizesorter import SizeChart, SizeHistogram
+from sizechart_samples import (
+    SIZE_CHART_BABY_TODDLER_KID_SIZES,
+    DYNAMIC_OPS_BABY_TODDLER_KID_SIZES,
+)
+
+SIZES = ['M', 'L', '2XS', 'M', '3XL', 'S', 'M', '1XL', 'L', 'XL']
+
+def test_class():
+    histogram = SizeHistogram(SizeChart())
+    assert id(histogram) > 0
+    assert len(histogram) == 0
+    assert histogram.total == 0
+    assert histogram.items() == []
+
+def test_histogram():
+    histogram = SizeChart().histogram(SIZES)
+
+    assert histogram.items() == [('2XS', 1), ('S', 1), ('M', 3), ('L', 2), ('XL', 2), ('3XL', 1)]
+    assert list(histogram) == ['2XS', 'S', 'M', 'L', 'XL', '3XL']
+    assert len(histogram) == 6
+    assert histogram.total == len(SIZES)
+    assert histogram['M'] == 3
+    assert histogram['1XL'] == 2
+    assert histogram['XS'] == 0
+    assert histogram['10XL'] == 0
+    assert histogram.cumulative()[-1] == ('3XL', len(SIZES))
+    assert histogram.cumulative()[2] == ('M', 5)
+
+def test_histogram_weights():
+    histogram = SizeChart().histogram(['M', 'XL', 'M', '5XS'], weights=[2, 1.5, 3, 0])
+    assert histogram.items() == [('M', 5), ('XL', 1.5)]
+    assert histogram.total == 6.5
+
+    histogram.add('4XS', 2)
+    histogram.add('M')
+    assert histogram.items() == [('4XS', 2), ('M', 6), ('XL', 1.5)]
+
+def test_histogram_dynamic_sizes():
+    histogram = SizeChart().histogram(['S', '3000000XL', '2XS', '3000000XL'])
+    assert histogram.items() == [('2XS', 1), ('S', 1), ('3000000XL', 2)]
+    assert len(histogram._counts) == 5                      #Dense for the base sizes only
+    assert histogram['3000000XL'] == 2
+    assert histogram.percentile_size(100) == '3000000XL'
+
+    kids_chart = SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES, DYNAMIC_OPS_BABY_TODDLER_KID_SIZES)
+    histogram = kids_chart.histogram(['3T', '6M', 'NB', '6M', '4', '12M'])
+    assert histogram.items() == [('NB', 1), ('6M', 2), ('12M', 1), ('3T', 1), ('4', 1)]
+    assert histogram.percentile_size(50) == '6M'
+
+@pytest.mark.parametrize("q, expected_size",
+    [(0, '2XS'), (10, '2XS'), (20, 'S'), (50, 'M'), (51, 'L'), (70, 'L'), (90, 'XL'),
+     (91, '3XL'), (100, '3XL')],)
+def test_percentile_size(q, expected_size):
+    assert SizeChart().histogram(SIZES).percentile_size(q) == expected_size
+
+@pytest.mark.parametrize("sizes, q, expected_tpl",
+    [([], 50, (ValueError, 'Histogram is empty')),
+     (SIZES, -1, (ValueError, 'between 0 and 100')),
+     (SIZES, 101, (ValueError, 'between 0 and 100')),
+    ],)
+def test_percentile_size_exception(sizes, q, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        SizeChart().histogram(sizes).percentile_size(q)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+def test_merge():
+    size_chart = SizeChart()
+    shards = [SIZES[:3], SIZES[3:7], SIZES[7:], ['20XL'], []]
+    histograms = [size_chart.histogram(shard) for shard in shards]
+
+    merged = SizeHistogram(size_chart)
+    for histogram in histograms:
+        merged.merge(pickle.loads(pickle.dumps(histogram)))       #As if from another process
+
+    expected = size_chart.histogram(SIZES + ['20XL'])
+    assert merged.items() == expected.items()
+    assert (histograms[0] + histograms[1] + histograms[2] + histograms[3]).items() == \
+           expected.items()
+    assert histograms[0].items() == [('2XS', 1), ('M', 1), ('L', 1)]     #Not altered by +
+
+    with pytest.raises(ValueError) as ee:
+        merged.merge(SizeChart.from_simple_dict({'XS': 0, 'XL': 1}).histogram(['XL']))
+    assert str(ee.value).find('same Size Chart') > -1
+
+def test_histogram_exception():
+    with pytest.raises(ValueError) as ee:
+        SizeChart().histogram(['M', 'B'])
+    assert str(ee.value).find('Base size not') > -1
+
+    with pytest.raises(ValueError) as ee:
+        SizeChart().histogram(['M', '12'])
+    assert str(ee.value).find('has no rank') > -1
+
+    histogram = SizeChart().histogram(['M'])
+    for weights in ([1], [1, 2, 3, 4]):
+        with pytest.raises(ValueError) as ee:
+            histogram.update(['M', 'L', 'XL'], weights)
+        assert str(ee.value).find('Weights must be one per size') > -1
+    assert histogram.items() == [('M', 1)]                  #Nothing counted
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_sizehistogram.py'])
@@ -0,0 +1,118 @@
+###
+import os
+import sys
+parentdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parentdir not in sys.path:
+    sys.path.insert(0, parentdir)
+###
+
+import pytest
+
+from sizesorter import SizeChart, SizeIndex, build_size_index
+from sizesorter.sizeindex import iter_line_offsets
+from sizechart_samples import (
+    SIZE_CHART_BABY_TODDLER_KID_SIZES,
+    DYNAMIC_OPS_BABY_TODDLER_KID_SIZES,
+)
+
+CSV_INPUT = ('sku,size,color\n'
+             '1,XL,red\n'
+             '2,M,blue\n'
+             '3,2XS,red\n'
+             '\n'
+             '4,M,red\n'
+             '5,3XL,green\n'
+             '6,S,blue\n')
+
+def _build(tmp_path, content='', name='in.csv'):
+    data_path = str(tmp_path.joinpath(name))
+    with open(data_path, 'w', newline='') as out:
+        out.write(content)
+    index_path = str(tmp_path.joinpath(name + '.idx'))
+    count = build_size_index(iter_line_offsets(data_path, 'size'), SizeChart(), index_path)
+    return data_path, index_path, count
+
+def test_iter_line_offsets(tmp_path):
+    data_path, _, count = _build(tmp_path, CSV_INPUT)
+    assert count == 6
+
+    offsets = list(iter_line_offsets(data_path, 'size'))
+    assert [size_key for size_key, _ in offsets] == ['XL', 'M', '2XS', 'M', '3XL', 'S']
+    assert offsets[0][1] == len('sku,size,color\n')
+
+    data_path, _, count = _build(tmp_path, '{"size": "L"}\n{"size": "XS", "sku": 2}\n',
+                                 'in.jsonl')
+    assert list(iter_line_offsets(data_path, 'size')) == [('L', 0), ('XS', 14)]
+
+@pytest.mark.parametrize("start_key, end_key, expected_skus",
+    [(None, None, ['3', '6', '2', '4', '1', '5']),
+     ('S', '2XL', ['6', '2', '4', '1']),
+     ('M', 'M', ['2', '4']),
+     ('XS', 'L', ['6', '2', '4']),
+     ('5XS', '3XS', []),
+     ('4XL', None, []),
+     (None, '1XL', ['3', '6', '2', '4', '1']),
+     ('L', 'S', []),
+    ],)
+def test_records_between(tmp_path, start_key, end_key, expected_skus):
+    data_path, index_path, _ = _build(tmp_path, CSV_INPUT)
+
+    with SizeIndex(index_path, SizeChart()) as size_index:
+        assert len(size_index) == 6
+        assert size_index.count_between(start_key, end_key) == len(expected_skus)
+        assert len(size_index.offsets_between(start_key, end_key)) == len(expected_skus)
+        assert [line.split(',')[0] for line in
+                size_index.records_between(data_path, start_key, end_key)] == expected_skus
+
+def test_empty_index(tmp_path):
+    _, index_path, count = _build(tmp_path, 'sku,size\n')
+    assert count == 0
+    with SizeIndex(index_path, SizeChart()) as size_index:
+        assert len(size_index) == 0
+        assert list(size_index.offsets_between('S', 'L')) == []
+
+def test_sparse_index(tmp_path):
+    data_path, index_path, _ = _build(tmp_path, 'sku,size\n1,1000000XL\n2,S\n3,2XS\n')
+    assert os.path.getsize(index_path) < 256                #Only the ranks present are stored
+
+    with SizeIndex(index_path, SizeChart()) as size_index:
+        assert size_index.count_between('XS', '999999XL') == 1
+        assert size_index.count_between('1000000XL', '1000001XL') == 1
+        assert [line.split(',')[0] for line in
+                size_index.records_between(data_path, 'XL', None)] == ['1']
+
+def test_interior_dyn_op_index(tmp_path):
+    kids_chart = SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES, DYNAMIC_OPS_BABY_TODDLER_KID_SIZES)
+    data_path = str(tmp_path.joinpath('kids.csv'))
+    with open(data_path, 'w', newline='') as out:
+        out.write('sku,size\n1,3T\n2,6M\n3,NB\n4,12M\n5,4\n')
+    index_path = data_path + '.idx'
+    assert build_size_index(iter_line_offsets(data_path, 'size'), kids_chart, index_path) == 5
+
+    with SizeIndex(index_path, kids_chart) as size_index:
+        assert [line.split(',')[0] for line in
+                size_index.records_between(data_path, '2M', '2T')] == ['2', '4']
+        assert size_index.count_between('T', None) == 2
+
+def test_size_index_exception(tmp_path):
+    with pytest.raises(ValueError) as ee:
+        _build(tmp_path, CSV_INPUT + '7,B,red\n')
+    assert str(ee.value).find('Base size not') > -1
+
+    with pytest.raises(ValueError) as ee:
+        _build(tmp_path, 'sku,color\n1,red\n')
+    assert str(ee.value).find('Size column not in CSV header') > -1
+
+    data_path, index_path, _ = _build(tmp_path, CSV_INPUT)
+    with pytest.raises(ValueError) as ee:
+        SizeIndex(data_path, SizeChart())
+    assert str(ee.value).find('Not a size index file') > -1
+
+    with SizeIndex(index_path, SizeChart()) as size_index:
+        with pytest.raises(ValueError) as ee:
+            size_index.records_between(data_path, 'B')
+        assert str(ee.value).find('Base size not') > -1
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '-s', '--no-cov', 'tests/test_sizeindex.py'])
@@ -8,10 +8,16 @@ if parentdir not in sys.path:
 
 import pytest
 
-from sizesorter import SizeSorter
+from sizesorter import SizeSorter, SizeChart
+from sizesorter.sizesorter import KEY_BATCH_SIZE
+from sizechart_samples import (
+    SIZE_CHART_BABY_TODDLER_KID_SIZES,
+    DYNAMIC_OPS_BABY_TODDLER_KID_SIZES,
+)
 
 def test_class():
     assert id(SizeSorter()) > 0
+    assert isinstance(SizeSorter().size_chart, SizeChart)
 
    
 def test_numeric_to_x():
@@ -40,6 +46,134 @@ def test_x_to_numeric():
     assert SizeSorter._x_to_numeric('XS') == 'XS'
     assert SizeSorter._x_to_numeric('XXXXXS') == '5XS'
 
+RECORDS = [
+    {'category': 'tops', 'brand': 'b', 'size': 'XL', 'color': 'red', 'chart': 'adult'},
+    {'category': 'tops', 'brand': 'a', 'size': 'M', 'color': 'red', 'chart': 'adult'},
+    {'category': 'kids', 'brand': 'a', 'size': '5', 'color': 'blue', 'chart': 'kids'},
+    {'category': 'tops', 'brand': 'a', 'size': '2XS', 'color': 'red', 'chart': 'adult'},
+    {'category': 'kids', 'brand': 'a', 'size': 'NB', 'color': 'blue', 'chart': 'kids'},
+    {'category': 'tops', 'brand': 'a', 'size': 'M', 'color': 'blue', 'chart': 'adult'},
+    {'category': 'tops', 'brand': 'a', 'size': 'M', 'color': 'blue', 'chart': 'adult', 'id': 2},
+]
+
+@pytest.mark.parametrize("keys, reverse, expected_sizes",
+    [(None, False, ['2XS', 'NB', 'M', 'M', 'M', '5', 'XL']),
+     (['category', 'size'], False, ['NB', '5', '2XS', 'M', 'M', 'M', 'XL']),
+     (['category', 'brand', 'size', 'color'], False, ['NB', '5', '2XS', 'M', 'M', 'M', 'XL']),
+     (['size'], True, ['XL', '5', 'M', 'M', 'M', 'NB', '2XS']),
+    ],)
+def test_sort_records(keys, reverse, expected_sizes):
+    kids_chart = SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES, DYNAMIC_OPS_BABY_TODDLER_KID_SIZES)
+    sorter = SizeSorter()
+
+    sorted_records = sorter.sort_records(RECORDS, keys=keys, size_field='size',
+                                         chart_field='chart', size_charts={'kids': kids_chart},
+                                         reverse=reverse)
+    assert [record['size'] for record in sorted_records] == expected_sizes
+
+def test_sort_records_stable():
+    sorted_records = SizeSorter().sort_records(RECORDS[:2] + RECORDS[3:4] + RECORDS[5:],
+                                               keys=['size'])
+    assert [record['color'] for record in sorted_records if record['size'] == 'M'] == \
+           ['red', 'blue', 'blue']
+    assert sorted_records[-1].get('id') is None
+    assert sorted_records[-2]['id'] == 2
+
+@pytest.mark.parametrize("keys, size_field, records, expected_tpl",
+    [(['category'], 'size', RECORDS, (ValueError, 'size_field must be one of')),
+     (['size'], 'size', [{'size': 'M'}, {'size': 'B'}], (ValueError, 'Base size not')),
+    ],)
+def test_sort_records_exception(keys, size_field, records, expected_tpl):
+    with pytest.raises(expected_tpl[0]) as ee:
+        SizeSorter().sort_records(records, keys=keys, size_field=size_field)
+
+    assert str(ee.value).find(expected_tpl[1]) > -1
+
+SIZES = ['L', '3XL', 'S', 'M', '2XS', 'XL', 'M', 'XS', '2XL']
+
+@pytest.mark.parametrize("k, expected_smallest, expected_largest",
+    [(0, [], []),
+     (1, ['2XS'], ['3XL']),
+     (3, ['2XS', 'XS', 'S'], ['3XL', '2XL', 'XL']),
+     (5, ['2XS', 'XS', 'S', 'M', 'M'], ['3XL', '2XL', 'XL', 'L', 'M']),
+     (20, ['2XS', 'XS', 'S', 'M', 'M', 'L', 'XL', '2XL', '3XL'],
+          ['3XL', '2XL', 'XL', 'L', 'M', 'M', 'S', 'XS', '2XS']),
+    ],)
+def test_nsmallest_nlargest(k, expected_smallest, expected_largest):
+    sorter = SizeSorter()
+    assert sorter.nsmallest(k, SIZES) == expected_smallest
+    assert sorter.nlargest(k, iter(SIZES)) == expected_largest
+
+@pytest.mark.parametrize("reverse, expected_sizes",
+    [(False, ['2XS', 'XS', 'S', 'M', 'L', '1XL', 'XL', '2XL', '3XL']),
+     (True, ['3XL', '2XL', '1XL', 'XL', 'L', 'M', 'S', 'XS', '2XS']),
+    ],)
+def test_sort(reverse, expected_sizes):
+    sizes = ['M', 'L', '2XS', '1XL', 'XL', '3XL', 'S', 'XS', '2XL']
+    assert SizeSorter().sort(sizes, reverse=reverse) == expected_sizes     #Stable
+    assert SizeSorter().sort(iter(sizes), reverse=reverse) == expected_sizes
+    assert SizeSorter().sort([]) == []
+
+def test_min_max_size():
+    sorter = SizeSorter()
+    assert sorter.min_size(SIZES) == '2XS'
+    assert sorter.max_size(iter(SIZES)) == '3XL'
+    assert sorter.min_size(['M']) == sorter.max_size(['M']) == 'M'
+
+    with pytest.raises(ValueError):
+        sorter.min_size([])
+    with pytest.raises(ValueError) as ee:
+        sorter.max_size(['M', 'B'])
+    assert str(ee.value).find('Base size not') > -1
+
+def test_key_profiling(monkeypatch):
+    size_chart = SizeChart()
+    size_chart.enable_key_profiling()
+    sorter = SizeSorter(size_chart)
+    assert sorter.nsmallest(2, ['M', 'M', 'L', '2XL', '2XL']) == ['M', 'M']
+    assert size_chart.key_profile() == [('M', 2), ('2XL', 2), ('L', 1)]
+
+    sorter.sort_records([{'size': 'L'}, {'size': 'L'}])
+    assert size_chart.key_profile(1) == [('L', 3)]
+
+    #Memoized while profiling, memo hits are counted per batch
+    size_chart, resolved = SizeChart(), []
+    size_chart.enable_key_profiling()
+    resolve_size = size_chart.resolve_size
+    monkeypatch.setattr(size_chart, 'resolve_size',
+                        lambda size_key: resolved.append(size_key) or resolve_size(size_key))
+    sizes = ['S', '1XL', 'XL', 'S'] * (KEY_BATCH_SIZE // 2)
+    assert SizeSorter(size_chart).max_size(sizes) == '1XL'
+    assert resolved == ['S', '1XL', 'XL']
+    assert dict(size_chart.key_profile()) == {'S': KEY_BATCH_SIZE, 'XL': KEY_BATCH_SIZE}
+
+    kids_chart = SizeChart(SIZE_CHART_BABY_TODDLER_KID_SIZES, DYNAMIC_OPS_BABY_TODDLER_KID_SIZES)
+    kids_chart.enable_key_profiling()
+    SizeSorter(size_chart).sort_records(RECORDS, chart_field='chart',
+                                        size_charts={'kids': kids_chart})
+    assert kids_chart.key_profile() == [('5', 1), ('NB', 1)]
+    assert dict(size_chart.key_profile())['M'] == 3
+
+
+@pytest.mark.parametrize("policy, expected_sizes, expected_min, expected_max",
+    [('skip', ['S', 'M', 'XL'], 'S', 'XL'),
+     ('first', ['B', 'Q', 'S', 'M', 'XL'], 'B', 'XL'),
+     ('last', ['S', 'M', 'XL', 'B', 'Q'], 'S', 'B'),
+    ],)
+def test_unknown_key_policy(policy, expected_sizes, expected_min, expected_max):
+    size_chart = SizeChart()
+    size_chart.set_unknown_key_policy(policy)
+    sorter = SizeSorter(size_chart)
+    sizes = ['XL', 'B', 'M', 'Q', 'S']
+
+    assert [record['size'] for record in
+            sorter.sort_records([{'size': size} for size in sizes])] == expected_sizes
+    assert sorter.sort(sizes) == [record['size'] for record in
+                                  sorter.sort_records([{'size': size} for size in sizes])]
+    assert sorter.nsmallest(1, sizes) == [expected_min]
+    assert sorter.nlargest(1, sizes) == [expected_max]
+    assert sorter.min_size(sizes) == expected_min
+    assert sorter.max_size(sizes) == expected_max
 
 if __name__ == "__main__":
     pytest.main(['-q', '-s', '--no-cov', 'tests/test_sizesorter'])